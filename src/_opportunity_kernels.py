@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Opportunity Scoring Kernels
+
+This module provides a compiled kernel scoring many yield opportunities at
+once. It needs Numba; without it `score_kernel` is None and callers use their
+NumPy implementation instead.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+import numpy as np
+
+
+def _score(apy, tvl, is_known, suspicious_apy, min_tvl, high_tvl):
+    """Compute risk and opportunity scores with the rules of `OpportunityDetector`.
+
+    Args:
+        apy: float64 array of APYs (percentage)
+        tvl: float64 array of TVLs (USD)
+        is_known: bool array, True for established protocols
+        suspicious_apy: APY above which risk grows
+        min_tvl: TVL below which risk grows
+        high_tvl: TVL from which risk is reduced the most
+
+    Returns:
+        Tuple of float64 arrays (risk score 0-100, opportunity score 0-100)
+    """
+    n = apy.shape[0]
+    risk = np.empty(n)
+    opportunity = np.empty(n)
+
+    for i in range(n):
+        score = 50.0
+
+        # TVL factors (higher TVL = lower risk)
+        if tvl[i] >= high_tvl:
+            score -= 20
+        elif tvl[i] >= min_tvl * 5:
+            score -= 10
+        elif tvl[i] < min_tvl:
+            score += 20
+
+        # APY factors (extremely high APY may indicate higher risk)
+        if apy[i] > suspicious_apy:
+            score += min(40.0, (apy[i] - suspicious_apy) / 10)
+
+        if is_known[i]:
+            score -= 10
+
+        score = max(0.0, min(100.0, score))
+        risk[i] = score
+
+        # 60% APY (capped at 100%), 40% inverted risk
+        opportunity[i] = 0.6 * min(100.0, apy[i]) + 0.4 * (100 - score)
+
+    return risk, opportunity
+
+
+# Compiled eagerly for the one signature callers use; the disk cache keeps
+# later imports from recompiling
+score_kernel = (
+    njit("Tuple((f8[:], f8[:]))(f8[:], f8[:], b1[:], f8, f8, f8)", cache=True)(_score)
+    if NUMBA_AVAILABLE else None
+)
@@ -7,17 +7,29 @@ This module provides tools for analyzing cryptocurrency data, including:
 - Portfolio analysis
 - LLM-powered insights and reports
 - Data visualization and charting
+
+The classes are imported on first access (PEP 562), so using the token
+tracker does not pull in Matplotlib and Seaborn for the visualizer.
 """
 
-try:
-    # Standard imports when installed as a package
-    from hiramabiff.analysis.token_tracker import TokenTracker
-    from hiramabiff.analysis.llm_analyzer import LLMAnalyzer
-    from hiramabiff.analysis.visualizer import TokenVisualizer
-except ImportError:
-    # Relative imports for direct module access
-    from .token_tracker import TokenTracker
-    from .llm_analyzer import LLMAnalyzer
-    from .visualizer import TokenVisualizer
-
-__all__ = ["TokenTracker", "LLMAnalyzer", "TokenVisualizer"] 
\ No newline at end of file
+import importlib
+
+# Maps each exported name to the submodule that defines it
+_LAZY_IMPORTS = {
+    "TokenTracker": ".token_tracker",
+    "LLMAnalyzer": ".llm_analyzer",
+    "TokenVisualizer": ".visualizer",
+}
+
+__all__ = ["TokenTracker", "LLMAnalyzer", "TokenVisualizer"]
+
+
+def __getattr__(name: str):
+    """Import lazily loaded classes on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    obj = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = obj
+    return obj
+
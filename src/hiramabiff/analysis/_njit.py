@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+"""
+Numba JIT Compatibility Module
+
+This module exposes `njit` and `prange` from Numba when it is installed.
+Without Numba, `njit` becomes a no-op decorator and `prange` falls back to
+`range`, so the same kernels run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for `numba.njit` supporting both decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
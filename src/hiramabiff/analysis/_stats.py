@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+Token Statistics Kernels
+
+This module provides compiled kernels for computing price statistics over
+many tokens at once.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+try:
+    from hiramabiff.analysis._njit import njit, prange, NUMBA_AVAILABLE
+except ImportError:
+    # Loaded by path without the package (see `cli._load_from_path`), so load
+    # the Numba shim from this file's directory instead
+    import importlib.util
+    
+    _spec = importlib.util.spec_from_file_location(
+        "hiramabiff.analysis._njit", os.path.join(os.path.dirname(os.path.abspath(__file__)), "_njit.py")
+    )
+    _njit = sys.modules[_spec.name] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_njit)
+    njit, prange, NUMBA_AVAILABLE = _njit.njit, _njit.prange, _njit.NUMBA_AVAILABLE
+
+# Column layout of the array returned by `portfolio_stats`
+MEAN, MIN, MAX, STD, VOLATILITY, CHANGE_7D = range(6)
+
+
+@njit(parallel=True, cache=True)
+def portfolio_stats(prices, lengths):
+    """Compute price statistics for each row of a right-aligned price matrix.
+
+    Args:
+        prices: float64 array of shape (N tokens, D samples). Row `i` holds its
+            `lengths[i]` samples in the last columns; leading columns are padding.
+        lengths: int64 array of shape (N,) with the number of valid samples per row
+
+    Returns:
+        float64 array of shape (N, 6) with columns mean, min, max, sample
+        standard deviation, volatility (std / mean) and the percent change
+        between the 7th-from-last and the last sample (0 if fewer than 7).
+    """
+    n_tokens, n_samples = prices.shape
+    out = np.empty((n_tokens, 6))
+
+    for i in prange(n_tokens):
+        count = lengths[i]
+        start = n_samples - count
+
+        # Single pass: Welford's update for mean/variance plus min/max
+        mean = 0.0
+        m2 = 0.0
+        lo = np.inf
+        hi = -np.inf
+        for j in range(start, n_samples):
+            x = prices[i, j]
+            k = j - start + 1
+            delta = x - mean
+            mean += delta / k
+            m2 += delta * (x - mean)
+            if x < lo:
+                lo = x
+            if x > hi:
+                hi = x
+
+        std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+
+        out[i, MEAN] = mean if count > 0 else np.nan
+        out[i, MIN] = lo if count > 0 else np.nan
+        out[i, MAX] = hi if count > 0 else np.nan
+        out[i, STD] = std
+        out[i, VOLATILITY] = std / mean if count > 0 else np.nan
+
+        if count >= 7:
+            week_ago = prices[i, n_samples - 7]
+            out[i, CHANGE_7D] = (prices[i, n_samples - 1] - week_ago) / week_ago * 100
+        else:
+            out[i, CHANGE_7D] = 0.0
+
+    return out
+
+
+def stack_right_aligned(series):
+    """Stack 1-D price arrays of varying length into a right-aligned matrix.
+
+    Args:
+        series: Sequence of 1-D float arrays
+
+    Returns:
+        Tuple of (float64 matrix padded with NaN on the left, int64 lengths)
+    """
+    lengths = np.fromiter((len(s) for s in series), dtype=np.int64, count=len(series))
+    width = int(lengths.max()) if len(series) else 0
+    matrix = np.full((len(series), width), np.nan)
+    for row, values in enumerate(series):
+        if len(values):
+            matrix[row, width - len(values):] = values
+    return matrix, lengths
+
+
+@njit(cache=True)
+def price_chart_stats(prices, windows):
+    """Compute trailing moving averages and the extreme samples in one pass.
+
+    Args:
+        prices: 1-D float32 or float64 array of samples in time order
+        windows: int64 array of moving-average window lengths
+
+    Returns:
+        Tuple of (float64 array of shape (len(windows), len(prices)) holding each
+        moving average, NaN until its window is full or while it contains a NaN;
+        index of the minimum; index of the maximum). NaN samples are ignored for
+        the extremes, which are -1 if every sample is NaN.
+    """
+    n = prices.shape[0]
+    n_windows = windows.shape[0]
+    averages = np.full((n_windows, n), np.nan)
+    sums = np.zeros(n_windows)
+    nan_counts = np.zeros(n_windows, dtype=np.int64)
+    imin = -1
+    imax = -1
+
+    for i in range(n):
+        x = prices[i]
+        is_nan = np.isnan(x)
+        if not is_nan:
+            if imin < 0 or x < prices[imin]:
+                imin = i
+            if imax < 0 or x > prices[imax]:
+                imax = i
+
+        for k in range(n_windows):
+            w = windows[k]
+            if is_nan:
+                nan_counts[k] += 1
+            else:
+                sums[k] += x
+            if i >= w:
+                old = prices[i - w]
+                if np.isnan(old):
+                    nan_counts[k] -= 1
+                else:
+                    sums[k] -= old
+            if i >= w - 1 and nan_counts[k] == 0:
+                averages[k, i] = sums[k] / w
+
+    return averages, imin, imax
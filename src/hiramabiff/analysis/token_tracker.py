@@ -8,20 +8,117 @@ historical data, and performing analysis.
 """
 
 import os
+import sys
 import json
 import time
 import asyncio
 import aiohttp
 import pandas as pd
 import numpy as np
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Union
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, List, Any, Optional, Set, Tuple, Union
 from dotenv import load_dotenv
 from loguru import logger
 
+try:
+    from hiramabiff.analysis._stats import (
+        portfolio_stats, stack_right_aligned, MEAN, MIN, MAX, STD, VOLATILITY, CHANGE_7D,
+    )
+except ImportError:
+    # Loaded by path without the package (see `cli._load_from_path`), so load
+    # the kernels module from this file's directory instead. It is registered
+    # under its package name because Numba's on-disk cache, shared with
+    # package imports, re-imports the module by that name.
+    import importlib.util
+    
+    _spec = importlib.util.spec_from_file_location(
+        "hiramabiff.analysis._stats", Path(__file__).with_name("_stats.py")
+    )
+    _stats = sys.modules[_spec.name] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_stats)
+    portfolio_stats, stack_right_aligned = _stats.portfolio_stats, _stats.stack_right_aligned
+    MEAN, MIN, MAX, STD, VOLATILITY, CHANGE_7D = (
+        _stats.MEAN, _stats.MIN, _stats.MAX, _stats.STD, _stats.VOLATILITY, _stats.CHANGE_7D,
+    )
+
+# Parquet support for the historical data cache (falls back to CSV)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Faster JSON encoding/decoding (falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Try to load environment variables
 load_dotenv()
 
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _native_symbol(chain: str) -> str:
+    """Return the native token symbol for a supported chain."""
+    return "ETH" if chain.lower() == "ethereum" else "SOL"
+
+
+# Maximum number of tokens whose market data is fetched at once
+MAX_CONCURRENT_FETCHES = 5
+
+# Base-unit divisors for on-chain balances
+_WEI = 10 ** 18
+_LAMPORTS = 10 ** 9
+_POW10 = tuple(10 ** i for i in range(256))  # ERC-20 decimals is a uint8
+
+# Column order of cached historical data: (timestamp ms, price, market cap, volume)
+HISTORY_COLUMNS = ("timestamp", "price", "market_cap", "volume")
+HistoryArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _parse_market_chart(data: Dict[str, Any]) -> HistoryArrays:
+    """Convert a CoinGecko `market_chart` response into column arrays.
+    
+    Args:
+        data: Decoded JSON response with `prices`, `market_caps` and
+            `total_volumes` lists of [timestamp, value] pairs
+            
+    Returns:
+        Tuple of (int64 epoch-millisecond timestamps, prices, market caps, volumes)
+    """
+    # Convert each [timestamp, value] series to a float64 array in one pass
+    prices = np.asarray(data["prices"], dtype=np.float64).reshape(-1, 2)
+    market_caps = np.asarray(data["market_caps"], dtype=np.float64).reshape(-1, 2)
+    volumes = np.asarray(data["total_volumes"], dtype=np.float64).reshape(-1, 2)
+    
+    return (
+        prices[:, 0].astype(np.int64),
+        np.ascontiguousarray(prices[:, 1]),
+        np.ascontiguousarray(market_caps[:, 1]),
+        np.ascontiguousarray(volumes[:, 1]),
+    )
+
+
+def _write_json(path: Union[str, Path], data: Dict[str, Any]) -> None:
+    """Write a dict to a JSON file with two-space indentation.
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable data (NumPy scalars are allowed)
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
 
 class TokenTracker:
     """A class for tracking and analyzing token data."""
@@ -40,6 +137,9 @@ class TokenTracker:
         "MATIC": "matic-network",
     }
     
+    # Data directories already created by this process
+    _created_dirs: Set[Path] = set()
+    
     def __init__(self, data_dir: str = None):
         """Initialize the token tracker.
         
@@ -54,8 +154,12 @@ class TokenTracker:
             self.data_dir = data_dir
             
         # Create data directories if they don't exist
-        os.makedirs(os.path.join(self.data_dir, "prices"), exist_ok=True)
-        os.makedirs(os.path.join(self.data_dir, "analysis"), exist_ok=True)
+        self._prices_dir = Path(self.data_dir) / "prices"
+        self._analysis_dir = Path(self.data_dir) / "analysis"
+        for directory in (self._prices_dir, self._analysis_dir):
+            if directory not in TokenTracker._created_dirs:
+                directory.mkdir(parents=True, exist_ok=True)
+                TokenTracker._created_dirs.add(directory)
         
         # Load API keys from environment variables
         self.etherscan_api_key = os.getenv("ETHERSCAN_API_KEY")
@@ -83,9 +187,25 @@ class TokenTracker:
         
         # Cache to store token prices
         self.price_cache = {}
-        self.price_cache_expiry = {}
+        self.price_cache_expiry = {}  # time.monotonic() deadlines
         self.cache_duration = 300  # 5 minutes
         
+        self.price_cache_max_size = 4096
+        
+        # Frequently requested ("hot") symbols kept fresh by the background refresher
+        self.hot_cache_size = 32
+        self.hot_promotion_threshold = 3
+        
+        # TTLs past expiry a hot price may still be served while the refresher runs
+        self.hot_max_stale_ttls = 2
+        self._access_counts: Counter = Counter()
+        self._hot_symbols: Set[str] = set()
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # Per-symbol locks serializing cache misses, held only while in use
+        self._price_locks: Dict[str, asyncio.Lock] = {}
+        self._price_lock_users: Counter = Counter()
+        
     async def get_token_price(self, symbol: str) -> Dict[str, Any]:
         """Get the current price of a token.
         
@@ -95,16 +215,181 @@ class TokenTracker:
         Returns:
             Dict containing token price and other market data
         """
-        # Check if we have a fresh cached price
-        now = time.time()
         symbol = symbol.upper()
+        self._access_counts[symbol] += 1
+        
+        # Return a fresh cached price before touching any network objects
+        cached = self._get_cached_price(symbol)
+        if cached is not None:
+            return cached
+        
+        # Only one coroutine per symbol fetches; the others wait for its result
+        lock = self._price_locks.get(symbol)
+        if lock is None:
+            lock = self._price_locks[symbol] = asyncio.Lock()
+        self._price_lock_users[symbol] += 1
+        try:
+            async with lock:
+                cached = self._get_cached_price(symbol)
+                if cached is not None:
+                    return cached
+                
+                return await self._fetch_token_price(symbol)
+        finally:
+            # Drop the lock once no coroutine holds or waits for it
+            self._price_lock_users[symbol] -= 1
+            if not self._price_lock_users[symbol]:
+                del self._price_lock_users[symbol]
+                del self._price_locks[symbol]
+    
+    def _get_cached_price(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return the cached price data for a symbol if it has not expired.
         
-        if symbol in self.price_cache and now < self.price_cache_expiry.get(symbol, 0):
+        Args:
+            symbol: Upper-cased token symbol
+            
+        Returns:
+            Cached price data, or None on a miss
+        """
+        cached = self.price_cache.get(symbol)
+        if cached is None:
+            return None
+        
+        now = time.monotonic()
+        expiry = self.price_cache_expiry.get(symbol, 0)
+        if now < expiry:
             logger.debug(f"Using cached price for {symbol}")
-            return self.price_cache[symbol]
+            return cached
+        
+        # Hot entries are refreshed in the background, so they outlive their TTL
+        # while it runs, but only by a bounded number of TTLs in case it keeps failing
+        if (
+            symbol in self._hot_symbols
+            and self._refresher_running()
+            and now < expiry + self.hot_max_stale_ttls * self.cache_duration
+        ):
+            logger.debug(f"Using hot cached price for {symbol}")
+            return cached
+        return None
+    
+    def _store_price(self, symbol: str, price_data: Dict[str, Any]) -> None:
+        """Cache price data and update the hot set by access frequency.
         
+        Args:
+            symbol: Upper-cased token symbol
+            price_data: Price data to cache
+        """
+        self.price_cache[symbol] = price_data
+        self.price_cache_expiry[symbol] = time.monotonic() + self.cache_duration
+        
+        # Promote frequently requested symbols, evicting the least frequently used hot one
+        count = self._access_counts[symbol]
+        if symbol not in self._hot_symbols and count >= self.hot_promotion_threshold:
+            if len(self._hot_symbols) < self.hot_cache_size:
+                self._hot_symbols.add(symbol)
+            else:
+                coldest = min(self._hot_symbols, key=self._access_counts.__getitem__)
+                if self._access_counts[coldest] < count:
+                    self._hot_symbols.discard(coldest)
+                    self._hot_symbols.add(symbol)
+        
+        if len(self.price_cache) > self.price_cache_max_size:
+            self._evict_prices()
+    
+    def _evict_prices(self) -> None:
+        """Shrink the price cache back to `price_cache_max_size` entries.
+        
+        Expired entries go first, then the least frequently used non-hot ones.
+        """
+        now = time.monotonic()
+        candidates = [symbol for symbol in self.price_cache if symbol not in self._hot_symbols]
+        candidates.sort(key=lambda symbol: (
+            self.price_cache_expiry.get(symbol, 0) > now,
+            self._access_counts[symbol],
+        ))
+        
+        for symbol in candidates[:len(self.price_cache) - self.price_cache_max_size]:
+            del self.price_cache[symbol]
+            self.price_cache_expiry.pop(symbol, None)
+            self._access_counts.pop(symbol, None)
+    
+    def _refresher_running(self) -> bool:
+        """Return whether the background hot-price refresher is active."""
+        return self._refresh_task is not None and not self._refresh_task.done()
+    
+    def start_price_refresher(self) -> asyncio.Task:
+        """Start refreshing hot symbols every `cache_duration / 2` seconds.
+        
+        Must be called from a running event loop. While the refresher runs,
+        hot symbols are served from the cache for up to `hot_max_stale_ttls`
+        TTLs past expiry, after which a failing refresher lets them expire.
+        
+        Returns:
+            The background refresh task
+        """
+        if not self._refresher_running():
+            self._refresh_task = asyncio.create_task(self._refresh_hot_prices())
+        return self._refresh_task
+    
+    async def stop_price_refresher(self) -> None:
+        """Cancel the background hot-price refresher if it is running."""
+        if self._refresher_running():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+    
+    async def _refresh_hot_prices(self) -> None:
+        """Periodically re-fetch prices for all hot symbols."""
+        while True:
+            await asyncio.sleep(self.cache_duration / 2)
+            
+            symbols = list(self._hot_symbols)
+            results = await asyncio.gather(
+                *(self._fetch_token_price(symbol) for symbol in symbols),
+                return_exceptions=True,
+            )
+            for symbol, result in zip(symbols, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Could not refresh price for {symbol}: {str(result)}")
+    
+    async def get_token_prices(self, symbols: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the current prices of several tokens concurrently.
+        
+        Args:
+            symbols: Token symbols (e.g., BTC, ETH)
+            
+        Returns:
+            Dict mapping upper-cased symbols to price data. Symbols whose
+            price could not be fetched are omitted.
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        results = await asyncio.gather(
+            *(self.get_token_price(symbol) for symbol in symbols),
+            return_exceptions=True,
+        )
+        
+        prices = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Could not get price for {symbol}: {str(result)}")
+            else:
+                prices[symbol] = result
+        return prices
+    
+    async def _fetch_token_price(self, symbol: str) -> Dict[str, Any]:
+        """Fetch the current price of a token from CoinGecko and cache it.
+        
+        Args:
+            symbol: Upper-cased token symbol
+            
+        Returns:
+            Dict containing token price and other market data
+        """
         # Convert symbol to coingecko id if in our map
-        token_id = self.TOKEN_MAP.get(symbol, symbol.lower())
+        token_id = _TOKEN_MAP.get(symbol) or symbol.lower()
         
         # If the symbol is not in our map, we'll try to use it directly
         # This might fail if it's not a valid CoinGecko ID
@@ -126,7 +411,7 @@ class TokenTracker:
                 
                 async with session.get(url, params=params) as response:
                     response.raise_for_status()
-                    data = await response.json()
+                    data = await response.json(loads=_json_loads)
                     
                     if token_id not in data:
                         raise ValueError(f"Token {symbol} not found (ID: {token_id})")
@@ -141,12 +426,11 @@ class TokenTracker:
                         "market_cap_usd": token_data["usd_market_cap"],
                         "volume_24h_usd": token_data["usd_24h_vol"],
                         "change_24h_percent": token_data["usd_24h_change"],
-                        "last_updated": datetime.fromtimestamp(token_data["last_updated_at"]).strftime("%Y-%m-%d %H:%M:%S"),
+                        "last_updated": datetime.fromtimestamp(token_data["last_updated_at"]).isoformat(sep=" ", timespec="seconds"),
                     }
                     
                     # Cache the result
-                    self.price_cache[symbol] = price_data
-                    self.price_cache_expiry[symbol] = now + self.cache_duration
+                    self._store_price(symbol, price_data)
                     
                     return price_data
                     
@@ -167,18 +451,42 @@ class TokenTracker:
         Returns:
             DataFrame containing historical price data
         """
+        timestamps, prices, market_caps, volumes = await self.get_token_historical_arrays(symbol, days)
+        
+        return pd.DataFrame({
+            "timestamp": pd.to_datetime(timestamps, unit="ms"),
+            "price": prices,
+            "market_cap": market_caps,
+            "volume": volumes,
+        })
+    
+    async def get_token_historical_arrays(self, symbol: str, days: int = 30) -> HistoryArrays:
+        """Get historical price data for a token as NumPy arrays.
+        
+        Args:
+            symbol: Token symbol (e.g., BTC, ETH)
+            days: Number of days of historical data to fetch
+            
+        Returns:
+            Tuple of (int64 epoch-millisecond timestamps, prices, market caps,
+            volumes), all of equal length
+        """
         symbol = symbol.upper()
-        token_id = self.TOKEN_MAP.get(symbol, symbol.lower())
+        token_id = _TOKEN_MAP.get(symbol) or symbol.lower()
         
         # Check if we have the data saved
-        csv_path = os.path.join(self.data_dir, "prices", f"{symbol}_history_{days}d.csv")
+        extension = "parquet" if PARQUET_AVAILABLE else "csv"
+        history_path = self._prices_dir / f"{symbol}_history_{days}d.{extension}"
         
         # If we have recent data, load it
-        if os.path.exists(csv_path):
-            file_mod_time = os.path.getmtime(csv_path)
-            if time.time() - file_mod_time < 3600:  # less than 1 hour old
-                logger.debug(f"Loading cached historical data for {symbol}")
-                return pd.read_csv(csv_path, parse_dates=["timestamp"])
+        try:
+            file_mod_time = os.stat(history_path).st_mtime
+        except FileNotFoundError:
+            file_mod_time = None
+        
+        if file_mod_time is not None and time.time() - file_mod_time < 3600:  # less than 1 hour old
+            logger.debug(f"Loading cached historical data for {symbol}")
+            return self._load_history(history_path)
         
         logger.info(f"Fetching {days} days of historical data for {symbol}")
         
@@ -193,30 +501,59 @@ class TokenTracker:
                 
                 async with session.get(url, params=params) as response:
                     response.raise_for_status()
-                    data = await response.json()
-                    
-                    # Process the data
-                    prices = data["prices"]
-                    market_caps = data["market_caps"]
-                    volumes = data["total_volumes"]
-                    
-                    # Create a DataFrame
-                    df = pd.DataFrame(prices, columns=["timestamp", "price"])
-                    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
+                    data = await response.json(loads=_json_loads)
                     
-                    # Add market caps and volumes
-                    df["market_cap"] = [row[1] for row in market_caps]
-                    df["volume"] = [row[1] for row in volumes]
+                    arrays = _parse_market_chart(data)
                     
-                    # Save to CSV
-                    df.to_csv(csv_path, index=False)
+                    # Save to the local cache
+                    self._save_history(arrays, history_path)
                     
-                    return df
+                    return arrays
                     
             except aiohttp.ClientError as e:
                 logger.error(f"Error fetching historical data for {symbol}: {str(e)}")
                 raise ValueError(f"Failed to fetch historical data for {symbol}: {str(e)}")
     
+    def _save_history(self, arrays: HistoryArrays, path: Path) -> None:
+        """Write historical data arrays to the local cache.
+        
+        Timestamps are stored as int64 epoch milliseconds, which zstd
+        compresses well and avoids date parsing on reload.
+        
+        Args:
+            arrays: Arrays returned by `_parse_market_chart`
+            path: Destination file path
+        """
+        if PARQUET_AVAILABLE:
+            table = pa.Table.from_arrays([pa.array(column) for column in arrays], names=HISTORY_COLUMNS)
+            pq.write_table(table, path, compression="zstd")
+        else:
+            pd.DataFrame(dict(zip(HISTORY_COLUMNS, arrays))).to_csv(path, index=False)
+    
+    def _load_history(self, path: Path) -> HistoryArrays:
+        """Read historical data arrays written by `_save_history`.
+        
+        Args:
+            path: Cached file path
+            
+        Returns:
+            Tuple of (timestamps, prices, market caps, volumes) arrays
+        """
+        if PARQUET_AVAILABLE:
+            table = pq.read_table(path, columns=list(HISTORY_COLUMNS))
+            columns = [table.column(name).to_numpy() for name in HISTORY_COLUMNS]
+        else:
+            df = pd.read_csv(path)
+            columns = [df[name].to_numpy() for name in HISTORY_COLUMNS]
+        
+        timestamps, prices, market_caps, volumes = columns
+        return (
+            timestamps.astype(np.int64, copy=False),
+            prices.astype(np.float64, copy=False),
+            market_caps.astype(np.float64, copy=False),
+            volumes.astype(np.float64, copy=False),
+        )
+    
     async def analyze_token(self, symbol: str) -> Dict[str, Any]:
         """Analyze a token and return statistical metrics.
         
@@ -226,54 +563,106 @@ class TokenTracker:
         Returns:
             Dict containing analysis results
         """
-        symbol = symbol.upper()
-        
-        # Get current price data
-        current_price_data = await self.get_token_price(symbol)
-        
-        # Get historical data - 30 days
-        historical_data = await self.get_token_historical_data(symbol, days=30)
+        analyses, errors = await self._analyze_tokens([symbol])
+        if errors:
+            raise next(iter(errors.values()))
+        return analyses[symbol.upper()]
+    
+    async def analyze_tokens(self, symbols: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Analyze several tokens at once and return statistical metrics.
         
-        # Calculate statistical metrics
-        mean_price = historical_data["price"].mean()
-        min_price = historical_data["price"].min()
-        max_price = historical_data["price"].max()
-        std_dev = historical_data["price"].std()
-        volatility = std_dev / mean_price
+        Current prices and historical data are fetched concurrently, up to
+        `MAX_CONCURRENT_FETCHES` tokens at a time, and the 30-day statistics
+        for all tokens are computed in a single pass of the `portfolio_stats`
+        kernel.
         
-        # Calculate 7-day change
-        if len(historical_data) >= 7:
-            week_ago_price = historical_data.iloc[-7]["price"]
-            current_price = historical_data.iloc[-1]["price"]
-            change_7d = ((current_price - week_ago_price) / week_ago_price) * 100
-        else:
-            change_7d = 0
-        
-        # Create analysis result
-        analysis = {
-            "symbol": symbol,
-            "id": current_price_data["id"],
-            "current_price_usd": current_price_data["price_usd"],
-            "market_cap_usd": current_price_data["market_cap_usd"],
-            "volume_24h_usd": current_price_data["volume_24h_usd"],
-            "change_24h_percent": current_price_data["change_24h_percent"],
-            "change_7d_percent": change_7d,
-            "stats": {
-                "mean_price_30d": mean_price,
-                "min_price_30d": min_price,
-                "max_price_30d": max_price,
-                "std_dev_30d": std_dev,
-                "volatility_30d": volatility,
-            },
-            "analysis_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        }
+        Args:
+            symbols: Token symbols (e.g., BTC, ETH)
+            
+        Returns:
+            Dict mapping upper-cased symbols to analysis results. Symbols whose
+            data could not be fetched are logged and omitted.
+        """
+        analyses, errors = await self._analyze_tokens(symbols)
+        for symbol, error in errors.items():
+            logger.warning(f"Could not analyze {symbol}: {str(error)}")
+        return analyses
+    
+    async def _analyze_tokens(
+        self, symbols: Iterable[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+        """Analyze tokens, collecting per-symbol failures instead of raising them.
         
-        # Save analysis to file
-        analysis_path = os.path.join(self.data_dir, "analysis", f"{symbol}_analysis.json")
-        with open(analysis_path, "w") as f:
-            json.dump(analysis, f, indent=2)
+        Args:
+            symbols: Token symbols (e.g., BTC, ETH)
+            
+        Returns:
+            Tuple of (upper-cased symbol -> analysis result for the tokens that
+            succeeded, upper-cased symbol -> exception for those that failed)
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        
+        async def fetch(symbol: str) -> Tuple[Dict[str, Any], HistoryArrays]:
+            # Get current price data and 30 days of historical data
+            async with semaphore:
+                price_data, history = await asyncio.gather(
+                    self.get_token_price(symbol),
+                    self.get_token_historical_arrays(symbol, days=30),
+                    return_exceptions=True,
+                )
+            for result in (price_data, history):
+                if isinstance(result, Exception):
+                    raise result
+            return price_data, history
+        
+        results = await asyncio.gather(*(fetch(symbol) for symbol in symbols), return_exceptions=True)
+        
+        errors = {}
+        fetched = []
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                errors[symbol] = result
+            else:
+                fetched.append((symbol, *result))
+        
+        if not fetched:
+            return {}, errors
+        
+        # Calculate statistical metrics for every token in one kernel call
+        prices, lengths = stack_right_aligned([history[1] for _, _, history in fetched])
+        stats = portfolio_stats(prices, lengths)
+        
+        analysis_date = datetime.now().isoformat(sep=" ", timespec="seconds")
+        analyses = {}
+        
+        for (symbol, current_price_data, _), row in zip(fetched, stats):
+            # Create analysis result
+            analysis = {
+                "symbol": symbol,
+                "id": current_price_data["id"],
+                "current_price_usd": current_price_data["price_usd"],
+                "market_cap_usd": current_price_data["market_cap_usd"],
+                "volume_24h_usd": current_price_data["volume_24h_usd"],
+                "change_24h_percent": current_price_data["change_24h_percent"],
+                "change_7d_percent": float(row[CHANGE_7D]),
+                "stats": {
+                    "mean_price_30d": float(row[MEAN]),
+                    "min_price_30d": float(row[MIN]),
+                    "max_price_30d": float(row[MAX]),
+                    "std_dev_30d": float(row[STD]),
+                    "volatility_30d": float(row[VOLATILITY]),
+                },
+                "analysis_date": analysis_date,
+            }
+            
+            # Save analysis to file
+            analysis_path = self._analysis_dir / f"{symbol}_analysis.json"
+            _write_json(analysis_path, analysis)
+            
+            analyses[symbol] = analysis
         
-        return analysis
+        return analyses, errors
     
     async def get_wallet_token_balances(self, chain: str, address: str) -> Dict[str, Any]:
         """Get token balances for a wallet.
@@ -291,7 +680,7 @@ class TokenTracker:
             "address": address,
             "native_balance": 0,
             "tokens": [],
-            "retrieved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "retrieved_at": datetime.now().isoformat(sep=" ", timespec="seconds"),
         }
         
         if chain == "ethereum":
@@ -312,78 +701,48 @@ class TokenTracker:
                     
                     async with session.get(self.etherscan_api, params=params) as response:
                         response.raise_for_status()
-                        data = await response.json()
+                        data = await response.json(loads=_json_loads)
                         
                         if data["status"] == "1":
-                            eth_balance = int(data["result"]) / 1e18
+                            eth_balance = int(data["result"]) / _WEI
                             result["native_balance"] = eth_balance
                         else:
                             logger.warning(f"Etherscan API error: {data['message']}")
                 
                     # Get ERC-20 token balances
-                    params = {
-                        "module": "account",
-                        "action": "tokentx",
-                        "address": address,
-                        "page": 1,
-                        "offset": 100,
-                        "sort": "desc",
-                        "apikey": self.etherscan_api_key
-                    }
+                    unique_tokens = [token async for token in self._iter_unique_erc20(session, address)]
                     
-                    async with session.get(self.etherscan_api, params=params) as response:
-                        response.raise_for_status()
-                        data = await response.json()
+                    for token_addr, token_name, token_symbol, token_decimals in unique_tokens:
+                        # Get token balance
+                        token_params = {
+                            "module": "account",
+                            "action": "tokenbalance",
+                            "contractaddress": token_addr,
+                            "address": address,
+                            "tag": "latest",
+                            "apikey": self.etherscan_api_key
+                        }
                         
-                        if data["status"] == "1":
-                            # Process token transactions to find current balances
-                            token_balances = {}
+                        async with session.get(self.etherscan_api, params=token_params) as token_response:
+                            token_data = await token_response.json(loads=_json_loads)
                             
-                            for tx in data["result"]:
-                                token_addr = tx["contractAddress"]
-                                token_name = tx["tokenName"]
-                                token_symbol = tx["tokenSymbol"]
-                                token_decimals = int(tx["tokenDecimal"])
+                            if token_data["status"] == "1" and int(token_data["result"]) > 0:
+                                token_balance = int(token_data["result"]) / _POW10[token_decimals]
                                 
-                                # Skip if we've already processed this token
-                                if token_addr in token_balances:
-                                    continue
-                                
-                                # Get token balance
-                                token_params = {
-                                    "module": "account",
-                                    "action": "tokenbalance",
-                                    "contractaddress": token_addr,
-                                    "address": address,
-                                    "tag": "latest",
-                                    "apikey": self.etherscan_api_key
-                                }
+                                # Get USD value if possible
+                                usd_value = None
+                                try:
+                                    price_data = await self.get_token_price(token_symbol)
+                                    usd_value = token_balance * price_data["price_usd"]
+                                except Exception as e:
+                                    logger.debug(f"Could not get USD value for {token_symbol}: {str(e)}")
                                 
-                                async with session.get(self.etherscan_api, params=token_params) as token_response:
-                                    token_data = await token_response.json()
-                                    
-                                    if token_data["status"] == "1" and int(token_data["result"]) > 0:
-                                        token_balance = int(token_data["result"]) / (10 ** token_decimals)
-                                        
-                                        # Get USD value if possible
-                                        usd_value = None
-                                        try:
-                                            price_data = await self.get_token_price(token_symbol)
-                                            usd_value = token_balance * price_data["price_usd"]
-                                        except Exception as e:
-                                            logger.debug(f"Could not get USD value for {token_symbol}: {str(e)}")
-                                        
-                                        token_balances[token_addr] = {
-                                            "name": token_name,
-                                            "symbol": token_symbol,
-                                            "balance": token_balance,
-                                            "usd_value": usd_value
-                                        }
-                            
-                            # Add tokens to result
-                            result["tokens"] = list(token_balances.values())
-                        else:
-                            logger.warning(f"Etherscan API error: {data['message']}")
+                                result["tokens"].append({
+                                    "name": token_name,
+                                    "symbol": token_symbol,
+                                    "balance": token_balance,
+                                    "usd_value": usd_value
+                                })
                 
                 except aiohttp.ClientError as e:
                     logger.error(f"Error fetching Ethereum wallet data: {str(e)}")
@@ -406,10 +765,10 @@ class TokenTracker:
                     
                     async with session.post(self.solana_rpc, json=payload) as response:
                         response.raise_for_status()
-                        data = await response.json()
+                        data = await response.json(loads=_json_loads)
                         
                         if "result" in data:
-                            sol_balance = data["result"]["value"] / 1e9
+                            sol_balance = data["result"]["value"] / _LAMPORTS
                             result["native_balance"] = sol_balance
                         else:
                             logger.warning(f"Solana RPC error: {data['error']['message']}")
@@ -432,30 +791,27 @@ class TokenTracker:
                     
                     async with session.post(self.solana_rpc, json=payload) as response:
                         response.raise_for_status()
-                        data = await response.json()
+                        data = await response.json(loads=_json_loads)
                         
                         if "result" in data:
-                            token_accounts = data["result"]["value"]
+                            token_infos = (
+                                account["account"]["data"]["parsed"]["info"]
+                                for account in data["result"]["value"]
+                            )
                             
-                            for account in token_accounts:
-                                token_info = account["account"]["data"]["parsed"]["info"]
-                                mint = token_info["mint"]
-                                token_amount = token_info["tokenAmount"]
-                                
-                                if token_amount["uiAmount"] > 0:
-                                    # Get token metadata
-                                    # Note: In a real implementation, you'd want to use a token metadata service
-                                    # or on-chain data to get the token name and symbol
-                                    token_name = mint[:6]  # Placeholder
-                                    token_symbol = mint[:4]  # Placeholder
-                                    
-                                    result["tokens"].append({
-                                        "mint": mint,
-                                        "name": token_name,
-                                        "symbol": token_symbol,
-                                        "balance": token_amount["uiAmount"],
-                                        "usd_value": None
-                                    })
+                            # Note: In a real implementation, you'd want to use a token metadata service
+                            # or on-chain data to get the token name and symbol
+                            result["tokens"] = [
+                                {
+                                    "mint": info["mint"],
+                                    "name": info["mint"][:6],  # Placeholder
+                                    "symbol": info["mint"][:4],  # Placeholder
+                                    "balance": ui_amount,
+                                    "usd_value": None
+                                }
+                                for info in token_infos
+                                if (ui_amount := info["tokenAmount"]["uiAmount"]) > 0
+                            ]
                         else:
                             logger.warning(f"Solana RPC error: {data['error']['message']}")
                             
@@ -468,6 +824,80 @@ class TokenTracker:
         
         return result
     
+    async def _iter_unique_erc20(
+        self,
+        session: aiohttp.ClientSession,
+        address: str,
+        max_unique: int = 50,
+        page_size: int = 100,
+        max_pages: int = 5,
+    ) -> AsyncIterator[Tuple[str, str, str, int]]:
+        """Stream the distinct ERC-20 contracts a wallet has transacted with.
+        
+        Pages through Etherscan's `tokentx` endpoint (newest first) and stops as
+        soon as `max_unique` contracts have been seen or the history runs out.
+        
+        Args:
+            session: Open aiohttp session
+            address: Ethereum wallet address
+            max_unique: Maximum number of contracts to yield
+            page_size: Number of transfers requested per page
+            max_pages: Maximum number of pages to request
+            
+        Yields:
+            Tuples of (contract address, token name, token symbol, decimals)
+        """
+        seen = set()
+        
+        for page in range(1, max_pages + 1):
+            params = {
+                "module": "account",
+                "action": "tokentx",
+                "address": address,
+                "page": page,
+                "offset": page_size,
+                "sort": "desc",
+                "apikey": self.etherscan_api_key
+            }
+            
+            async with session.get(self.etherscan_api, params=params) as response:
+                response.raise_for_status()
+                data = await response.json(loads=_json_loads)
+            
+            if data["status"] != "1":
+                # Later pages return status 0 once the history is exhausted
+                if page == 1:
+                    logger.warning(f"Etherscan API error: {data['message']}")
+                return
+            
+            for tx in data["result"]:
+                token_addr = tx["contractAddress"]
+                if token_addr in seen:
+                    continue
+                
+                seen.add(token_addr)
+                yield token_addr, tx["tokenName"], tx["tokenSymbol"], int(tx["tokenDecimal"])
+                
+                if len(seen) >= max_unique:
+                    return
+            
+            if len(data["result"]) < page_size:
+                return
+    
+    async def _process_wallet(self, chain: str, address: str) -> Dict[str, Any]:
+        """Get token balances for a wallet, tagged with its native token symbol.
+        
+        Args:
+            chain: Blockchain name (e.g., ethereum, solana)
+            address: Wallet address
+            
+        Returns:
+            Dict from `get_wallet_token_balances` with an added `native_symbol` key
+        """
+        wallet_data = await self.get_wallet_token_balances(chain, address)
+        wallet_data["native_symbol"] = _native_symbol(chain)
+        return wallet_data
+    
     async def generate_portfolio_analysis(self, wallets: Dict[str, str]) -> Dict[str, Any]:
         """Generate analysis for a portfolio of wallet addresses.
         
@@ -482,60 +912,76 @@ class TokenTracker:
             "tokens": [],
             "total_value_usd": 0,
             "token_distribution": {},
-            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "generated_at": datetime.now().isoformat(sep=" ", timespec="seconds"),
         }
         
-        # Process each wallet
-        for chain, address in wallets.items():
-            try:
-                wallet_data = await self.get_wallet_token_balances(chain, address)
-                
-                # Add native token
-                native_symbol = "ETH" if chain.lower() == "ethereum" else "SOL"
-                native_price = await self.get_token_price(native_symbol)
-                
-                native_usd_value = wallet_data["native_balance"] * native_price["price_usd"]
-                portfolio["total_value_usd"] += native_usd_value
-                
-                # Add to token distribution
-                if native_symbol in portfolio["token_distribution"]:
-                    portfolio["token_distribution"][native_symbol]["value_usd"] += native_usd_value
-                else:
-                    portfolio["token_distribution"][native_symbol] = {
-                        "value_usd": native_usd_value,
-                        "percentage": 0  # will calculate percentages at the end
-                    }
-                
-                # Process other tokens
-                for token in wallet_data["tokens"]:
-                    if token["usd_value"]:
-                        portfolio["total_value_usd"] += token["usd_value"]
-                        
-                        # Add to token distribution
-                        if token["symbol"] in portfolio["token_distribution"]:
-                            portfolio["token_distribution"][token["symbol"]]["value_usd"] += token["usd_value"]
-                        else:
-                            portfolio["token_distribution"][token["symbol"]] = {
-                                "value_usd": token["usd_value"],
-                                "percentage": 0  # will calculate percentages at the end
-                            }
-                
-                # Add wallet data to portfolio
-                portfolio["tokens"].extend(wallet_data["tokens"])
-                
-            except Exception as e:
-                logger.error(f"Error processing wallet {chain}:{address}: {str(e)}")
+        # Pre-warm native token prices while the wallet scans are in flight
+        native_prices_task = asyncio.create_task(
+            self.get_token_prices({_native_symbol(chain) for chain in wallets})
+        )
+        
+        # Fetch all wallets concurrently
+        results = await asyncio.gather(
+            *(self._process_wallet(chain, address) for chain, address in wallets.items()),
+            return_exceptions=True,
+        )
+        
+        wallet_results = []
+        for (chain, address), result in zip(wallets.items(), results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error processing wallet {chain}:{address}: {str(result)}")
+            else:
+                wallet_results.append(result)
+        
+        native_prices = await native_prices_task
+        
+        token_distribution = defaultdict(lambda: {"value_usd": 0.0, "percentage": 0})
+        
+        for wallet_data in wallet_results:
+            native_symbol = wallet_data["native_symbol"]
+            native_price = native_prices.get(native_symbol)
+            if native_price is None:
+                logger.error(
+                    f"Error processing wallet {wallet_data['chain']}:{wallet_data['address']}: "
+                    f"no price available for {native_symbol}"
+                )
+                continue
+            
+            # Add native token
+            native_usd_value = wallet_data["native_balance"] * native_price["price_usd"]
+            portfolio["total_value_usd"] += native_usd_value
+            token_distribution[native_symbol]["value_usd"] += native_usd_value
+            
+            # Process other tokens
+            for token in wallet_data["tokens"]:
+                if token["usd_value"]:
+                    portfolio["total_value_usd"] += token["usd_value"]
+                    token_distribution[token["symbol"]]["value_usd"] += token["usd_value"]
+            
+            # Add wallet data to portfolio
+            portfolio["tokens"].extend(wallet_data["tokens"])
+        
+        portfolio["token_distribution"] = dict(token_distribution)
         
         # Calculate percentages
-        if portfolio["total_value_usd"] > 0:
-            for token, data in portfolio["token_distribution"].items():
-                data["percentage"] = (data["value_usd"] / portfolio["total_value_usd"]) * 100
+        distribution = portfolio["token_distribution"]
+        if portfolio["total_value_usd"] > 0 and distribution:
+            values = np.fromiter(
+                (data["value_usd"] for data in distribution.values()),
+                dtype=np.float64,
+                count=len(distribution),
+            )
+            percentages = values * (100.0 / portfolio["total_value_usd"])
+            for data, percentage in zip(distribution.values(), percentages.tolist()):
+                data["percentage"] = percentage
         
         # Save portfolio analysis
-        portfolio_filename = f"portfolio_analysis_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
-        portfolio_path = os.path.join(self.data_dir, "analysis", portfolio_filename)
-        
-        with open(portfolio_path, "w") as f:
-            json.dump(portfolio, f, indent=2)
+        portfolio_filename = f"portfolio_analysis_{time.strftime('%Y%m%d%H%M%S')}.json"
+        portfolio_path = self._analysis_dir / portfolio_filename
+        _write_json(portfolio_path, portfolio)
         
-        return portfolio 
\ No newline at end of file
+        return portfolio 
+
+
+# Interned symbol -> CoinGecko ID lookup used on the price/history hot paths
+_TOKEN_MAP = {sys.intern(k): sys.intern(v) for k, v in TokenTracker.TOKEN_MAP.items()}
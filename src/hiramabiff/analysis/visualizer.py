@@ -8,25 +8,256 @@ including price charts, portfolio distribution, and other analytics.
 
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set, Union, Tuple
 import numpy as np
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from matplotlib.ticker import FuncFormatter
+from PIL import Image
 import seaborn as sns
 from loguru import logger
 
+try:
+    from hiramabiff.analysis._njit import NUMBA_AVAILABLE
+    from hiramabiff.analysis._stats import price_chart_stats
+except ImportError:
+    # Loaded by path without the package (see `cli._load_from_path`), so load
+    # the kernels module from this file's directory instead, under the name
+    # Numba's shared on-disk cache expects (see token_tracker)
+    import importlib.util
+    import sys
+    
+    _spec = importlib.util.spec_from_file_location(
+        "hiramabiff.analysis._stats", os.path.join(os.path.dirname(os.path.abspath(__file__)), "_stats.py")
+    )
+    _stats = sys.modules[_spec.name] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_stats)
+    NUMBA_AVAILABLE, price_chart_stats = _stats.NUMBA_AVAILABLE, _stats.price_chart_stats
+
+# Visualization-aware downsampling (falls back to a NumPy min/max bucketing)
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+    TSDOWNSAMPLE_AVAILABLE = True
+except ImportError:
+    TSDOWNSAMPLE_AVAILABLE = False
+
+# Optional C moving-window kernels (falls back to pandas rolling)
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+# Series shorter than this are always plotted in full
+MIN_DOWNSAMPLE_POINTS = 2000
+
+# Struct-of-arrays form of a price history: (timestamps, prices, volumes or None)
+SeriesArrays = Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]
+
+# Set once non-contiguous chart input has been reported
+_LAYOUT_WARNED = False
+
+# Default resolution for saved charts and the PNG encoder settings. zlib level 3
+# is several times faster than the default level 6 for a few percent larger files
+DEFAULT_DPI = 120
+PNG_PIL_KWARGS = {"compress_level": 3}
+PNG_PALETTE_COLORS = 64
+
 # Set Seaborn style
 sns.set_style("darkgrid")
 plt.rcParams["figure.figsize"] = (12, 7)
 plt.rcParams["font.size"] = 12
 
+# Color schemes shared by every visualizer instance
+_COLOR_SCHEMES = {
+    "primary": ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", 
+                "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"],
+    "pastel": sns.color_palette("pastel"),
+    "dark": sns.color_palette("dark"),
+    "colorblind": sns.color_palette("colorblind"),
+    "deep": sns.color_palette("deep"),
+}
+
+
+@lru_cache(maxsize=1024)
+def _format_money(x: float) -> str:
+    """Format a value as a compact dollar amount (cached per tick value).
+    
+    Args:
+        x: Value to format
+        
+    Returns:
+        Formatted string
+    """
+    if x >= 1e9:
+        return f"${x/1e9:.1f}B"
+    elif x >= 1e6:
+        return f"${x/1e6:.1f}M"
+    elif x >= 1e3:
+        return f"${x/1e3:.1f}K"
+    else:
+        return f"${x:.2f}"
+
+
+def _minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select the min and max sample of each of `n_out // 2` equal-width buckets.
+    
+    Args:
+        y: Values to downsample
+        n_out: Target number of points
+        
+    Returns:
+        Sorted indices into `y`, always including the first and last sample
+    """
+    edges = np.linspace(0, len(y), n_out // 2 + 1).astype(np.int64)
+    picks = [0, len(y) - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            bucket = y[start:end]
+            picks.append(start + int(bucket.argmin()))
+            picks.append(start + int(bucket.argmax()))
+    return np.unique(np.asarray(picks, dtype=np.int64))
+
+
+def _downsample_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Return indices of a shape-preserving subset of at most ~`n_out` points.
+    
+    Args:
+        x: Monotonic numeric x values (e.g. int64 epoch nanoseconds)
+        y: Values to downsample
+        n_out: Target number of points
+        
+    Returns:
+        Sorted indices into `x`/`y`
+    """
+    if len(y) <= n_out:
+        return np.arange(len(y))
+    if TSDOWNSAMPLE_AVAILABLE:
+        return MinMaxLTTBDownsampler().downsample(x, np.ascontiguousarray(y), n_out=n_out)
+    return _minmax_indices(y, n_out)
+
+
+def _contiguous(values: Any, dtype: Any) -> np.ndarray:
+    """Return `values` as a C-contiguous array of `dtype`, copying only if needed.
+    
+    Strided input (e.g. a column view into a wide pandas block) is logged once,
+    since every downstream kernel would otherwise copy it again.
+    
+    Args:
+        values: Array-like input
+        dtype: Target dtype
+        
+    Returns:
+        C-contiguous ndarray
+    """
+    global _LAYOUT_WARNED
+    arr = np.asarray(values)
+    if not arr.flags.c_contiguous and not _LAYOUT_WARNED:
+        logger.debug("Chart input is not C-contiguous; pass contiguous arrays to avoid a copy")
+        _LAYOUT_WARNED = True
+    return np.ascontiguousarray(arr, dtype=dtype)
+
+
+def _to_soa(data: Union[pd.DataFrame, SeriesArrays], days: int) -> SeriesArrays:
+    """Split historical data into sorted timestamp, price and volume arrays.
+    
+    Prices and volumes are single precision, which is ample for charting and
+    halves the bytes every later pass has to read.
+    
+    Args:
+        data: DataFrame with timestamp/price (and optionally volume) columns, or
+            a (timestamps, prices, volumes) tuple of arrays with volumes optional
+        days: Number of most recent samples to keep
+        
+    Returns:
+        Tuple of (datetime64[ns] timestamps, float32 prices, float32 volumes or None)
+        sorted by timestamp, each C-contiguous
+    """
+    if isinstance(data, pd.DataFrame):
+        ts = pd.to_datetime(data["timestamp"]).to_numpy(dtype="datetime64[ns]", copy=False)
+        price = data["price"].to_numpy(copy=False)
+        volume = data["volume"].to_numpy(copy=False) if "volume" in data.columns else None
+    else:
+        ts, price, volume = data
+    
+    ts = _contiguous(ts, "datetime64[ns]")
+    price = _contiguous(price, np.float32)
+    volume = None if volume is None else _contiguous(volume, np.float32)
+    
+    start = max(len(ts) - days, 0)
+    
+    # Already-sorted input (the common case) is sliced as views; otherwise one
+    # stable sort, then gather only the requested tail
+    if (ts[:-1] <= ts[1:]).all():
+        return ts[start:], price[start:], None if volume is None else volume[start:]
+    
+    order = np.argsort(ts, kind="stable")[start:]
+    return ts[order], price[order], None if volume is None else volume[order]
+
+
+def _moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """Compute a trailing simple moving average.
+    
+    Args:
+        values: 1-D array of samples
+        window: Window length
+        
+    Returns:
+        Array of the same length, NaN until a full window is available
+    """
+    if BOTTLENECK_AVAILABLE:
+        return bn.move_mean(values, window=window, min_count=window)
+    return pd.Series(values).rolling(window=window).mean().to_numpy()
+
+
+def _bin_volume(x: np.ndarray, volume: np.ndarray, n_bins: int) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Sum volume into at most `n_bins` equal-width time buckets.
+    
+    Bars narrower than a pixel overlap anyway, so long series are drawn as one
+    bar per pixel column instead of one per sample.
+    
+    Args:
+        x: Matplotlib date floats in ascending order
+        volume: Volume per sample
+        n_bins: Maximum number of bars, typically the figure width in pixels
+        
+    Returns:
+        Tuple of (bar centers, bar heights, bar width in days)
+    """
+    if len(x) <= n_bins or x[-1] <= x[0]:
+        return x, volume, 0.8
+    
+    edges = np.linspace(x[0], x[-1], n_bins + 1)
+    bins = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, n_bins - 1)
+    binned = np.bincount(bins, weights=np.nan_to_num(volume), minlength=n_bins)
+    return (edges[:-1] + edges[1:]) / 2, binned, edges[1] - edges[0]
+
+
+# Chart methods that can be rendered in a worker process
+BATCH_CHART_METHODS = frozenset({
+    "create_price_chart",
+    "create_multi_token_chart",
+    "create_portfolio_pie_chart",
+    "create_volatility_comparison",
+    "create_price_correlation_heatmap",
+})
+
 
 class TokenVisualizer:
     """A class for generating visualizations from token data."""
     
+    # Output directories already created by this process
+    _created_dirs: Set[str] = set()
+    
     def __init__(self, output_dir: str = None):
         """Initialize the token visualizer.
         
@@ -39,29 +270,112 @@ class TokenVisualizer:
             self.output_dir = os.path.join(home_dir, ".hiramabiff", "visualizations")
         else:
             self.output_dir = output_dir
-            
-        # Create output directory if it doesn't exist
-        os.makedirs(self.output_dir, exist_ok=True)
         
-        # Create subdirectories
+        # Create subdirectories (and the output directory) once per process
         self.price_charts_dir = os.path.join(self.output_dir, "price_charts")
         self.portfolio_charts_dir = os.path.join(self.output_dir, "portfolio")
         self.comparison_charts_dir = os.path.join(self.output_dir, "comparisons")
         
-        os.makedirs(self.price_charts_dir, exist_ok=True)
-        os.makedirs(self.portfolio_charts_dir, exist_ok=True)
-        os.makedirs(self.comparison_charts_dir, exist_ok=True)
+        for directory in (self.price_charts_dir, self.portfolio_charts_dir, self.comparison_charts_dir):
+            if directory not in TokenVisualizer._created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                TokenVisualizer._created_dirs.add(directory)
         
-        # Configure color schemes
-        self.color_schemes = {
-            "primary": ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", 
-                        "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"],
-            "pastel": sns.color_palette("pastel"),
-            "dark": sns.color_palette("dark"),
-            "colorblind": sns.color_palette("colorblind"),
-            "deep": sns.color_palette("deep"),
-        }
+        # Configure color schemes (shared, built once at import)
+        self.color_schemes = _COLOR_SCHEMES
         
+        # Reusable off-screen figures keyed by chart layout
+        self._figures: Dict[str, Figure] = {}
+        
+    def _get_fig(
+        self, key: str, figsize: Tuple[float, float], show: bool = False, dpi: int = DEFAULT_DPI
+    ) -> Figure:
+        """Return a blank figure for a chart layout.
+        
+        Off-screen figures are cached per layout and cleared between renders,
+        so the canvas is only built once. Figures that will be shown get a
+        fresh pyplot-managed figure instead.
+        
+        Args:
+            key: Layout identifier
+            figsize: Figure size in inches
+            show: Whether the figure will be displayed with pyplot
+            dpi: Resolution the figure will be saved at
+            
+        Returns:
+            An empty Figure
+        """
+        if show:
+            return plt.figure(figsize=figsize)
+        
+        fig = self._figures.get(key)
+        if fig is None:
+            fig = Figure(figsize=figsize, dpi=dpi)
+            FigureCanvasAgg(fig)
+            self._figures[key] = fig
+        else:
+            fig.clear()
+            fig.set_dpi(dpi)
+        return fig
+    
+    def _save_png(self, fig: Figure, output_path: str, dpi: int, palette: bool = False) -> None:
+        """Write a laid-out figure to a PNG file.
+        
+        Off-screen figures are already sized at the target resolution, so the
+        Agg canvas renders them once with `print_png`. Pyplot-managed figures
+        go through `savefig` so the on-screen resolution is left untouched.
+        
+        Args:
+            fig: Figure to save
+            output_path: Destination file path
+            dpi: Resolution of the saved image
+            palette: Quantize to an 8-bit indexed PNG; only suitable for charts
+                made of a few flat colors
+        """
+        if isinstance(fig.canvas, FigureCanvasAgg) and fig.dpi == dpi:
+            if palette:
+                fig.canvas.draw()
+                image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert("RGB")
+                image = image.quantize(colors=PNG_PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+                image.save(output_path, optimize=True, **PNG_PIL_KWARGS)
+            else:
+                fig.canvas.print_png(output_path, pil_kwargs=PNG_PIL_KWARGS)
+        else:
+            fig.savefig(output_path, dpi=dpi, pil_kwargs=PNG_PIL_KWARGS)
+    
+    def _save_sparse(self, fig: Figure, output_path: str, dpi: int, fmt: str) -> None:
+        """Write a chart made of a few flat shapes as SVG or palette PNG.
+        
+        SVG skips rasterization entirely; text is kept as text rather than
+        converted to glyph paths.
+        
+        Args:
+            fig: Figure to save
+            output_path: Destination file path
+            dpi: Resolution of the saved image when `fmt` is "png"
+            fmt: Output format, "svg" or "png"
+        """
+        if fmt == "svg":
+            with plt.rc_context({"svg.fonttype": "none"}):
+                fig.savefig(output_path, format="svg")
+        elif fmt == "png":
+            self._save_png(fig, output_path, dpi, palette=True)
+        else:
+            raise ValueError(f"Unsupported chart format: {fmt}")
+    
+    def _finish_fig(self, fig: Figure, show: bool) -> None:
+        """Display a pyplot-managed figure, or clear a cached one.
+        
+        Args:
+            fig: Figure returned by `_get_fig`
+            show: Whether to display the figure
+        """
+        if show:
+            plt.show()
+            plt.close(fig)
+        else:
+            fig.clear()
+    
     def _money_formatter(self, x: float, pos) -> str:
         """Format y-axis ticks as money values.
         
@@ -72,18 +386,11 @@ class TokenVisualizer:
         Returns:
             Formatted string
         """
-        if x >= 1e9:
-            return f"${x/1e9:.1f}B"
-        elif x >= 1e6:
-            return f"${x/1e6:.1f}M"
-        elif x >= 1e3:
-            return f"${x/1e3:.1f}K"
-        else:
-            return f"${x:.2f}"
+        return _format_money(x)
     
     def create_price_chart(
         self, 
-        historical_data: pd.DataFrame, 
+        historical_data: Union[pd.DataFrame, SeriesArrays], 
         symbol: str,
         days: int = 30,
         show_volume: bool = True,
@@ -92,11 +399,13 @@ class TokenVisualizer:
         color_scheme: str = "primary",
         save: bool = True,
         show: bool = False,
+        dpi: int = DEFAULT_DPI,
     ) -> str:
         """Create a price chart for a token.
         
         Args:
-            historical_data: DataFrame with historical price data
+            historical_data: DataFrame with historical price data, or a
+                (timestamps, prices, volumes) tuple of arrays
             symbol: Token symbol
             days: Number of days to display
             show_volume: Whether to show volume
@@ -105,38 +414,76 @@ class TokenVisualizer:
             color_scheme: Color scheme name
             save: Whether to save the chart
             show: Whether to display the chart
+            dpi: Resolution of the saved PNG
             
         Returns:
             Path to saved chart if save=True, else empty string
         """
         logger.info(f"Creating price chart for {symbol} ({days} days)")
         
-        # Ensure data is sorted by timestamp
-        df = historical_data.sort_values("timestamp").copy()
+        # Sort by timestamp and keep the requested number of days
+        ts, price_arr, volume_arr = _to_soa(historical_data, days)
         
-        # Filter for the requested number of days
-        if len(df) > days:
-            df = df.tail(days)
+        return self._create_price_chart_soa(
+            ts, price_arr, volume_arr, symbol, days, show_volume, show_ma,
+            ma_periods, color_scheme, save, show, dpi,
+        )
+    
+    def _create_price_chart_soa(
+        self,
+        ts: np.ndarray,
+        price_arr: np.ndarray,
+        volume_arr: Optional[np.ndarray],
+        symbol: str,
+        days: int,
+        show_volume: bool,
+        show_ma: bool,
+        ma_periods: List[int],
+        color_scheme: str,
+        save: bool,
+        show: bool,
+        dpi: int,
+    ) -> str:
+        """Render a price chart from sorted timestamp, price and volume arrays.
         
+        See `create_price_chart` for the arguments.
+        """
         # Create figure with secondary y-axis for volume
-        fig, ax1 = plt.subplots()
+        fig = self._get_fig("price", tuple(plt.rcParams["figure.figsize"]), show, dpi)
+        ax1 = fig.add_subplot()
         
         if show_volume:
             # Twin the x-axis for volume
             ax2 = ax1.twinx()
         
+        # Add moving averages on the full series before downsampling and locate
+        # the extremes; with Numba both come from a single compiled pass
+        windows = [period for period in ma_periods if len(price_arr) >= period] if show_ma else []
+        if NUMBA_AVAILABLE:
+            averages, imin, imax = price_chart_stats(price_arr, np.asarray(windows, dtype=np.int64))
+            moving_averages = dict(zip(windows, averages))
+        else:
+            moving_averages = {period: _moving_average(price_arr, period) for period in windows}
+            imin, imax = np.nanargmin(price_arr), np.nanargmax(price_arr)
+        
+        # Downsample long series to roughly two points per horizontal pixel
+        x = mdates.date2num(ts)
+        n_out = max(MIN_DOWNSAMPLE_POINTS, int(fig.get_figwidth() * fig.dpi) * 2)
+        plot_idx = _downsample_indices(ts.view(np.int64), price_arr, n_out)
+        x_plot = x[plot_idx]
+        
         # Plot price line
         colors = self.color_schemes.get(color_scheme, self.color_schemes["primary"])
-        ax1.plot(df["timestamp"], df["price"], color=colors[0], linewidth=2, label=f"{symbol} Price")
+        ax1.xaxis_date()
+        ax1.plot(x_plot, price_arr[plot_idx], color=colors[0], linewidth=2, label=f"{symbol} Price")
         
-        # Add moving averages if requested
+        # Plot moving averages
         if show_ma:
             for i, period in enumerate(ma_periods):
-                if len(df) >= period:
-                    df[f"MA{period}"] = df["price"].rolling(window=period).mean()
+                if period in moving_averages:
                     ax1.plot(
-                        df["timestamp"], 
-                        df[f"MA{period}"],
+                        x_plot, 
+                        moving_averages[period][plot_idx],
                         color=colors[i+1],
                         linewidth=1.5,
                         alpha=0.7,
@@ -144,13 +491,16 @@ class TokenVisualizer:
                     )
         
         # Plot volume if requested
-        if show_volume and "volume" in df.columns:
+        if show_volume and volume_arr is not None:
+            bar_x, bar_volume, bar_width = _bin_volume(
+                x, volume_arr, int(fig.get_figwidth() * fig.dpi)
+            )
             ax2.bar(
-                df["timestamp"],
-                df["volume"],
+                bar_x,
+                bar_volume,
                 alpha=0.3,
                 color=colors[-1],
-                width=0.8,
+                width=bar_width,
                 label="Volume"
             )
             ax2.set_ylabel("Volume (USD)")
@@ -168,31 +518,28 @@ class TokenVisualizer:
         # Format x-axis dates
         if days <= 14:
             ax1.xaxis.set_major_formatter(mdates.DateFormatter("%m-%d %H:%M"))
-            plt.xticks(rotation=45)
         else:
             ax1.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-            plt.xticks(rotation=45)
+        ax1.tick_params(axis="x", labelrotation=45)
         
         # Format y-axis as money
         ax1.yaxis.set_major_formatter(FuncFormatter(self._money_formatter))
         
         # Add legend, title, and grid
         ax1.legend(loc="upper left")
-        plt.title(f"{symbol} Price Chart - {days} Days", fontsize=16)
-        plt.grid(True, alpha=0.3)
+        ax1.set_title(f"{symbol} Price Chart - {days} Days", fontsize=16)
+        (ax2 if show_volume else ax1).grid(True, alpha=0.3)
         
         # Add min and max points
-        min_price = df["price"].min()
-        max_price = df["price"].max()
-        min_idx = df["price"].idxmin()
-        max_idx = df["price"].idxmax()
+        min_price, max_price = float(price_arr[imin]), float(price_arr[imax])
+        min_ts, max_ts = x[imin], x[imax]
         
-        ax1.scatter(df.loc[min_idx, "timestamp"], min_price, color="red", s=100, zorder=5)
-        ax1.scatter(df.loc[max_idx, "timestamp"], max_price, color="green", s=100, zorder=5)
+        ax1.scatter(min_ts, min_price, color="red", s=100, zorder=5)
+        ax1.scatter(max_ts, max_price, color="green", s=100, zorder=5)
         
         ax1.annotate(
             f"${min_price:.2f}", 
-            (df.loc[min_idx, "timestamp"], min_price),
+            (min_ts, min_price),
             xytext=(0, -20),
             textcoords="offset points",
             ha="center"
@@ -200,14 +547,14 @@ class TokenVisualizer:
         
         ax1.annotate(
             f"${max_price:.2f}", 
-            (df.loc[max_idx, "timestamp"], max_price),
+            (max_ts, max_price),
             xytext=(0, 20),
             textcoords="offset points",
             ha="center"
         )
         
         # Adjust layout and figure size
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the chart if requested
         output_path = ""
@@ -215,35 +562,35 @@ class TokenVisualizer:
             timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
             filename = f"{symbol.lower()}_price_chart_{days}d_{timestamp}.png"
             output_path = os.path.join(self.price_charts_dir, filename)
-            plt.savefig(output_path, dpi=300)
+            self._save_png(fig, output_path, dpi)
             logger.info(f"Price chart saved to {output_path}")
         
         # Show the chart if requested
-        if show:
-            plt.show()
-        else:
-            plt.close()
+        self._finish_fig(fig, show)
             
         return output_path
     
     def create_multi_token_chart(
         self,
-        data_frames: Dict[str, pd.DataFrame],
+        data_frames: Dict[str, Union[pd.DataFrame, SeriesArrays]],
         days: int = 30,
         normalized: bool = True,
         color_scheme: str = "deep",
         save: bool = True,
         show: bool = False,
+        dpi: int = DEFAULT_DPI,
     ) -> str:
         """Create a comparison chart for multiple tokens.
         
         Args:
             data_frames: Dict mapping token symbols to DataFrames with historical data
+                (or (timestamps, prices, volumes) array tuples)
             days: Number of days to display
             normalized: Whether to normalize prices to percentage change
             color_scheme: Color scheme name
             save: Whether to save the chart
             show: Whether to display the chart
+            dpi: Resolution of the saved PNG
             
         Returns:
             Path to saved chart if save=True, else empty string
@@ -255,58 +602,58 @@ class TokenVisualizer:
         symbols = list(data_frames.keys())
         logger.info(f"Creating comparison chart for {', '.join(symbols)} ({days} days)")
         
-        plt.figure(figsize=(12, 7))
+        fig = self._get_fig("multi_token", (12, 7), show, dpi)
+        ax = fig.add_subplot()
         colors = self.color_schemes.get(color_scheme, self.color_schemes["deep"])
+        n_out = max(MIN_DOWNSAMPLE_POINTS, int(fig.get_figwidth() * fig.dpi) * 2)
+        ax.xaxis_date()
         
-        # Plot each token
-        for i, (symbol, df) in enumerate(data_frames.items()):
+        # Build one polyline per token
+        segments = []
+        for symbol, data in data_frames.items():
             # Sort and filter data
-            df = df.sort_values("timestamp").copy()
-            if len(df) > days:
-                df = df.tail(days)
+            ts, price_arr, _ = _to_soa(data, days)
+            
+            # Downsample long series to roughly two points per horizontal pixel
+            plot_idx = _downsample_indices(ts.view(np.int64), price_arr, n_out)
+            x, price_arr = mdates.date2num(ts[plot_idx]), price_arr[plot_idx]
                 
             # Normalize if requested
-            if normalized and len(df) > 0:
-                base_price = df["price"].iloc[0]
-                df["normalized"] = (df["price"] / base_price - 1) * 100
-                plt.plot(
-                    df["timestamp"], 
-                    df["normalized"], 
-                    label=symbol,
-                    color=colors[i % len(colors)],
-                    linewidth=2
-                )
-            else:
-                plt.plot(
-                    df["timestamp"], 
-                    df["price"], 
-                    label=symbol,
-                    color=colors[i % len(colors)],
-                    linewidth=2
-                )
+            if normalized and len(price_arr) > 0:
+                price_arr = (np.divide(price_arr, price_arr[0]) - 1) * 100
+            segments.append(np.column_stack([x, price_arr]))
+        
+        # Stroke every token in a single collection
+        line_colors = [colors[i % len(colors)] for i in range(len(segments))]
+        ax.add_collection(LineCollection(segments, colors=line_colors, linewidths=2))
+        ax.autoscale_view()
         
         # Configure axes
-        plt.xlabel("Date")
+        ax.set_xlabel("Date")
         if normalized:
-            plt.ylabel("Percentage Change (%)")
-            plt.axhline(y=0, color="gray", linestyle="--", alpha=0.7)
+            ax.set_ylabel("Percentage Change (%)")
+            ax.axhline(y=0, color="gray", linestyle="--", alpha=0.7)
         else:
-            plt.ylabel("Price (USD)")
-            plt.gca().yaxis.set_major_formatter(FuncFormatter(self._money_formatter))
+            ax.set_ylabel("Price (USD)")
+            ax.yaxis.set_major_formatter(FuncFormatter(self._money_formatter))
         
         # Format x-axis dates
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-        plt.xticks(rotation=45)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
+        ax.tick_params(axis="x", labelrotation=45)
         
         # Add legend, title, and grid
-        plt.legend(loc="best")
+        ax.legend(
+            [Line2D([], [], color=color, linewidth=2) for color in line_colors],
+            symbols,
+            loc="best",
+        )
         if normalized:
-            plt.title(f"Price Performance Comparison - {days} Days (%)", fontsize=16)
+            ax.set_title(f"Price Performance Comparison - {days} Days (%)", fontsize=16)
         else:
-            plt.title(f"Price Comparison - {days} Days", fontsize=16)
+            ax.set_title(f"Price Comparison - {days} Days", fontsize=16)
             
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
         
         # Save the chart if requested
         output_path = ""
@@ -319,14 +666,11 @@ class TokenVisualizer:
             normalized_str = "normalized" if normalized else "absolute"
             filename = f"comparison_{symbols_str}_{days}d_{normalized_str}_{timestamp}.png"
             output_path = os.path.join(self.comparison_charts_dir, filename)
-            plt.savefig(output_path, dpi=300)
+            self._save_png(fig, output_path, dpi)
             logger.info(f"Comparison chart saved to {output_path}")
         
         # Show the chart if requested
-        if show:
-            plt.show()
-        else:
-            plt.close()
+        self._finish_fig(fig, show)
             
         return output_path
     
@@ -338,6 +682,8 @@ class TokenVisualizer:
         color_scheme: str = "pastel",
         save: bool = True,
         show: bool = False,
+        dpi: int = DEFAULT_DPI,
+        fmt: str = "svg",
     ) -> str:
         """Create a pie chart for portfolio distribution.
         
@@ -348,6 +694,8 @@ class TokenVisualizer:
             color_scheme: Color scheme name
             save: Whether to save the chart
             show: Whether to display the chart
+            dpi: Resolution of the saved PNG
+            fmt: Output format, "svg" or "png"
             
         Returns:
             Path to saved chart if save=True, else empty string
@@ -361,54 +709,42 @@ class TokenVisualizer:
             return ""
         
         # Get token percentages and values
-        tokens = []
-        percentages = []
-        values = []
-        for token, data in token_distribution.items():
-            tokens.append(token)
-            percentages.append(data.get("percentage", 0))
-            values.append(data.get("value_usd", 0))
+        n_tokens = len(token_distribution)
+        tokens = np.asarray(list(token_distribution), dtype=object)
+        percentages = np.fromiter(
+            (data.get("percentage", 0) for data in token_distribution.values()),
+            dtype=np.float32, count=n_tokens,
+        )
+        values = np.fromiter(
+            (data.get("value_usd", 0) for data in token_distribution.values()),
+            dtype=np.float32, count=n_tokens,
+        )
         
         # Group small percentages into 'Other'
         if min_pct > 0:
-            grouped_tokens = []
-            grouped_percentages = []
-            grouped_values = []
-            other_pct = 0
-            other_value = 0
-            
-            for token, pct, value in zip(tokens, percentages, values):
-                if pct >= min_pct:
-                    grouped_tokens.append(token)
-                    grouped_percentages.append(pct)
-                    grouped_values.append(value)
-                else:
-                    other_pct += pct
-                    other_value += value
+            small = percentages < min_pct
+            other_pct = percentages[small].sum()
+            other_value = values[small].sum()
+            tokens, percentages, values = tokens[~small], percentages[~small], values[~small]
             
             if other_pct > 0:
-                grouped_tokens.append("Other")
-                grouped_percentages.append(other_pct)
-                grouped_values.append(other_value)
-                
-            tokens = grouped_tokens
-            percentages = grouped_percentages
-            values = grouped_values
+                tokens = np.append(tokens, "Other")
+                percentages = np.append(percentages, other_pct)
+                values = np.append(values, other_value)
         
-        # Sort by percentage (descending)
-        sorted_indices = np.argsort(percentages)[::-1]
-        tokens = [tokens[i] for i in sorted_indices]
-        percentages = [percentages[i] for i in sorted_indices]
-        values = [values[i] for i in sorted_indices]
+        # Sort by percentage (descending) with one gather per array
+        order = np.argsort(-percentages, kind="stable")
+        tokens, percentages, values = tokens[order], percentages[order], values[order]
         
         # Create pie chart
-        plt.figure(figsize=(10, 8))
+        fig = self._get_fig("portfolio_pie", (10, 8), show, dpi)
+        ax = fig.add_subplot()
         colors = self.color_schemes.get(color_scheme, self.color_schemes["pastel"])
         
         # Plot the pie
-        wedges, texts, autotexts = plt.pie(
+        wedges, texts, autotexts = ax.pie(
             percentages, 
-            labels=tokens, 
+            labels=tokens.tolist(), 
             autopct="%1.1f%%",
             startangle=90,
             colors=colors,
@@ -422,12 +758,12 @@ class TokenVisualizer:
             autotext.set_weight("bold")
         
         # Add title and make circular
-        plt.title(title, fontsize=16, pad=20)
-        plt.axis("equal")
+        ax.set_title(title, fontsize=16, pad=20)
+        ax.axis("equal")
         
         # Add total value annotation
         total_value = portfolio_data.get("total_value_usd", 0)
-        plt.annotate(
+        ax.annotate(
             f"Total Value: ${total_value:,.2f}",
             xy=(0, 0),
             xytext=(0, -30),
@@ -437,22 +773,19 @@ class TokenVisualizer:
             bbox=dict(boxstyle="round,pad=0.5", fc="white", alpha=0.8)
         )
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the chart if requested
         output_path = ""
         if save:
             timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            filename = f"portfolio_distribution_{timestamp}.png"
+            filename = f"portfolio_distribution_{timestamp}.{fmt}"
             output_path = os.path.join(self.portfolio_charts_dir, filename)
-            plt.savefig(output_path, dpi=300)
+            self._save_sparse(fig, output_path, dpi, fmt)
             logger.info(f"Portfolio pie chart saved to {output_path}")
         
         # Show the chart if requested
-        if show:
-            plt.show()
-        else:
-            plt.close()
+        self._finish_fig(fig, show)
             
         return output_path
     
@@ -462,6 +795,7 @@ class TokenVisualizer:
         color_scheme: str = "deep",
         save: bool = True,
         show: bool = False,
+        dpi: int = DEFAULT_DPI,
     ) -> str:
         """Create a volatility comparison chart for multiple tokens.
         
@@ -470,6 +804,7 @@ class TokenVisualizer:
             color_scheme: Color scheme name
             save: Whether to save the chart
             show: Whether to display the chart
+            dpi: Resolution of the saved PNG
             
         Returns:
             Path to saved chart if save=True, else empty string
@@ -498,38 +833,37 @@ class TokenVisualizer:
             return ""
         
         # Create figure
-        plt.figure(figsize=(14, 8))
+        fig = self._get_fig("volatility", (14, 8), show, dpi)
+        ax = fig.add_subplot()
         colors = self.color_schemes.get(color_scheme, self.color_schemes["deep"])
         
         # Normalize market caps for bubble size (between 100 and 1000)
-        min_market_cap = min(market_caps)
-        max_market_cap = max(market_caps)
+        caps = np.asarray(market_caps, dtype=np.float64)
+        min_market_cap = caps.min()
+        max_market_cap = caps.max()
         
         if min_market_cap == max_market_cap:
             # Avoid division by zero
-            normalized_caps = [500] * len(market_caps)
+            normalized_caps = np.full_like(caps, 500.0)
         else:
-            normalized_caps = [
-                100 + (cap - min_market_cap) / (max_market_cap - min_market_cap) * 900
-                for cap in market_caps
-            ]
+            normalized_caps = 100.0 + (caps - min_market_cap) / (max_market_cap - min_market_cap) * 900.0
         
         # Create scatter plot
-        scatter = plt.scatter(
+        scatter = ax.scatter(
             volatilities,
             prices,
             s=normalized_caps,
-            c=colors[:len(symbols)],
+            c=[colors[i % len(colors)] for i in range(len(symbols))],
             alpha=0.7,
             edgecolors="white",
             linewidths=1,
         )
         
         # Add token labels
-        for i, symbol in enumerate(symbols):
-            plt.annotate(
+        for symbol, volatility, price in zip(symbols, volatilities, prices):
+            ax.annotate(
                 symbol,
-                (volatilities[i], prices[i]),
+                (volatility, price),
                 xytext=(5, 5),
                 textcoords="offset points",
                 fontsize=10,
@@ -537,16 +871,16 @@ class TokenVisualizer:
             )
         
         # Configure axes
-        plt.xlabel("30-Day Volatility", fontsize=12)
-        plt.ylabel("Current Price (USD)", fontsize=12)
-        plt.title("Token Volatility vs. Price Comparison", fontsize=16)
-        plt.grid(True, alpha=0.3)
+        ax.set_xlabel("30-Day Volatility", fontsize=12)
+        ax.set_ylabel("Current Price (USD)", fontsize=12)
+        ax.set_title("Token Volatility vs. Price Comparison", fontsize=16)
+        ax.grid(True, alpha=0.3)
         
         # Format y-axis as money
-        plt.gca().yaxis.set_major_formatter(FuncFormatter(self._money_formatter))
+        ax.yaxis.set_major_formatter(FuncFormatter(self._money_formatter))
         
         # Add legend for bubble size
-        sizes = [min(normalized_caps), (min(normalized_caps) + max(normalized_caps)) / 2, max(normalized_caps)]
+        sizes = [normalized_caps.min(), (normalized_caps.min() + normalized_caps.max()) / 2, normalized_caps.max()]
         labels = [
             f"${min_market_cap / 1e6:.1f}M",
             f"${(min_market_cap + max_market_cap) / 2 / 1e6:.1f}M",
@@ -555,11 +889,11 @@ class TokenVisualizer:
         
         # Create a legend for market cap sizes
         for size, label in zip(sizes, labels):
-            plt.scatter([], [], s=size, c="gray", alpha=0.7, edgecolors="white", linewidths=1, label=label)
+            ax.scatter([], [], s=size, c="gray", alpha=0.7, edgecolors="white", linewidths=1, label=label)
             
-        plt.legend(title="Market Cap", loc="upper right", frameon=True)
+        ax.legend(title="Market Cap", loc="upper right", frameon=True)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the chart if requested
         output_path = ""
@@ -571,33 +905,35 @@ class TokenVisualizer:
                 
             filename = f"volatility_comparison_{tokens_str}_{timestamp}.png"
             output_path = os.path.join(self.comparison_charts_dir, filename)
-            plt.savefig(output_path, dpi=300)
+            self._save_png(fig, output_path, dpi)
             logger.info(f"Volatility comparison chart saved to {output_path}")
         
         # Show the chart if requested
-        if show:
-            plt.show()
-        else:
-            plt.close()
+        self._finish_fig(fig, show)
             
         return output_path
     
     def create_price_correlation_heatmap(
         self,
-        data_frames: Dict[str, pd.DataFrame],
+        data_frames: Dict[str, Union[pd.DataFrame, SeriesArrays]],
         days: int = 30,
         color_scheme: str = "coolwarm",
         save: bool = True,
         show: bool = False,
+        dpi: int = DEFAULT_DPI,
+        fmt: str = "svg",
     ) -> str:
         """Create a price correlation heatmap for multiple tokens.
         
         Args:
             data_frames: Dict mapping token symbols to DataFrames with historical data
+                (or (timestamps, prices, volumes) array tuples)
             days: Number of days to analyze
             color_scheme: Color scheme name
             save: Whether to save the chart
             show: Whether to display the chart
+            dpi: Resolution of the saved PNG
+            fmt: Output format, "svg" or "png"
             
         Returns:
             Path to saved chart if save=True, else empty string
@@ -608,39 +944,53 @@ class TokenVisualizer:
             logger.warning("Need at least 2 tokens for correlation analysis")
             return ""
         
-        # Extract and align price data
-        aligned_data = {}
+        # Extract price data
+        symbols = list(data_frames.keys())
+        series = [_to_soa(data, days)[:2] for data in data_frames.values()]
         
-        for symbol, df in data_frames.items():
-            df = df.sort_values("timestamp").copy()
-            if len(df) > days:
-                df = df.tail(days)
-                
-            aligned_data[symbol] = pd.Series(df["price"].values, index=df["timestamp"])
+        # Interpolate every series onto a shared grid spanning the period all
+        # tokens overlap, so samples taken at different times still line up
+        if any(len(ts) < 2 for ts, _ in series):
+            logger.warning("Need at least 2 price points per token for correlation analysis")
+            return ""
+        t_start = max(int(ts[0].view(np.int64)) for ts, _ in series)
+        t_end = min(int(ts[-1].view(np.int64)) for ts, _ in series)
+        if t_start >= t_end:
+            logger.warning("Token price histories do not overlap; cannot compute correlation")
+            return ""
         
-        # Create a DataFrame with aligned timestamps
-        correlation_df = pd.DataFrame(aligned_data)
+        grid = np.linspace(t_start, t_end, max(days, 2))
+        aligned = np.empty((len(series), len(grid)), dtype=np.float32)
+        for row, (ts, prices) in enumerate(series):
+            aligned[row] = np.interp(grid, ts.view(np.int64), prices)
         
         # Calculate correlation matrix
-        corr_matrix = correlation_df.corr()
+        corr_matrix = pd.DataFrame(np.corrcoef(aligned), index=symbols, columns=symbols)
         
         # Create figure
-        plt.figure(figsize=(10, 8))
-        
-        # Create heatmap
-        sns.heatmap(
-            corr_matrix,
-            annot=True,
-            cmap=color_scheme,
-            linewidths=0.5,
-            vmin=-1,
-            vmax=1,
-            annot_kws={"size": 10},
-            fmt=".2f",
-        )
+        fig = self._get_fig("correlation", (10, 8), show, dpi)
+        ax = fig.add_subplot()
+        
+        # Create heatmap as a single image plus one label per cell
+        corr = corr_matrix.to_numpy()
+        n_tokens = len(symbols)
+        image = ax.imshow(corr, cmap=color_scheme, vmin=-1, vmax=1)
+        ax.set_xticks(range(n_tokens))
+        ax.set_yticks(range(n_tokens))
+        ax.set_xticklabels(symbols, rotation=45, ha="right")
+        ax.set_yticklabels(symbols)
+        ax.grid(False)
+        for i in range(n_tokens):
+            for j in range(n_tokens):
+                ax.text(
+                    j, i, f"{corr[i, j]:.2f}",
+                    ha="center", va="center", fontsize=10,
+                    color="white" if abs(corr[i, j]) > 0.5 else "black",
+                )
+        fig.colorbar(image, ax=ax)
         
-        plt.title(f"Price Correlation Matrix - {days} Days", fontsize=16)
-        plt.tight_layout()
+        ax.set_title(f"Price Correlation Matrix - {days} Days", fontsize=16)
+        fig.tight_layout()
         
         # Save the chart if requested
         output_path = ""
@@ -650,15 +1000,61 @@ class TokenVisualizer:
             if len(tokens_str) > 50:
                 tokens_str = f"{len(data_frames)}_tokens"
                 
-            filename = f"correlation_heatmap_{tokens_str}_{days}d_{timestamp}.png"
+            filename = f"correlation_heatmap_{tokens_str}_{days}d_{timestamp}.{fmt}"
             output_path = os.path.join(self.comparison_charts_dir, filename)
-            plt.savefig(output_path, dpi=300)
+            self._save_sparse(fig, output_path, dpi, fmt)
             logger.info(f"Correlation heatmap saved to {output_path}")
         
         # Show the chart if requested
-        if show:
-            plt.show()
-        else:
-            plt.close()
+        self._finish_fig(fig, show)
             
-        return output_path 
\ No newline at end of file
+        return output_path
+    
+    def create_charts_parallel(
+        self,
+        jobs: List[Tuple[str, Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+    ) -> List[str]:
+        """Render many independent charts across worker processes.
+        
+        Each job is rendered off-screen by a fresh visualizer writing to this
+        visualizer's output directory. Matplotlib is not thread-safe, so the
+        work is split across processes rather than threads.
+        
+        Args:
+            jobs: List of (method name, keyword arguments) pairs, e.g.
+                ("create_price_chart", {"historical_data": df, "symbol": "BTC"})
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Output paths in the same order as `jobs`
+        """
+        for method, _ in jobs:
+            if method not in BATCH_CHART_METHODS:
+                raise ValueError(f"Unsupported chart method: {method}")
+        
+        if not jobs:
+            return []
+        
+        logger.info(f"Rendering {len(jobs)} charts in parallel")
+        tasks = [(self.output_dir, method, {**kwargs, "show": False}) for method, kwargs in jobs]
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_render_worker) as executor:
+            return list(executor.map(_render_chart_job, tasks))
+
+
+def _init_render_worker() -> None:
+    """Switch a chart worker process to the non-interactive Agg backend."""
+    matplotlib.use("Agg", force=True)
+
+
+def _render_chart_job(task: Tuple[str, str, Dict[str, Any]]) -> str:
+    """Render a single chart job inside a worker process.
+    
+    Args:
+        task: Tuple of (output directory, chart method name, keyword arguments)
+        
+    Returns:
+        Path to the saved chart
+    """
+    output_dir, method, kwargs = task
+    return getattr(TokenVisualizer(output_dir=output_dir), method)(**kwargs)
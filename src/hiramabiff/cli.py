@@ -11,102 +11,138 @@ import argparse
 import sys
 import os
 import json
-import pandas as pd
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import re
+from pathlib import Path
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 
-from loguru import logger
+# Heavy third-party modules are imported by the commands that need them, so
+# `--help` and `--version` stay fast. `setup_logging` binds the loguru logger.
+logger = None
+
+# Maximum number of concurrent price-history requests per command
+MAX_CONCURRENT_FETCHES = 5
+
+# Logging configuration shared by every sink
+_LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
+_LEVELS = {True: "DEBUG", False: "INFO"}
+_FILE_KW = {"rotation": "10 MB", "retention": "1 week", "format": _LOG_FORMAT, "level": "DEBUG"}
+
+# Chain-specific wallet output, keyed by the lower-case chain name the wallet
+# manager stores (and the parsers normalize to)
+_CHAIN_FMT = {
+    "solana": lambda w: (f"Public Key: {w.get('public_key', 'N/A')}",),
+    "ethereum": lambda w: (f"Address: {w.get('address', 'N/A')}",),
+}
+_NO_CHAIN_FMT = lambda w: ()
+_PRIVATE_KEY_FIELD = {"solana": "private_key_b58", "ethereum": "private_key"}
+_BALANCE_FMT = {
+    "solana": lambda b: f"Balance: {b['sol_str']} SOL ({b['lamports']} lamports)",
+    "ethereum": lambda b: f"Balance: {b['eth_str']} ETH ({b['wei']} wei)",
+}
+
+# A `chain:address` argument of `token portfolio`
+_WALLET_ARG = re.compile(r"([^:]+):([^:]+)")
+
+# One token row of the `token portfolio` distribution
+_TOK_TMPL = "- {t}: {p:.2f}% (${v:,.2f})"
 
 # Add the src directory to the Python path if running directly
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.abspath(os.path.join(current_dir, "../.."))
-if os.path.basename(src_dir) == "src":
-    sys.path.insert(0, os.path.dirname(src_dir))
+_HERE = Path(__file__).resolve()
+current_dir = str(_HERE.parent)
+src_dir = str(_HERE.parents[2])
+if _HERE.parents[2].name == "src":
+    sys.path.insert(0, str(_HERE.parents[3]))
 
 try:
     from hiramabiff import __version__
-    from hiramabiff.agents import MinimalDeFiAgent
-    from hiramabiff.wallet import WalletManager
-    from hiramabiff.analysis import TokenTracker, LLMAnalyzer, TokenVisualizer
 except ImportError:
-    # If we're running the script directly, we need to modify the import paths
-    import importlib.util
-    
-    # Import MinimalDeFiAgent
-    minimal_agent_spec = importlib.util.spec_from_file_location(
-        "minimal_defi_agent", 
-        os.path.join(current_dir, "agents/minimal_defi_agent.py")
-    )
-    minimal_defi_agent = importlib.util.module_from_spec(minimal_agent_spec)
-    minimal_agent_spec.loader.exec_module(minimal_defi_agent)
-    MinimalDeFiAgent = minimal_defi_agent.MinimalDeFiAgent
-    
-    # Import WalletManager
-    wallet_spec = importlib.util.spec_from_file_location(
-        "wallet_manager",
-        os.path.join(current_dir, "wallet/wallet_manager.py")
-    )
-    wallet_module = importlib.util.module_from_spec(wallet_spec)
-    wallet_spec.loader.exec_module(wallet_module)
-    WalletManager = wallet_module.WalletManager
-    
-    # Import TokenTracker
-    token_spec = importlib.util.spec_from_file_location(
-        "token_tracker",
-        os.path.join(current_dir, "analysis/token_tracker.py")
-    )
-    token_module = importlib.util.module_from_spec(token_spec)
-    token_spec.loader.exec_module(token_module)
-    TokenTracker = token_module.TokenTracker
-    
-    # Import LLMAnalyzer
-    llm_spec = importlib.util.spec_from_file_location(
-        "llm_analyzer",
-        os.path.join(current_dir, "analysis/llm_analyzer.py")
-    )
-    llm_module = importlib.util.module_from_spec(llm_spec)
-    llm_spec.loader.exec_module(llm_module)
-    LLMAnalyzer = llm_module.LLMAnalyzer
+    __version__ = "0.1.0"  # Default version if not installed
+
+# Agent, wallet and analysis classes are loaded on first attribute access
+# (PEP 562), so each command only imports the modules it actually uses.
+# Maps name -> (package module, path relative to this file for direct runs)
+_LAZY_IMPORTS = {
+    "MinimalDeFiAgent": ("hiramabiff.agents.minimal_defi_agent", "agents/minimal_defi_agent.py"),
+    "WalletManager": ("hiramabiff.wallet.wallet_manager", "wallet/wallet_manager.py"),
+    "TokenTracker": ("hiramabiff.analysis.token_tracker", "analysis/token_tracker.py"),
+    "LLMAnalyzer": ("hiramabiff.analysis.llm_analyzer", "analysis/llm_analyzer.py"),
+    "TokenVisualizer": ("hiramabiff.analysis.visualizer", "analysis/visualizer.py"),
+}
+
+# This module, for resolving lazy names from inside functions (global name
+# lookups bypass the module-level __getattr__)
+_cli = sys.modules[__name__]
+
+
+@lru_cache(maxsize=None)
+def _load_from_path(relpath: str):
+    """Execute a module from a path relative to this file, at most once.
     
-    # Import TokenVisualizer
-    visualizer_spec = importlib.util.spec_from_file_location(
-        "token_visualizer",
-        os.path.join(current_dir, "analysis/visualizer.py")
-    )
-    visualizer_module = importlib.util.module_from_spec(visualizer_spec)
-    visualizer_spec.loader.exec_module(visualizer_module)
-    TokenVisualizer = visualizer_module.TokenVisualizer
+    Used when the script is run directly and the package is not importable.
+    The directory's FileFinder comes from `pkgutil.get_importer`, which keeps
+    it in `sys.path_importer_cache` for reuse.
     
-    __version__ = "0.1.0"  # Default version if not installed
+    Args:
+        relpath: Module path relative to this file
+        
+    Returns:
+        The loaded module
+    """
+    import importlib.util
+    import pkgutil
+    
+    directory, filename = os.path.split(relpath)
+    finder = pkgutil.get_importer(os.path.join(current_dir, directory))
+    spec = finder.find_spec(os.path.splitext(filename)[0])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def __getattr__(name: str):
+    """Import lazily loaded classes on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    
+    module_name, relpath = _LAZY_IMPORTS[name]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        # If we're running the script directly, load the module from its file
+        module = _load_from_path(relpath)
+    
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
 
 
-def setup_logging(verbose: bool = False) -> None:
+def setup_logging(verbose: bool = False, log_file: Optional[str] = None) -> None:
     """Configure logging for the CLI application.
     
     Args:
         verbose: Whether to enable verbose logging
+        log_file: Optional path for a rotated debug log file (loguru
+            placeholders such as `{time}` are supported)
     """
-    log_level = "DEBUG" if verbose else "INFO"
-    log_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
-    )
+    global logger
+    from loguru import logger
     
     # Remove default logger
     logger.remove()
     
     # Add stderr logger with appropriate level
-    logger.add(sys.stderr, format=log_format, level=log_level)
+    logger.add(sys.stderr, format=_LOG_FORMAT, level=_LEVELS[bool(verbose)])
     
-    # Add file logger
-    logger.add(
-        "hiramabiff_{time}.log",
-        rotation="10 MB", 
-        retention="1 week",
-        format=log_format,
-        level="DEBUG",
-    )
+    # Add file logger only when requested
+    if log_file:
+        logger.add(log_file, **_FILE_KW)
 
 
 async def run_yield_finder(
@@ -128,7 +164,7 @@ async def run_yield_finder(
     logger.info(f"Starting yield finder with chains: {chains}")
     
     # Create the agent
-    agent = MinimalDeFiAgent(
+    agent = _cli.MinimalDeFiAgent(
         name=agent_name,
         min_yield_threshold=min_yield,
         min_tvl_threshold=min_tvl,
@@ -144,460 +180,587 @@ async def run_yield_finder(
         logger.warning("No yield opportunities found matching the criteria")
 
 
-async def run_wallet_command(args) -> None:
-    """Run wallet-related commands.
+async def _wallet_create(args) -> None:
+    """Create a new wallet.
     
     Args:
         args: Command line arguments
     """
-    wallet_manager = WalletManager()
+    wallet_manager = _cli.WalletManager()
     
-    if args.wallet_command == "create":
-        try:
-            wallet_info = wallet_manager.create_wallet(args.chain, args.name)
-            print(f"\n✅ Wallet created successfully!")
-            print(f"Name: {wallet_info['name']}")
-            print(f"Chain: {wallet_info['chain']}")
-            
-            if args.chain.lower() == "solana":
-                print(f"Public Key: {wallet_info['public_key']}")
-                print(f"Private Key (keep secure!): {wallet_info['private_key_b58']}")
-            elif args.chain.lower() == "ethereum":
-                print(f"Address: {wallet_info['address']}")
-                print(f"Private Key (keep secure!): {wallet_info['private_key']}")
-                
-            print(f"\nWallet stored at: {os.path.join(wallet_manager.wallet_dir, f'{args.name}.json')}")
-                
-        except ValueError as e:
-            logger.error(f"Error creating wallet: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
+    try:
+        wallet_info = await wallet_manager.create_wallet_async(args.chain, args.name)
+        print(f"\n✅ Wallet created successfully!")
+        print(f"Name: {wallet_info['name']}")
+        print(f"Chain: {wallet_info['chain']}")
+        
+        for line in _CHAIN_FMT[args.chain](wallet_info):
+            print(line)
+        print(f"Private Key (keep secure!): {wallet_info[_PRIVATE_KEY_FIELD[args.chain]]}")
             
-    elif args.wallet_command == "import":
-        if not args.private_key:
-            logger.error("Private key is required for import")
-            print("\n❌ Error: Private key is required for import")
-            return
+        print(f"\nWallet stored at: {os.path.join(wallet_manager.wallet_dir, f'{args.name}.json')}")
             
-        try:
-            wallet_info = wallet_manager.import_wallet(args.chain, args.name, args.private_key)
-            print(f"\n✅ Wallet imported successfully!")
-            print(f"Name: {wallet_info['name']}")
-            print(f"Chain: {wallet_info['chain']}")
+    except ValueError as e:
+        logger.error(f"Error creating wallet: {str(e)}")
+        print(f"\n❌ Error: {str(e)}")
+
+
+async def _wallet_import(args) -> None:
+    """Import an existing wallet from its private key.
+    
+    Args:
+        args: Command line arguments
+    """
+    wallet_manager = _cli.WalletManager()
+    
+    if not args.private_key:
+        logger.error("Private key is required for import")
+        print("\n❌ Error: Private key is required for import")
+        return
+        
+    try:
+        wallet_info = await wallet_manager.import_wallet_async(args.chain, args.name, args.private_key)
+        print(f"\n✅ Wallet imported successfully!")
+        print(f"Name: {wallet_info['name']}")
+        print(f"Chain: {wallet_info['chain']}")
+        
+        for line in _CHAIN_FMT[args.chain](wallet_info):
+            print(line)
             
-            if args.chain.lower() == "solana":
-                print(f"Public Key: {wallet_info['public_key']}")
-            elif args.chain.lower() == "ethereum":
-                print(f"Address: {wallet_info['address']}")
-                
-            print(f"\nWallet stored at: {os.path.join(wallet_manager.wallet_dir, f'{args.name}.json')}")
-                
-        except ValueError as e:
-            logger.error(f"Error importing wallet: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
+        print(f"\nWallet stored at: {os.path.join(wallet_manager.wallet_dir, f'{args.name}.json')}")
             
-    elif args.wallet_command == "list":
-        wallets = wallet_manager.list_wallets()
+    except ValueError as e:
+        logger.error(f"Error importing wallet: {str(e)}")
+        print(f"\n❌ Error: {str(e)}")
+
+
+async def _wallet_list(args) -> None:
+    """List all stored wallets.
+    
+    Args:
+        args: Command line arguments
+    """
+    wallet_manager = _cli.WalletManager()
+    
+    wallets = await wallet_manager.list_wallets_async()
+    
+    if not wallets:
+        print("\nNo wallets found.")
+        return
         
-        if not wallets:
-            print("\nNo wallets found.")
-            return
-            
-        print("\n📋 Wallet List")
+    # Build the listing and write it in one call
+    lines = ["", "📋 Wallet List", "======================"]
+    
+    # Only the summary fields are read, so a narrower listing can drop in here
+    for name, chain, wallet in ((w["name"], w["chain"], w) for w in wallets):
+        lines += (
+            f"Name: {name}",
+            f"Chain: {chain}",
+            *_CHAIN_FMT.get(chain, _NO_CHAIN_FMT)(wallet),
+            "----------------------",
+        )
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def _wallet_balance(args) -> None:
+    """Show the balances of one or more stored wallets.
+    
+    Args:
+        args: Command line arguments
+    """
+    wallet_manager = _cli.WalletManager()
+    
+    if not args.name:
+        logger.error("Wallet name is required for balance check")
+        print("\n❌ Error: Wallet name is required for balance check")
+        return
+        
+    # All wallets are looked up concurrently
+    try:
+        balances = await wallet_manager.get_balances(args.name, use_cache=not args.no_cache)
+    finally:
+        # Release the shared RPC connections before the event loop shuts down
+        await wallet_manager.close()
+    
+    for balance_info in balances:
+        if "error" in balance_info:
+            logger.error(f"Error getting wallet balance: {balance_info['error']}")
+            print(f"\n❌ Error: {balance_info['error']}")
+            continue
+        
+        print(f"\n💰 Wallet Balance")
         print("======================")
+        print(f"Wallet: {balance_info['wallet']}")
+        print(f"Chain: {balance_info['chain']}")
         
-        for wallet in wallets:
-            print(f"Name: {wallet['name']}")
-            print(f"Chain: {wallet['chain']}")
-            
-            if wallet['chain'].lower() == "solana":
-                print(f"Public Key: {wallet.get('public_key', 'N/A')}")
-            elif wallet['chain'].lower() == "ethereum":
-                print(f"Address: {wallet.get('address', 'N/A')}")
-                
-            print("----------------------")
-            
-    elif args.wallet_command == "balance":
-        if not args.name:
-            logger.error("Wallet name is required for balance check")
-            print("\n❌ Error: Wallet name is required for balance check")
-            return
-            
-        try:
-            balance_info = await wallet_manager.get_balance(args.name)
-            
-            print(f"\n💰 Wallet Balance")
-            print("======================")
-            print(f"Wallet: {balance_info['wallet']}")
-            print(f"Chain: {balance_info['chain']}")
-            
-            if balance_info['chain'].lower() == "solana":
-                print(f"Address: {balance_info['address']}")
-                print(f"Balance: {balance_info['balance']['sol']} SOL ({balance_info['balance']['lamports']} lamports)")
-            elif balance_info['chain'].lower() == "ethereum":
-                print(f"Address: {balance_info['address']}")
-                print(f"Balance: {balance_info['balance']['eth']} ETH ({balance_info['balance']['wei']} wei)")
-                
-        except ValueError as e:
-            logger.error(f"Error getting wallet balance: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
-            
-    elif args.wallet_command == "delete":
-        if not args.name:
-            logger.error("Wallet name is required for deletion")
-            print("\n❌ Error: Wallet name is required for deletion")
-            return
-            
-        try:
-            result = wallet_manager.delete_wallet(args.name)
-            
-            if result:
-                print(f"\n✅ Wallet '{args.name}' deleted successfully.")
-            else:
-                print(f"\n❌ Wallet '{args.name}' not found.")
-                
-        except Exception as e:
-            logger.error(f"Error deleting wallet: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
+        balance_fmt = _BALANCE_FMT.get(balance_info['chain'])
+        if balance_fmt is not None:
+            print(f"Address: {balance_info['address']}")
+            print(balance_fmt(balance_info['balance']))
 
 
-async def run_token_command(args) -> None:
-    """Run token-related commands.
+async def _wallet_delete(args) -> None:
+    """Delete a stored wallet.
     
     Args:
         args: Command line arguments
     """
-    token_tracker = TokenTracker()
+    wallet_manager = _cli.WalletManager()
     
-    if args.token_command == "price":
-        try:
-            price_data = await token_tracker.get_token_price(args.symbol)
-            
-            print(f"\n💹 {price_data['symbol']} Price")
-            print("======================")
-            print(f"Price: ${price_data['price_usd']:.4f}")
-            print(f"Market Cap: ${price_data['market_cap_usd']:,.2f}")
-            print(f"24h Volume: ${price_data['volume_24h_usd']:,.2f}")
-            print(f"24h Change: {price_data['change_24h_percent']:.2f}%")
-            print(f"Last Updated: {price_data['last_updated']}")
-            
-        except ValueError as e:
-            logger.error(f"Error getting token price: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
-            
-    elif args.token_command == "analyze":
-        try:
-            print(f"\nAnalyzing {args.symbol}...")
-            analysis_data = await token_tracker.analyze_token(args.symbol)
-            
-            print(f"\n📊 {analysis_data['symbol']} Analysis")
-            print("======================")
-            print(f"Current Price: ${analysis_data['current_price_usd']:.4f}")
-            print(f"Market Cap: ${analysis_data['market_cap_usd']:,.2f}")
-            print(f"24h Change: {analysis_data['change_24h_percent']:.2f}%")
-            print(f"7d Change: {analysis_data['change_7d_percent']:.2f}%")
-            print("\n30-Day Statistics:")
-            print(f"- Average Price: ${analysis_data['stats']['mean_price_30d']:.4f}")
-            print(f"- Min Price: ${analysis_data['stats']['min_price_30d']:.4f}")
-            print(f"- Max Price: ${analysis_data['stats']['max_price_30d']:.4f}")
-            print(f"- Volatility: {analysis_data['stats']['volatility_30d']:.4f}")
-            print(f"\nAnalysis Date: {analysis_data['analysis_date']}")
+    if not args.name:
+        logger.error("Wallet name is required for deletion")
+        print("\n❌ Error: Wallet name is required for deletion")
+        return
+        
+    try:
+        result = wallet_manager.delete_wallet(args.name)
+        
+        if result:
+            print(f"\n✅ Wallet '{args.name}' deleted successfully.")
+        else:
+            print(f"\n❌ Wallet '{args.name}' not found.")
             
-            # Generate chart if requested
-            if args.chart:
-                print("\nGenerating price chart...")
-                visualizer = TokenVisualizer()
-                
-                # Get historical data
-                historical_data = await token_tracker.get_token_historical_data(args.symbol, days=args.days)
-                
-                # Convert to pandas DataFrame
-                df = pd.DataFrame(historical_data["price_data"])
-                
-                # Create chart
-                chart_path = visualizer.create_price_chart(
-                    df, 
-                    args.symbol,
-                    days=args.days,
-                    show_volume=True,
-                    show_ma=True,
-                    ma_periods=[7, 30],
-                    save=True,
-                    show=args.show
-                )
-                
-                print(f"\n✅ Chart saved to: {chart_path}")
+    except Exception as e:
+        logger.error(f"Error deleting wallet: {str(e)}")
+        print(f"\n❌ Error: {str(e)}")
+
+
+async def _yield_command(args) -> None:
+    """Run the yield finder with the `yield` command's options.
+    
+    Args:
+        args: Command line arguments
+    """
+    await run_yield_finder(
+        chains=args.chains,
+        min_yield=args.min_yield,
+        min_tvl=args.min_tvl,
+        max_results=args.max_results,
+        agent_name=args.name,
+    )
+
+
+def _chart_series(history):
+    """Turn cached history columns into the array tuple the visualizer plots.
+    
+    Args:
+        history: (epoch-ms timestamps, prices, market caps, volumes) arrays as
+            returned by `TokenTracker.get_token_historical_arrays`
             
-            # If --llm flag is set, use LLM to analyze the token
-            if args.llm:
-                print("\nGenerating LLM analysis (this may take a moment)...")
-                llm_analyzer = LLMAnalyzer()
-                llm_result = await llm_analyzer.analyze_token_data(analysis_data)
-                
-                print("\n🤖 LLM Analysis")
-                print("======================")
-                print(llm_result["llm_analysis"]["text"])
-                print(f"\nGenerated using {llm_result['llm_analysis']['model']} at {llm_result['llm_analysis']['generated_at']}")
+    Returns:
+        Tuple of (datetime64[ms] timestamps, prices, volumes) sharing the
+        original buffers
+    """
+    timestamps, prices, _, volumes = history
+    return timestamps.view("datetime64[ms]"), prices, volumes
+
+
+async def _token_price(args) -> None:
+    """Show the current price of a token.
+    
+    Args:
+        args: Command line arguments
+    """
+    token_tracker = _cli.TokenTracker()
+    
+    try:
+        price_data = await token_tracker.get_token_price(args.symbol)
+        
+        print(f"\n💹 {price_data['symbol']} Price")
+        print("======================")
+        print(f"Price: ${price_data['price_usd']:.4f}")
+        print(f"Market Cap: ${price_data['market_cap_usd']:,.2f}")
+        print(f"24h Volume: ${price_data['volume_24h_usd']:,.2f}")
+        print(f"24h Change: {price_data['change_24h_percent']:.2f}%")
+        print(f"Last Updated: {price_data['last_updated']}")
+        
+    except ValueError as e:
+        logger.error(f"Error getting token price: {str(e)}")
+        print(f"\n❌ Error: {str(e)}")
+
+
+async def _token_analyze(args) -> None:
+    """Analyze a token, optionally with a chart and LLM insights.
+    
+    Args:
+        args: Command line arguments
+    """
+    token_tracker = _cli.TokenTracker()
+    
+    try:
+        print(f"\nAnalyzing {args.symbol}...")
+        analysis_data = await token_tracker.analyze_token(args.symbol)
+        
+        print(f"\n📊 {analysis_data['symbol']} Analysis")
+        print("======================")
+        print(f"Current Price: ${analysis_data['current_price_usd']:.4f}")
+        print(f"Market Cap: ${analysis_data['market_cap_usd']:,.2f}")
+        print(f"24h Change: {analysis_data['change_24h_percent']:.2f}%")
+        print(f"7d Change: {analysis_data['change_7d_percent']:.2f}%")
+        print("\n30-Day Statistics:")
+        print(f"- Average Price: ${analysis_data['stats']['mean_price_30d']:.4f}")
+        print(f"- Min Price: ${analysis_data['stats']['min_price_30d']:.4f}")
+        print(f"- Max Price: ${analysis_data['stats']['max_price_30d']:.4f}")
+        print(f"- Volatility: {analysis_data['stats']['volatility_30d']:.4f}")
+        print(f"\nAnalysis Date: {analysis_data['analysis_date']}")
+        
+        # Generate chart if requested
+        if args.chart:
+            print("\nGenerating price chart...")
+            visualizer = _cli.TokenVisualizer()
             
-        except ValueError as e:
-            logger.error(f"Error analyzing token: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
+            # Get historical data as plain arrays
+            history = await token_tracker.get_token_historical_arrays(args.symbol, days=args.days)
             
-    elif args.token_command == "portfolio":
-        try:
-            # Parse the wallet addresses from the input
-            wallets = {}
-            for wallet_str in args.wallets:
-                try:
-                    chain, address = wallet_str.split(":")
-                    wallets[chain] = address
-                except ValueError:
-                    logger.error(f"Invalid wallet format: {wallet_str}. Use 'chain:address'")
-                    print(f"\n❌ Error: Invalid wallet format: {wallet_str}. Use 'chain:address'")
-                    return
+            # Create chart
+            chart_path = visualizer.create_price_chart(
+                _chart_series(history), 
+                args.symbol,
+                days=args.days,
+                show_volume=True,
+                show_ma=True,
+                ma_periods=[7, 30],
+                save=True,
+                show=args.show
+            )
             
-            print(f"\nAnalyzing portfolio across {len(wallets)} wallets...")
-            portfolio_data = await token_tracker.generate_portfolio_analysis(wallets)
+            print(f"\n✅ Chart saved to: {chart_path}")
+        
+        # If --llm flag is set, use LLM to analyze the token
+        if args.llm:
+            print("\nGenerating LLM analysis (this may take a moment)...")
+            llm_analyzer = _cli.LLMAnalyzer()
+            llm_result = await llm_analyzer.analyze_token_data(analysis_data)
             
-            print(f"\n📈 Portfolio Analysis")
+            print("\n🤖 LLM Analysis")
             print("======================")
-            print(f"Total Value: ${portfolio_data['total_value_usd']:,.2f}")
-            
-            print("\nToken Distribution:")
-            for token, info in portfolio_data.get('token_distribution', {}).items():
-                print(f"- {token}: {info.get('percentage', 0):.2f}% (${info.get('value_usd', 0):,.2f})")
-                
-            print(f"\nGenerated at: {portfolio_data['generated_at']}")
-            
-            # Generate pie chart if requested
-            if args.chart:
-                print("\nGenerating portfolio distribution chart...")
-                visualizer = TokenVisualizer()
-                
-                chart_path = visualizer.create_portfolio_pie_chart(
-                    portfolio_data,
-                    title=f"Portfolio Distribution - {datetime.now().strftime('%Y-%m-%d')}",
-                    min_pct=2.0,
-                    save=True,
-                    show=args.show
-                )
-                
-                print(f"\n✅ Chart saved to: {chart_path}")
-            
-            # If --llm flag is set, use LLM to generate a portfolio report
-            if args.llm:
-                print("\nGenerating LLM portfolio report (this may take a moment)...")
-                
-                # Get market overview for context
-                try:
-                    btc_price = await token_tracker.get_token_price("bitcoin")
-                    eth_price = await token_tracker.get_token_price("ethereum")
-                    
-                    market_overview = {
-                        "btc_price": btc_price["price_usd"],
-                        "eth_price": eth_price["price_usd"],
-                        "market_trend": "Bullish" if btc_price["change_24h_percent"] > 0 else "Bearish",
-                    }
-                except Exception as e:
-                    logger.warning(f"Could not get market overview: {str(e)}")
-                    market_overview = None
-                
-                llm_analyzer = LLMAnalyzer()
-                report = await llm_analyzer.generate_portfolio_report(portfolio_data, market_overview)
-                
-                print("\n🤖 LLM Portfolio Report")
-                print("======================")
-                print(report["llm_report"]["text"])
-                print(f"\nGenerated using {report['llm_report']['model']} at {report['llm_report']['generated_at']}")
-            
-        except ValueError as e:
-            logger.error(f"Error analyzing portfolio: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
-            
-    elif args.token_command == "compare":
-        try:
-            visualizer = TokenVisualizer()
-            
-            print(f"\nComparing tokens: {', '.join(args.symbols)}...")
-            
-            # Get historical data for each token
-            data_frames = {}
-            for symbol in args.symbols:
-                print(f"Fetching data for {symbol}...")
-                historical_data = await token_tracker.get_token_historical_data(symbol, days=args.days)
-                df = pd.DataFrame(historical_data["price_data"])
-                data_frames[symbol] = df
+            print(llm_result["llm_analysis"]["text"])
+            print(f"\nGenerated using {llm_result['llm_analysis']['model']} at {llm_result['llm_analysis']['generated_at']}")
+        
+    except ValueError as e:
+        logger.error(f"Error analyzing token: {str(e)}")
+        print(f"\n❌ Error: {str(e)}")
+
+
+async def _token_portfolio(args) -> None:
+    """Analyze the token portfolio held across wallets.
+    
+    Args:
+        args: Command line arguments
+    """
+    token_tracker = _cli.TokenTracker()
+    
+    try:
+        # Parse the wallet addresses from the input
+        matches = [_WALLET_ARG.fullmatch(wallet_str) for wallet_str in args.wallets]
+        if not all(matches):
+            wallet_str = args.wallets[matches.index(None)]
+            logger.error(f"Invalid wallet format: {wallet_str}. Use 'chain:address'")
+            print(f"\n❌ Error: Invalid wallet format: {wallet_str}. Use 'chain:address'")
+            return
+        
+        wallets = dict(match.groups() for match in matches)
+        
+        print(f"\nAnalyzing portfolio across {len(wallets)} wallets...")
+        portfolio_data = await token_tracker.generate_portfolio_analysis(wallets)
+        
+        lines = [
+            "",
+            "📈 Portfolio Analysis",
+            "======================",
+            f"Total Value: ${portfolio_data['total_value_usd']:,.2f}",
+            "",
+            "Token Distribution:",
+        ]
+        lines.extend(
+            _TOK_TMPL.format(t=token, p=info.get('percentage', 0), v=info.get('value_usd', 0))
+            for token, info in portfolio_data.get('token_distribution', {}).items()
+        )
+        
+        lines.append("")
+        lines.append(f"Generated at: {portfolio_data['generated_at']}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        # Generate pie chart if requested
+        if args.chart:
+            print("\nGenerating portfolio distribution chart...")
+            from datetime import datetime
+            visualizer = _cli.TokenVisualizer()
             
-            # Create comparison chart
-            print("Generating comparison chart...")
-            chart_path = visualizer.create_multi_token_chart(
-                data_frames,
-                days=args.days,
-                normalized=args.normalized,
+            chart_path = visualizer.create_portfolio_pie_chart(
+                portfolio_data,
+                title=f"Portfolio Distribution - {datetime.now().strftime('%Y-%m-%d')}",
+                min_pct=2.0,
                 save=True,
                 show=args.show
             )
             
             print(f"\n✅ Chart saved to: {chart_path}")
+        
+        # If --llm flag is set, use LLM to generate a portfolio report
+        if args.llm:
+            print("\nGenerating LLM portfolio report (this may take a moment)...")
             
-            # Generate correlation heatmap if requested
-            if args.correlation:
-                print("Generating correlation heatmap...")
-                corr_path = visualizer.create_price_correlation_heatmap(
-                    data_frames,
-                    days=args.days,
-                    save=True,
-                    show=args.show
-                )
+            # Get market overview for context. Ask by symbol so the prices
+            # the portfolio analysis already fetched come from the tracker's cache
+            try:
+                prices = await token_tracker.get_token_prices(("BTC", "ETH"))
+                btc_price, eth_price = prices["BTC"], prices["ETH"]
                 
-                print(f"\n✅ Correlation heatmap saved to: {corr_path}")
-            
-        except ValueError as e:
-            logger.error(f"Error comparing tokens: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
-            
-    elif args.token_command == "volatility":
-        try:
-            visualizer = TokenVisualizer()
+                market_overview = {
+                    "btc_price": btc_price["price_usd"],
+                    "eth_price": eth_price["price_usd"],
+                    "market_trend": "Bullish" if btc_price["change_24h_percent"] > 0 else "Bearish",
+                }
+            except Exception as e:
+                logger.warning(f"Could not get market overview: {str(e)}")
+                market_overview = None
             
-            print(f"\nAnalyzing volatility for: {', '.join(args.symbols)}...")
+            llm_analyzer = _cli.LLMAnalyzer()
+            report = await llm_analyzer.generate_portfolio_report(portfolio_data, market_overview)
             
-            # Get and analyze each token
-            token_analyses = {}
-            for symbol in args.symbols:
-                print(f"Analyzing {symbol}...")
-                analysis_data = await token_tracker.analyze_token(symbol)
-                token_analyses[symbol] = analysis_data
-            
-            # Create volatility comparison chart
-            print("Generating volatility comparison chart...")
-            chart_path = visualizer.create_volatility_comparison(
-                token_analyses,
+            print("\n🤖 LLM Portfolio Report")
+            print("======================")
+            print(report["llm_report"]["text"])
+            print(f"\nGenerated using {report['llm_report']['model']} at {report['llm_report']['generated_at']}")
+        
+    except ValueError as e:
+        logger.error(f"Error analyzing portfolio: {str(e)}")
+        print(f"\n❌ Error: {str(e)}")
+
+
+async def _token_compare(args) -> None:
+    """Compare the price history of several tokens.
+    
+    Args:
+        args: Command line arguments
+    """
+    token_tracker = _cli.TokenTracker()
+    
+    try:
+        visualizer = _cli.TokenVisualizer()
+        
+        print(f"\nComparing tokens: {', '.join(args.symbols)}...")
+        
+        # Get historical data for all tokens concurrently, a few at a time
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        
+        async def fetch_history(symbol: str):
+            async with semaphore:
+                print(f"Fetching data for {symbol}...")
+                return await token_tracker.get_token_historical_arrays(symbol, days=args.days)
+        
+        results = await asyncio.gather(
+            *(fetch_history(symbol) for symbol in args.symbols), return_exceptions=True
+        )
+        
+        series = {}
+        for symbol, result in zip(args.symbols, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Could not fetch data for {symbol}: {str(result)}")
+            else:
+                series[symbol] = _chart_series(result)
+        
+        # Create comparison chart
+        print("Generating comparison chart...")
+        chart_path = visualizer.create_multi_token_chart(
+            series,
+            days=args.days,
+            normalized=args.normalized,
+            save=True,
+            show=args.show
+        )
+        
+        print(f"\n✅ Chart saved to: {chart_path}")
+        
+        # Generate correlation heatmap if requested
+        if args.correlation:
+            print("Generating correlation heatmap...")
+            corr_path = visualizer.create_price_correlation_heatmap(
+                series,
+                days=args.days,
                 save=True,
                 show=args.show
             )
             
-            print(f"\n✅ Chart saved to: {chart_path}")
-            
-        except ValueError as e:
-            logger.error(f"Error analyzing volatility: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
+            print(f"\n✅ Correlation heatmap saved to: {corr_path}")
+        
+    except ValueError as e:
+        logger.error(f"Error comparing tokens: {str(e)}")
+        print(f"\n❌ Error: {str(e)}")
 
 
-async def run_llm_command(args) -> None:
-    """Run LLM-related commands.
+async def _token_volatility(args) -> None:
+    """Compare the volatility of several tokens.
     
     Args:
         args: Command line arguments
     """
-    llm_analyzer = LLMAnalyzer()
+    token_tracker = _cli.TokenTracker()
     
-    if args.llm_command == "market":
-        try:
-            print("\nGenerating market analysis (this may take a moment)...")
-            market_analysis = await llm_analyzer.analyze_market_trend()
-            
-            print("\n🌍 Market Analysis")
-            print("======================")
-            print(market_analysis["llm_analysis"]["text"])
-            print(f"\nGenerated using {market_analysis['llm_analysis']['model']} at {market_analysis['llm_analysis']['generated_at']}")
-            
-            # If output file is specified, save markdown version to file
-            if args.output:
-                output_path = args.output
-                if not output_path.endswith(".md"):
-                    output_path += ".md"
-                    
-                with open(output_path, "w") as f:
-                    f.write("# Cryptocurrency Market Analysis\n\n")
-                    f.write(f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    f.write(market_analysis["llm_analysis"]["text"])
-                    f.write(f"\n\n---\n*Generated by HiramAbiff v{__version__} using {market_analysis['llm_analysis']['model']}*")
-                    
-                print(f"\nAnalysis saved to {output_path}")
+    try:
+        visualizer = _cli.TokenVisualizer()
+        
+        print(f"\nAnalyzing volatility for: {', '.join(args.symbols)}...")
+        
+        # Analyze all tokens in one concurrent batch; symbols that fail are skipped
+        token_analyses = await token_tracker.analyze_tokens(args.symbols)
+        if not token_analyses:
+            print("\n❌ Error: No token data could be fetched")
+            return
+        
+        # Create volatility comparison chart
+        print("Generating volatility comparison chart...")
+        chart_path = visualizer.create_volatility_comparison(
+            token_analyses,
+            save=True,
+            show=args.show
+        )
+        
+        print(f"\n✅ Chart saved to: {chart_path}")
+        
+    except ValueError as e:
+        logger.error(f"Error analyzing volatility: {str(e)}")
+        print(f"\n❌ Error: {str(e)}")
+
+
+async def _llm_market(args) -> None:
+    """Generate a market analysis using the LLM.
+    
+    Args:
+        args: Command line arguments
+    """
+    from datetime import datetime
+    
+    llm_analyzer = _cli.LLMAnalyzer()
+    
+    try:
+        print("\nGenerating market analysis (this may take a moment)...")
+        market_analysis = await llm_analyzer.analyze_market_trend()
+        
+        print("\n🌍 Market Analysis")
+        print("======================")
+        print(market_analysis["llm_analysis"]["text"])
+        print(f"\nGenerated using {market_analysis['llm_analysis']['model']} at {market_analysis['llm_analysis']['generated_at']}")
+        
+        # If output file is specified, save markdown version to file
+        if args.output:
+            output_path = args.output
+            if not output_path.endswith(".md"):
+                output_path += ".md"
                 
-        except ValueError as e:
-            logger.error(f"Error generating market analysis: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
-            
-    elif args.llm_command == "strategy":
-        try:
-            # First, get yield opportunities using the MinimalDeFiAgent
-            print("\nFetching DeFi opportunities...")
-            
-            agent = MinimalDeFiAgent(
-                name="StrategyAdvisor",
-                min_yield_threshold=args.min_yield,
-                min_tvl_threshold=args.min_tvl,
-                max_opportunities=args.max_opportunities,
+            Path(output_path).write_text(
+                "# Cryptocurrency Market Analysis\n\n"
+                f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                f"{market_analysis['llm_analysis']['text']}"
+                f"\n\n---\n*Generated by HiramAbiff v{__version__} using {market_analysis['llm_analysis']['model']}*",
+                encoding="utf-8",
             )
             
-            opportunities = await agent.run(chains=args.chains)
+            print(f"\nAnalysis saved to {output_path}")
             
-            if not opportunities:
-                print("\n❌ No opportunities found matching the criteria.")
-                return
-                
-            print(f"\nFound {len(opportunities)} opportunities matching the criteria.")
-            print("\nGenerating investment strategy (this may take a moment)...")
+    except ValueError as e:
+        logger.error(f"Error generating market analysis: {str(e)}")
+        print(f"\n❌ Error: {str(e)}")
+
+
+async def _llm_strategy(args) -> None:
+    """Generate a DeFi investment strategy using the LLM.
+    
+    Args:
+        args: Command line arguments
+    """
+    from datetime import datetime
+    
+    llm_analyzer = _cli.LLMAnalyzer()
+    
+    try:
+        # First, get yield opportunities using the MinimalDeFiAgent
+        print("\nFetching DeFi opportunities...")
+        
+        agent = _cli.MinimalDeFiAgent(
+            name="StrategyAdvisor",
+            min_yield_threshold=args.min_yield,
+            min_tvl_threshold=args.min_tvl,
+            max_opportunities=args.max_opportunities,
+        )
+        
+        opportunities = await agent.run(chains=args.chains)
+        
+        if not opportunities:
+            print("\n❌ No opportunities found matching the criteria.")
+            return
             
-            strategy = await llm_analyzer.generate_defi_strategy(
-                opportunities,
-                risk_profile=args.risk_profile,
-                investment_amount=args.amount,
+        print(f"\nFound {len(opportunities)} opportunities matching the criteria.")
+        print("\nGenerating investment strategy (this may take a moment)...")
+        
+        strategy = await llm_analyzer.generate_defi_strategy(
+            opportunities,
+            risk_profile=args.risk_profile,
+            investment_amount=args.amount,
+        )
+        
+        print("\n💼 DeFi Investment Strategy")
+        print("======================")
+        print(strategy["llm_strategy"]["text"])
+        print(f"\nGenerated using {strategy['llm_strategy']['model']} at {strategy['llm_strategy']['generated_at']}")
+        
+        # If output file is specified, save markdown version to file
+        if args.output:
+            output_path = args.output
+            if not output_path.endswith(".md"):
+                output_path += ".md"
+                
+            Path(output_path).write_text(
+                f"# DeFi Investment Strategy ({args.risk_profile.title()} Risk)\n\n"
+                f"Investment Amount: ${args.amount:,.2f}\n\n"
+                f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                f"{strategy['llm_strategy']['text']}"
+                f"\n\n---\n*Generated by HiramAbiff v{__version__} using {strategy['llm_strategy']['model']}*",
+                encoding="utf-8",
             )
             
-            print("\n💼 DeFi Investment Strategy")
-            print("======================")
-            print(strategy["llm_strategy"]["text"])
-            print(f"\nGenerated using {strategy['llm_strategy']['model']} at {strategy['llm_strategy']['generated_at']}")
+            print(f"\nStrategy saved to {output_path}")
             
-            # If output file is specified, save markdown version to file
-            if args.output:
-                output_path = args.output
-                if not output_path.endswith(".md"):
-                    output_path += ".md"
-                    
-                with open(output_path, "w") as f:
-                    f.write(f"# DeFi Investment Strategy ({args.risk_profile.title()} Risk)\n\n")
-                    f.write(f"Investment Amount: ${args.amount:,.2f}\n\n")
-                    f.write(f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    f.write(strategy["llm_strategy"]["text"])
-                    f.write(f"\n\n---\n*Generated by HiramAbiff v{__version__} using {strategy['llm_strategy']['model']}*")
-                    
-                print(f"\nStrategy saved to {output_path}")
-                
-        except ValueError as e:
-            logger.error(f"Error generating investment strategy: {str(e)}")
-            print(f"\n❌ Error: {str(e)}")
+    except ValueError as e:
+        logger.error(f"Error generating investment strategy: {str(e)}")
+        print(f"\n❌ Error: {str(e)}")
 
 
-def main() -> None:
-    """Main entry point for the CLI."""
-    parser = argparse.ArgumentParser(
-        description=f"HiramAbiff DeFi Agent CLI v{__version__}",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
+def _add_parsers(subparsers, builders: Dict[str, Any], name: Optional[str]) -> None:
+    """Build only the named parser, or all of them if the name is not known.
     
-    parser.add_argument(
-        "--version", "-v", 
-        action="version", 
-        version=f"HiramAbiff v{__version__}"
-    )
-    
-    parser.add_argument(
-        "--verbose", 
-        action="store_true", 
-        help="Enable verbose logging"
-    )
+    Building every parser for `--help` or a mistyped name keeps usage
+    listings and "invalid choice" errors complete.
     
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    Args:
+        subparsers: Subparsers action to add to
+        builders: Mapping of command name to parser builder
+        name: Command name from the command line, if any
+    """
+    if name in builders:
+        builders[name](subparsers)
+    else:
+        for build_parser in builders.values():
+            build_parser(subparsers)
+
+
+def _build_yield_parser(subparsers, subcommand: Optional[str] = None) -> None:
+    """Add the `yield` command parser.
     
+    Args:
+        subparsers: Root subparsers action
+        subcommand: Unused; `yield` has no subcommands
+    """
     # Yield finder command
     yield_parser = subparsers.add_parser(
         "yield", 
         help="Find the best yield opportunities"
     )
     
+    yield_parser.set_defaults(func=_yield_command)
+    
     yield_parser.add_argument(
         "--chains", "-c",
         nargs="+",
@@ -631,28 +794,26 @@ def main() -> None:
         default="YieldHunter",
         help="Name for the agent",
     )
+
+
+def _build_wallet_create_parser(subparsers) -> None:
+    """Add the `wallet create` subcommand parser.
     
-    # Wallet management command
-    wallet_parser = subparsers.add_parser(
-        "wallet", 
-        help="Manage cryptocurrency wallets"
-    )
-    
-    wallet_subparsers = wallet_parser.add_subparsers(
-        dest="wallet_command",
-        help="Wallet command to run",
-        required=True
-    )
-    
+    Args:
+        subparsers: `wallet` subparsers action
+    """
     # Create wallet command
-    create_parser = wallet_subparsers.add_parser(
+    create_parser = subparsers.add_parser(
         "create", 
         help="Create a new wallet"
     )
     
+    create_parser.set_defaults(func=_wallet_create)
+    
     create_parser.add_argument(
         "chain",
-        choices=["solana", "ethereum", "Solana", "Ethereum"],
+        type=str.lower,
+        choices=["solana", "ethereum"],
         help="Blockchain for the wallet",
     )
     
@@ -660,16 +821,26 @@ def main() -> None:
         "name",
         help="Name for the wallet",
     )
+
+
+def _build_wallet_import_parser(subparsers) -> None:
+    """Add the `wallet import` subcommand parser.
     
+    Args:
+        subparsers: `wallet` subparsers action
+    """
     # Import wallet command
-    import_parser = wallet_subparsers.add_parser(
+    import_parser = subparsers.add_parser(
         "import", 
         help="Import an existing wallet"
     )
     
+    import_parser.set_defaults(func=_wallet_import)
+    
     import_parser.add_argument(
         "chain",
-        choices=["solana", "ethereum", "Solana", "Ethereum"],
+        type=str.lower,
+        choices=["solana", "ethereum"],
         help="Blockchain for the wallet",
     )
     
@@ -682,64 +853,136 @@ def main() -> None:
         "private_key",
         help="Private key for the wallet",
     )
+
+
+def _build_wallet_list_parser(subparsers) -> None:
+    """Add the `wallet list` subcommand parser.
     
+    Args:
+        subparsers: `wallet` subparsers action
+    """
     # List wallets command
-    list_parser = wallet_subparsers.add_parser(
+    list_parser = subparsers.add_parser(
         "list", 
         help="List all wallets"
     )
     
+    list_parser.set_defaults(func=_wallet_list)
+
+
+def _build_wallet_balance_parser(subparsers) -> None:
+    """Add the `wallet balance` subcommand parser.
+    
+    Args:
+        subparsers: `wallet` subparsers action
+    """
     # Get wallet balance command
-    balance_parser = wallet_subparsers.add_parser(
+    balance_parser = subparsers.add_parser(
         "balance", 
         help="Get wallet balance"
     )
     
+    balance_parser.set_defaults(func=_wallet_balance)
+    
     balance_parser.add_argument(
         "name",
-        help="Name of the wallet",
+        nargs="+",
+        help="Name of the wallet (several names are looked up concurrently)",
     )
     
+    balance_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the chain instead of reusing a balance fetched seconds ago",
+    )
+
+
+def _build_wallet_delete_parser(subparsers) -> None:
+    """Add the `wallet delete` subcommand parser.
+    
+    Args:
+        subparsers: `wallet` subparsers action
+    """
     # Delete wallet command
-    delete_parser = wallet_subparsers.add_parser(
+    delete_parser = subparsers.add_parser(
         "delete", 
         help="Delete a wallet"
     )
     
+    delete_parser.set_defaults(func=_wallet_delete)
+    
     delete_parser.add_argument(
         "name",
         help="Name of the wallet to delete",
     )
+
+
+def _build_wallet_parser(subparsers, subcommand: Optional[str] = None) -> None:
+    """Add the `wallet` command parser and its subcommands.
     
-    # Token tracking command
-    token_parser = subparsers.add_parser(
-        "token", 
-        help="Track and analyze tokens"
+    Args:
+        subparsers: Root subparsers action
+        subcommand: Subcommand being invoked, if known; only its parser is built
+    """
+    # Wallet management command
+    wallet_parser = subparsers.add_parser(
+        "wallet", 
+        help="Manage cryptocurrency wallets"
     )
     
-    token_subparsers = token_parser.add_subparsers(
-        dest="token_command",
-        help="Token command to run",
+    wallet_subparsers = wallet_parser.add_subparsers(
+        dest="wallet_command",
+        help="Wallet command to run",
         required=True
     )
     
+    _add_parsers(wallet_subparsers, _WALLET_PARSER_BUILDERS, subcommand)
+
+
+# Builders for each `wallet` subcommand
+_WALLET_PARSER_BUILDERS = {
+    "create": _build_wallet_create_parser,
+    "import": _build_wallet_import_parser,
+    "list": _build_wallet_list_parser,
+    "balance": _build_wallet_balance_parser,
+    "delete": _build_wallet_delete_parser,
+}
+
+
+def _build_token_price_parser(subparsers) -> None:
+    """Add the `token price` subcommand parser.
+    
+    Args:
+        subparsers: `token` subparsers action
+    """
     # Get token price command
-    price_parser = token_subparsers.add_parser(
+    price_parser = subparsers.add_parser(
         "price", 
         help="Get token price"
     )
     
+    price_parser.set_defaults(func=_token_price)
+    
     price_parser.add_argument(
         "symbol",
         help="Token symbol (e.g., BTC, ETH, SOL)",
     )
+
+
+def _build_token_analyze_parser(subparsers) -> None:
+    """Add the `token analyze` subcommand parser.
     
+    Args:
+        subparsers: `token` subparsers action
+    """
     # Analyze token command
-    analyze_parser = token_subparsers.add_parser(
+    analyze_parser = subparsers.add_parser(
         "analyze", 
         help="Analyze token data"
     )
     
+    analyze_parser.set_defaults(func=_token_analyze)
+    
     analyze_parser.add_argument(
         "symbol",
         help="Token symbol (e.g., BTC, ETH, SOL)",
@@ -769,13 +1012,22 @@ def main() -> None:
         action="store_true",
         help="Show chart (requires GUI)",
     )
+
+
+def _build_token_portfolio_parser(subparsers) -> None:
+    """Add the `token portfolio` subcommand parser.
     
+    Args:
+        subparsers: `token` subparsers action
+    """
     # Portfolio analysis command
-    portfolio_parser = token_subparsers.add_parser(
+    portfolio_parser = subparsers.add_parser(
         "portfolio", 
         help="Analyze token portfolio"
     )
     
+    portfolio_parser.set_defaults(func=_token_portfolio)
+    
     portfolio_parser.add_argument(
         "wallets",
         nargs="+",
@@ -799,13 +1051,22 @@ def main() -> None:
         action="store_true",
         help="Show chart (requires GUI)",
     )
+
+
+def _build_token_compare_parser(subparsers) -> None:
+    """Add the `token compare` subcommand parser.
     
+    Args:
+        subparsers: `token` subparsers action
+    """
     # Compare tokens command
-    compare_parser = token_subparsers.add_parser(
+    compare_parser = subparsers.add_parser(
         "compare", 
         help="Compare multiple tokens"
     )
     
+    compare_parser.set_defaults(func=_token_compare)
+    
     compare_parser.add_argument(
         "symbols",
         nargs="+",
@@ -836,13 +1097,22 @@ def main() -> None:
         action="store_true",
         help="Show charts (requires GUI)",
     )
+
+
+def _build_token_volatility_parser(subparsers) -> None:
+    """Add the `token volatility` subcommand parser.
     
+    Args:
+        subparsers: `token` subparsers action
+    """
     # Volatility comparison command
-    volatility_parser = token_subparsers.add_parser(
+    volatility_parser = subparsers.add_parser(
         "volatility", 
         help="Compare token volatility"
     )
     
+    volatility_parser.set_defaults(func=_token_volatility)
+    
     volatility_parser.add_argument(
         "symbols",
         nargs="+",
@@ -854,36 +1124,74 @@ def main() -> None:
         action="store_true",
         help="Show chart (requires GUI)",
     )
+
+
+def _build_token_parser(subparsers, subcommand: Optional[str] = None) -> None:
+    """Add the `token` command parser and its subcommands.
     
-    # LLM commands
-    llm_parser = subparsers.add_parser(
-        "llm", 
-        help="LLM-powered analysis and insights"
+    Args:
+        subparsers: Root subparsers action
+        subcommand: Subcommand being invoked, if known; only its parser is built
+    """
+    # Token tracking command
+    token_parser = subparsers.add_parser(
+        "token", 
+        help="Track and analyze tokens"
     )
     
-    llm_subparsers = llm_parser.add_subparsers(
-        dest="llm_command",
-        help="LLM command to run",
+    token_subparsers = token_parser.add_subparsers(
+        dest="token_command",
+        help="Token command to run",
         required=True
     )
     
+    _add_parsers(token_subparsers, _TOKEN_PARSER_BUILDERS, subcommand)
+
+
+# Builders for each `token` subcommand
+_TOKEN_PARSER_BUILDERS = {
+    "price": _build_token_price_parser,
+    "analyze": _build_token_analyze_parser,
+    "portfolio": _build_token_portfolio_parser,
+    "compare": _build_token_compare_parser,
+    "volatility": _build_token_volatility_parser,
+}
+
+
+def _build_llm_market_parser(subparsers) -> None:
+    """Add the `llm market` subcommand parser.
+    
+    Args:
+        subparsers: `llm` subparsers action
+    """
     # Market analysis command
-    market_parser = llm_subparsers.add_parser(
+    market_parser = subparsers.add_parser(
         "market", 
         help="Generate market analysis using LLM"
     )
     
+    market_parser.set_defaults(func=_llm_market)
+    
     market_parser.add_argument(
         "--output", "-o",
         help="Output file for the analysis (markdown format)",
     )
+
+
+def _build_llm_strategy_parser(subparsers) -> None:
+    """Add the `llm strategy` subcommand parser.
     
+    Args:
+        subparsers: `llm` subparsers action
+    """
     # Strategy generation command
-    strategy_parser = llm_subparsers.add_parser(
+    strategy_parser = subparsers.add_parser(
         "strategy", 
         help="Generate DeFi investment strategy using LLM"
     )
     
+    strategy_parser.set_defaults(func=_llm_strategy)
+    
     strategy_parser.add_argument(
         "--chains", "-c",
         nargs="+",
@@ -930,38 +1238,193 @@ def main() -> None:
         "--output", "-o",
         help="Output file for the strategy (markdown format)",
     )
+
+
+def _build_llm_parser(subparsers, subcommand: Optional[str] = None) -> None:
+    """Add the `llm` command parser and its subcommands.
+    
+    Args:
+        subparsers: Root subparsers action
+        subcommand: Subcommand being invoked, if known; only its parser is built
+    """
+    # LLM commands
+    llm_parser = subparsers.add_parser(
+        "llm", 
+        help="LLM-powered analysis and insights"
+    )
+    
+    llm_subparsers = llm_parser.add_subparsers(
+        dest="llm_command",
+        help="LLM command to run",
+        required=True
+    )
+    
+    _add_parsers(llm_subparsers, _LLM_PARSER_BUILDERS, subcommand)
+
+
+# Builders for each `llm` subcommand
+_LLM_PARSER_BUILDERS = {
+    "market": _build_llm_market_parser,
+    "strategy": _build_llm_strategy_parser,
+}
+
+
+# Builders for each top-level command, so only the invoked one is constructed
+_PARSER_BUILDERS = {
+    "yield": _build_yield_parser,
+    "wallet": _build_wallet_parser,
+    "token": _build_token_parser,
+    "llm": _build_llm_parser,
+}
+
+
+_VERSION_FLAGS = ("--version", "-v", "-V")
+
+_USAGE = (
+    "usage: {prog} [-h] [--version] [--verbose] [--log-file LOG_FILE]\n"
+    "{indent} {{yield,wallet,token,llm}} ...\n"
+    "\n"
+    "Run '{prog} --help' for the full list of commands and options.\n"
+)
+
+
+def _run_async(coro) -> None:
+    """Run a command coroutine, on uvloop's event loop when it is installed.
+    
+    Args:
+        coro: Coroutine to run to completion
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+        return
+    
+    if hasattr(uvloop, "run"):
+        uvloop.run(coro)
+    else:
+        # uvloop < 0.18 only offers the global policy switch
+        uvloop.install()
+        asyncio.run(coro)
+
+
+def _value_options(parser: argparse.ArgumentParser) -> frozenset:
+    """Return the option strings of a parser that take a separate value.
+    
+    Args:
+        parser: Parser whose options to inspect
+        
+    Returns:
+        Option strings of every action that consumes an argument (flags such
+        as `--verbose` have `nargs == 0`)
+    """
+    return frozenset(
+        option
+        for action in parser._actions
+        if action.nargs != 0
+        for option in action.option_strings
+    )
+
+
+def _sniff_command(argv: List[str], value_options: frozenset) -> Tuple[Optional[str], Optional[str]]:
+    """Return the command and subcommand names from the command line.
+    
+    Args:
+        argv: Command line arguments excluding the program name
+        value_options: Top-level options whose value is a separate argument,
+            from `_value_options`
+        
+    Returns:
+        Tuple of (command, subcommand), the first two positional arguments;
+        either is None if not given
+    """
+    positionals = []
+    args = iter(argv)
+    for arg in args:
+        if arg in value_options:
+            # Skip the option's value so it is not mistaken for the command
+            next(args, None)
+        elif not arg.startswith("-"):
+            positionals.append(arg)
+            if len(positionals) == 2:
+                break
+    positionals += [None] * (2 - len(positionals))
+    return positionals[0], positionals[1]
+
+
+def main() -> None:
+    """Main entry point for the CLI."""
+    argv = sys.argv[1:]
+    
+    # Answer `--version` and a bare invocation without building any parsers
+    if not argv:
+        prog = os.path.basename(sys.argv[0])
+        sys.stdout.write(_USAGE.format(prog=prog, indent=" " * (len(prog) + 7)))
+        return
+    
+    for arg in argv:
+        if arg in _VERSION_FLAGS:
+            print(f"HiramAbiff v{__version__}")
+            return
+        if not arg.startswith("-"):
+            break
+    
+    # Consoles that cannot encode the emoji headers get a placeholder instead of
+    # a UnicodeEncodeError
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(errors="replace")
+    
+    parser = argparse.ArgumentParser(
+        description=f"HiramAbiff DeFi Agent CLI v{__version__}",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    
+    parser.add_argument(
+        "--version", "-v", "-V",
+        action="version", 
+        version=f"HiramAbiff v{__version__}"
+    )
+    
+    parser.add_argument(
+        "--verbose", 
+        action="store_true", 
+        help="Enable verbose logging"
+    )
+    
+    parser.add_argument(
+        "--log-file",
+        default=os.environ.get("HIRAMABIFF_LOG_FILE"),
+        help="Also write debug logs to this file (or set HIRAMABIFF_LOG_FILE)"
+    )
+    
+    # Read before the subparsers are added, so only top-level options count
+    value_options = _value_options(parser)
+    
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    
+    # Only build the parsers for the invoked command and subcommand
+    command, subcommand = _sniff_command(argv, value_options)
+    if command in _PARSER_BUILDERS:
+        _PARSER_BUILDERS[command](subparsers, subcommand)
+    else:
+        _add_parsers(subparsers, _PARSER_BUILDERS, command)
     
     # Parse arguments
     args = parser.parse_args()
     
     # Setup logging
-    setup_logging(args.verbose)
+    setup_logging(args.verbose, args.log_file)
     
-    # If no command specified, show help
+    # If only options were given, show help
     if not args.command:
         parser.print_help()
         return
     
     logger.info(f"Starting HiramAbiff CLI v{__version__}")
     
-    # Handle commands
-    if args.command == "yield":
-        asyncio.run(
-            run_yield_finder(
-                chains=args.chains,
-                min_yield=args.min_yield,
-                min_tvl=args.min_tvl,
-                max_results=args.max_results,
-                agent_name=args.name,
-            )
-        )
-    elif args.command == "wallet":
-        asyncio.run(run_wallet_command(args))
-    elif args.command == "token":
-        asyncio.run(run_token_command(args))
-    elif args.command == "llm":
-        asyncio.run(run_llm_command(args))
-    
+    # Each command parser sets the coroutine that handles it
+    _run_async(args.func(args))
+
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -9,6 +9,7 @@ framework to analyze DeFi opportunities across multiple blockchains.
 import os
 import asyncio
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 
@@ -21,6 +22,7 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
     """Return the current version of HiramAbiff."""
     from hiramabiff import __version__
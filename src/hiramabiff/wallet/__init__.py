@@ -3,8 +3,21 @@ Wallet Module
 
 This module provides functionality for managing wallets and interacting
 with various blockchains.
+
+`WalletManager` is imported on first access (PEP 562).
 """
 
-from hiramabiff.wallet.wallet_manager import WalletManager
+import importlib
+
+__all__ = ["WalletManager"]
+
+
+def __getattr__(name: str):
+    """Import `WalletManager` on first access."""
+    if name != "WalletManager":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    obj = getattr(importlib.import_module(".wallet_manager", __name__), name)
+    globals()[name] = obj
+    return obj
 
-__all__ = ["WalletManager"] 
\ No newline at end of file
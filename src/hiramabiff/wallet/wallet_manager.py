@@ -7,29 +7,157 @@ across different blockchains, with a focus on Solana.
 """
 
 import os
+import re
 import json
 import base58
 import secrets
+import time
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Any, Set, Union
 import asyncio
 
-# For Solana
+from loguru import logger
+
+
+# Chain libraries are heavy (web3 alone pulls in eth_abi, eth_account, eth_keys,
+# rlp, ...), so they are imported on first use rather than with this module.
+@lru_cache(maxsize=1)
+def _solana() -> Optional[SimpleNamespace]:
+    """Import the Solana libraries, or return None if they are not installed."""
+    try:
+        from solders.keypair import Keypair
+        from solders.pubkey import Pubkey
+        from solana.rpc.async_api import AsyncClient
+    except ImportError:
+        return None
+    return SimpleNamespace(Keypair=Keypair, Pubkey=Pubkey, AsyncClient=AsyncClient)
+
+
+@lru_cache(maxsize=1)
+def _ethereum() -> Optional[SimpleNamespace]:
+    """Import the Ethereum libraries, or return None if they are not installed."""
+    try:
+        from eth_account import Account
+        from web3 import AsyncWeb3, AsyncHTTPProvider
+        import aiohttp
+    except ImportError:
+        return None
+    return SimpleNamespace(
+        Account=Account,
+        AsyncWeb3=AsyncWeb3,
+        AsyncHTTPProvider=AsyncHTTPProvider,
+        aiohttp=aiohttp,
+    )
+
+
+# Multicall3, deployed at the same address on Ethereum and most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_AGGREGATE = bytes.fromhex("252dba42")  # aggregate((address,bytes)[])
+MULTICALL3_GET_ETH_BALANCE = bytes.fromhex("4d2301cc")  # getEthBalance(address)
+
+# Every call in a balance batch is (MULTICALL3_ADDRESS, getEthBalance(address)), so
+# its ABI encoding is fixed apart from the 20 address bytes: the target word, the
+# offset of the bytes field (0x40), its length (36), then selector + address padded
+# to 64 bytes.
+_BALANCE_CALL_HEAD = (
+    bytes(12) + bytes.fromhex(MULTICALL3_ADDRESS[2:])
+    + (0x40).to_bytes(32, "big")
+    + (36).to_bytes(32, "big")
+    + MULTICALL3_GET_ETH_BALANCE + bytes(12)
+)
+_BALANCE_CALL_TAIL = bytes(28)
+_BALANCE_CALL_SIZE = len(_BALANCE_CALL_HEAD) + 20 + len(_BALANCE_CALL_TAIL)
+
+
+def _encode_balance_aggregate(addresses: List[str]) -> bytes:
+    """
+    Encode `aggregate` calldata fetching the ETH balance of each address.
+    
+    Equivalent to ABI-encoding the `(address,bytes)[]` argument, but fills the
+    fixed per-call layout directly instead of walking the generic encoder.
+    """
+    n = len(addresses)
+    parts = [
+        MULTICALL3_AGGREGATE,
+        (0x20).to_bytes(32, "big"),
+        n.to_bytes(32, "big"),
+    ]
+    parts.extend((n * 32 + i * _BALANCE_CALL_SIZE).to_bytes(32, "big") for i in range(n))
+    for address in addresses:
+        parts.append(_BALANCE_CALL_HEAD)
+        parts.append(bytes.fromhex(address[2:]))
+        parts.append(_BALANCE_CALL_TAIL)
+    return b"".join(parts)
+
+
+def _decode_balance_aggregate(raw: bytes) -> List[int]:
+    """Decode the `(uint256 blockNumber, bytes[] returnData)` result of a balance `aggregate`."""
+    # returnData starts after the block number and its own offset word
+    base = int.from_bytes(raw[32:64], "big") + 32
+    n = int.from_bytes(raw[base - 32:base], "big")
+    balances = []
+    for i in range(n):
+        start = base + int.from_bytes(raw[base + i * 32:base + (i + 1) * 32], "big")
+        length = int.from_bytes(raw[start:start + 32], "big")
+        balances.append(int.from_bytes(raw[start + 32:start + 32 + length], "big"))
+    return balances
+
+
+# Wallet field holding the address balances are looked up by, per chain
+_BALANCE_ADDRESS_FIELD = {"solana": "public_key", "ethereum": "address"}
+
+
+def _solana_balance(lamports: int) -> Dict[str, Any]:
+    """Build a Solana balance, formatting SOL (10^9 lamports) exactly with integer math."""
+    whole, frac = divmod(lamports, 1_000_000_000)
+    return {"lamports": lamports, "sol_str": f"{whole}.{frac:09d}"}
+
+
+def _ethereum_balance(wei: int) -> Dict[str, Any]:
+    """Build an Ethereum balance, formatting ETH (10^18 wei) exactly with integer math."""
+    whole, frac = divmod(wei, 1_000_000_000_000_000_000)
+    return {"wei": wei, "eth_str": f"{whole}.{frac:018d}"}
+
+
+# Wallet names: ASCII letters, digits and hyphens, with at least one letter or digit
+_WALLET_NAME_RE = re.compile(r"[A-Za-z0-9-]*[A-Za-z0-9][A-Za-z0-9-]*")
+
+# For non-blocking wallet file reads (falls back to the default thread pool)
 try:
-    from solders.keypair import Keypair
-    from solana.rpc.async_api import AsyncClient as SolanaAsyncClient
-    SOLANA_AVAILABLE = True
+    import aiofiles
+    AIOFILES_AVAILABLE = True
 except ImportError:
-    SOLANA_AVAILABLE = False
+    AIOFILES_AVAILABLE = False
 
-# For Ethereum (stub for now)
+# Faster JSON encoding/decoding (falls back to the standard library)
 try:
-    from eth_account import Account
-    from web3 import Web3, AsyncHTTPProvider
-    from web3.eth import AsyncEth
-    ETHEREUM_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    ETHEREUM_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    """Encode a wallet as UTF-8 JSON with two-space indentation."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+async def _read_bytes_async(path: str) -> bytes:
+    """Read a whole file without blocking the event loop."""
+    if AIOFILES_AVAILABLE:
+        async with aiofiles.open(path, "rb") as f:
+            return await f.read()
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, Path(path).read_bytes)
+
 
 class WalletManager:
     """
@@ -39,6 +167,27 @@ class WalletManager:
     wallets for various blockchains, with a focus on Solana.
     """
     
+    # Seconds a fetched balance is reused (about one block on either chain)
+    BALANCE_CACHE_TTL = 6.0
+    
+    # While the background refresher runs, subscribed balances are reused for up
+    # to this many TTLs, so a refresher whose RPC calls keep failing cannot serve
+    # a stale balance indefinitely
+    SUBSCRIBED_BALANCE_MAX_TTLS = 3
+    
+    # RPC clients shared by all managers, per event loop and keyed by (chain, URL).
+    # The aiohttp session behind each Ethereum client is kept under
+    # ("ethereum-session", URL) so `close` can release it.
+    _shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, Any]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    
+    # One lock per event loop, so managers sharing the loop's clients never
+    # create (and leak) a second client while another is being set up
+    _shared_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+        weakref.WeakKeyDictionary()
+    )
+    
     def __init__(self, wallet_dir: Optional[str] = None):
         """
         Initialize the wallet manager.
@@ -54,28 +203,105 @@ class WalletManager:
             
         # Create directory if it doesn't exist
         os.makedirs(self.wallet_dir, exist_ok=True)
+        self._wallet_dir_path = Path(self.wallet_dir)
+        
+        # Names of the wallet files on disk, kept in step with create/delete
+        with os.scandir(self.wallet_dir) as it:
+            self._wallet_files = {
+                entry.name[:-5] for entry in it if entry.name.endswith(".json") and entry.is_file()
+            }
         
         # Initialize clients
         self.solana_client = None
         self.ethereum_client = None
         
-        # Cache of loaded wallets
+        # (chain, address) -> (time.monotonic() fetched, balance dict)
+        self._balance_cache: Dict[tuple, tuple] = {}
+        
+        # (chain, address) pairs kept fresh by the background balance refresher
+        self._subscriptions: Set[tuple] = set()
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # Reused by list_wallets so each wallet file is read without a fresh allocation
+        self._scan_buf = bytearray(65536)
+        
+        # Cache of loaded wallets, plus a pre-masked copy of each for get_wallet
         self._wallets = {}
+        self._wallets_masked: Dict[str, Dict[str, Any]] = {}
+        
+    def _wallet_path(self, name: str) -> Path:
+        """Return the path of a wallet's file."""
+        return self._wallet_dir_path / f"{name}.json"
+    
+    def _write_new_wallet(self, name: str, wallet_info: Dict[str, Any]) -> None:
+        """
+        Write a new wallet file and record it in the index.
+        
+        Args:
+            name: Name of the wallet
+            wallet_info: Wallet information to store
+            
+        Raises:
+            ValueError: If a file for this wallet already exists
+        """
+        try:
+            # Exclusive create, in case another process wrote it since the index was built
+            with open(self._wallet_path(name), "xb") as f:
+                f.write(_json_dumps(wallet_info))
+        except FileExistsError:
+            self._wallet_files.add(name)
+            raise ValueError(f"Wallet with name '{name}' already exists")
         
+        self._wallet_files.add(name)
+    
+    async def _write_new_wallet_async(self, name: str, wallet_info: Dict[str, Any]) -> None:
+        """Run `_write_new_wallet` in the default executor."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write_new_wallet, name, wallet_info)
+    
     async def init_clients(self):
-        """Initialize blockchain clients asynchronously."""
+        """
+        Initialize blockchain clients asynchronously.
+        
+        Clients are created once per RPC URL and event loop and shared by all
+        managers, so repeated calls reuse the same connection pools.
+        """
+        loop = asyncio.get_running_loop()
+        async with WalletManager._shared_locks.setdefault(loop, asyncio.Lock()):
+            shared = WalletManager._shared_clients.setdefault(loop, {})
+            
+            if self.solana_client is None:
+                self.solana_client = self._shared_solana_client(shared)
+            if self.ethereum_client is None:
+                self.ethereum_client = await self._shared_ethereum_client(shared)
+    
+    def _shared_solana_client(self, shared: Dict[tuple, Any]):
+        """Return the shared Solana client for the configured RPC URL, if available."""
         # Initialize Solana client if available
-        if SOLANA_AVAILABLE:
+        sol = _solana()
+        if sol is not None:
             # Prioritize Alchemy Solana URL if available
             solana_rpc_url = os.environ.get("ALCHEMY_SOLANA_URL")
             if not solana_rpc_url:
                 solana_rpc_url = os.environ.get("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
             
-            print(f"Connecting to Solana via: {solana_rpc_url.split('/v2/')[0]}/v2/...")
-            self.solana_client = SolanaAsyncClient(solana_rpc_url)
-            
+            key = ("solana", solana_rpc_url)
+            if key not in shared:
+                logger.info("Connecting to Solana via: {}/v2/...", solana_rpc_url.split('/v2/')[0])
+                shared[key] = sol.AsyncClient(solana_rpc_url)
+            return shared[key]
+        return None
+    
+    async def _shared_ethereum_client(self, shared: Dict[tuple, Any]):
+        """
+        Return the shared Ethereum client for the configured RPC URL, if available.
+        
+        The provider is pinned to one long-lived aiohttp session so every RPC
+        call made through the client reuses its pooled TCP/TLS connections.
+        """
         # Initialize Ethereum client if available
-        if ETHEREUM_AVAILABLE:
+        eth = _ethereum()
+        if eth is not None:
             # Prioritize direct Ethereum RPC URL setting
             eth_rpc_url = os.environ.get("ETHEREUM_RPC_URL")
             
@@ -87,16 +313,53 @@ class WalletManager:
                 else:
                     eth_rpc_url = "https://mainnet.infura.io/v3/YOUR_PROJECT_ID"
             
-            print(f"Connecting to Ethereum via: {eth_rpc_url.split('/v2/')[0] if '/v2/' in eth_rpc_url else eth_rpc_url}/...")
-            self.ethereum_client = Web3(AsyncHTTPProvider(eth_rpc_url), modules={"eth": (AsyncEth,)})
+            key = ("ethereum", eth_rpc_url)
+            if key not in shared:
+                logger.info("Connecting to Ethereum via: {}/...", eth_rpc_url.split('/v2/')[0])
+                provider = eth.AsyncHTTPProvider(eth_rpc_url)
+                session = eth.aiohttp.ClientSession(
+                    connector=eth.aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+                )
+                await provider.cache_async_session(session)
+                shared[("ethereum-session", eth_rpc_url)] = session
+                shared[key] = eth.AsyncWeb3(provider)
+            return shared[key]
+        return None
+    
+    async def close(self) -> None:
+        """
+        Close the RPC clients shared on the running event loop.
+        
+        The clients are shared by every manager on the loop, so call this once
+        the loop is done with wallets (e.g. at the end of a CLI command).
+        Later calls to `init_clients` create new clients.
+        """
+        loop = asyncio.get_running_loop()
+        self.solana_client = None
+        self.ethereum_client = None
+        
+        async with WalletManager._shared_locks.setdefault(loop, asyncio.Lock()):
+            shared = WalletManager._shared_clients.pop(loop, None)
+            if not shared:
+                return
+            
+            # The Solana client and the Ethereum aiohttp session own the connections
+            for (kind, _), resource in shared.items():
+                if kind in ("solana", "ethereum-session"):
+                    try:
+                        await resource.close()
+                    except Exception as e:
+                        logger.warning("Error closing {} client: {}", kind, e)
     
-    def create_wallet(self, chain: str, name: str) -> Dict[str, Any]:
+    def create_wallet(self, chain: str, name: str, seed: Optional[bytes] = None) -> Dict[str, Any]:
         """
         Create a new wallet for the specified blockchain.
         
         Args:
             chain: Blockchain to create wallet for (e.g., "solana", "ethereum")
             name: Name for the wallet
+            seed: Optional 32 random bytes to derive the key from instead of
+                drawing fresh entropy
             
         Returns:
             Dict containing wallet information
@@ -104,15 +367,48 @@ class WalletManager:
         Raises:
             ValueError: If the chain is not supported or other validation errors
         """
+        wallet_info = self._new_wallet_info(chain, name, seed)
+        
+        # Save wallet to file
+        self._write_new_wallet(name, wallet_info)
+            
+        # Add to cache
+        self._cache_wallet(wallet_info)
+            
+        return wallet_info
+    
+    async def create_wallet_async(self, chain: str, name: str) -> Dict[str, Any]:
+        """
+        Create a new wallet without blocking the event loop on disk writes.
+        
+        Key generation runs inline; the wallet file is written in the default
+        executor.
+        
+        Args:
+            chain: Blockchain to create wallet for (e.g., "solana", "ethereum")
+            name: Name for the wallet
+            
+        Returns:
+            Dict containing wallet information
+        
+        Raises:
+            ValueError: If the chain is not supported or other validation errors
+        """
+        wallet_info = self._new_wallet_info(chain, name)
+        await self._write_new_wallet_async(name, wallet_info)
+        self._cache_wallet(wallet_info)
+        return wallet_info
+    
+    def _new_wallet_info(self, chain: str, name: str, seed: Optional[bytes] = None) -> Dict[str, Any]:
+        """Validate a new wallet name and generate its keys, without saving it."""
         chain = chain.lower()
         
         # Validate name (alphanumeric and hyphens only)
-        if not name.replace("-", "").isalnum():
+        if not _WALLET_NAME_RE.fullmatch(name):
             raise ValueError("Wallet name must contain only alphanumeric characters and hyphens")
         
         # Check if wallet with this name already exists
-        wallet_path = os.path.join(self.wallet_dir, f"{name}.json")
-        if os.path.exists(wallet_path):
+        if name in self._wallet_files:
             raise ValueError(f"Wallet with name '{name}' already exists")
         
         wallet_info = {
@@ -122,11 +418,12 @@ class WalletManager:
         }
         
         if chain == "solana":
-            if not SOLANA_AVAILABLE:
+            sol = _solana()
+            if sol is None:
                 raise ValueError("Solana support is not available. Install the solana package.")
             
             # Generate a new Solana keypair
-            keypair = Keypair()
+            keypair = sol.Keypair.from_seed(seed) if seed is not None else sol.Keypair()
             
             # Add Solana-specific wallet info
             wallet_info.update({
@@ -135,11 +432,12 @@ class WalletManager:
             })
             
         elif chain == "ethereum":
-            if not ETHEREUM_AVAILABLE:
+            eth = _ethereum()
+            if eth is None:
                 raise ValueError("Ethereum support is not available. Install the web3 package.")
             
             # Generate a new Ethereum account
-            account = Account.create()
+            account = eth.Account.from_key(seed) if seed is not None else eth.Account.create()
             
             # Add Ethereum-specific wallet info
             wallet_info.update({
@@ -150,18 +448,69 @@ class WalletManager:
         else:
             raise ValueError(f"Unsupported blockchain: {chain}")
         
+        return wallet_info
+    
+    def create_wallets(self, chain: str, names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Create several wallets for the same blockchain.
+        
+        All names are validated before anything is written, and the keys are
+        seeded from a single `secrets.token_bytes` call rather than drawing
+        entropy once per wallet.
+        
+        Args:
+            chain: Blockchain to create the wallets for (e.g., "solana", "ethereum")
+            names: Names for the new wallets
+            
+        Returns:
+            List of wallet information dicts, in the order of `names`
+        
+        Raises:
+            ValueError: If the chain is not supported, a name is invalid,
+                repeated or already taken
+        """
+        for name in names:
+            if not _WALLET_NAME_RE.fullmatch(name):
+                raise ValueError("Wallet name must contain only alphanumeric characters and hyphens")
+            if name in self._wallet_files:
+                raise ValueError(f"Wallet with name '{name}' already exists")
+        if len(set(names)) != len(names):
+            raise ValueError("Wallet names must be unique")
+        
+        seeds = secrets.token_bytes(32 * len(names))
+        return [
+            self.create_wallet(chain, name, seed=seeds[i * 32:(i + 1) * 32])
+            for i, name in enumerate(names)
+        ]
+    
+    def import_wallet(self, chain: str, name: str, private_key: str) -> Dict[str, Any]:
+        """
+        Import an existing wallet using its private key.
+        
+        Args:
+            chain: Blockchain the wallet belongs to
+            name: Name for the wallet
+            private_key: Private key for the wallet
+            
+        Returns:
+            Dict containing wallet information
+        
+        Raises:
+            ValueError: If the chain is not supported or other validation errors
+        """
+        wallet_info = self._imported_wallet_info(chain, name, private_key)
+        
         # Save wallet to file
-        with open(wallet_path, "w") as f:
-            json.dump(wallet_info, f, indent=2)
+        self._write_new_wallet(name, wallet_info)
             
         # Add to cache
-        self._wallets[name] = wallet_info
+        self._cache_wallet(wallet_info)
             
         return wallet_info
     
-    def import_wallet(self, chain: str, name: str, private_key: str) -> Dict[str, Any]:
+    async def import_wallet_async(self, chain: str, name: str, private_key: str) -> Dict[str, Any]:
         """
-        Import an existing wallet using its private key.
+        Import an existing wallet without blocking the event loop on disk writes.
         
         Args:
             chain: Blockchain the wallet belongs to
@@ -174,15 +523,21 @@ class WalletManager:
         Raises:
             ValueError: If the chain is not supported or other validation errors
         """
+        wallet_info = self._imported_wallet_info(chain, name, private_key)
+        await self._write_new_wallet_async(name, wallet_info)
+        self._cache_wallet(wallet_info)
+        return wallet_info
+    
+    def _imported_wallet_info(self, chain: str, name: str, private_key: str) -> Dict[str, Any]:
+        """Validate a wallet to import and derive its info from the private key, without saving it."""
         chain = chain.lower()
         
         # Validate name (alphanumeric and hyphens only)
-        if not name.replace("-", "").isalnum():
+        if not _WALLET_NAME_RE.fullmatch(name):
             raise ValueError("Wallet name must contain only alphanumeric characters and hyphens")
         
         # Check if wallet with this name already exists
-        wallet_path = os.path.join(self.wallet_dir, f"{name}.json")
-        if os.path.exists(wallet_path):
+        if name in self._wallet_files:
             raise ValueError(f"Wallet with name '{name}' already exists")
         
         wallet_info = {
@@ -193,37 +548,41 @@ class WalletManager:
         }
         
         if chain == "solana":
-            if not SOLANA_AVAILABLE:
+            sol = _solana()
+            if sol is None:
                 raise ValueError("Solana support is not available. Install the solana package.")
             
             try:
                 # Try to interpret as a base58 private key
                 decoded = base58.b58decode(private_key)
                 
-                # Create keypair from secret
+                # Create keypair from secret. Base58 is canonical, so a 32-byte secret
+                # is stored as given instead of being re-encoded from the keypair.
                 if len(decoded) == 64:  # Full keypair (both public and private)
-                    keypair = Keypair.from_bytes(decoded)
+                    keypair = sol.Keypair.from_bytes(decoded)
+                    private_key_b58 = base58.b58encode(decoded[:32]).decode("utf-8")
                 elif len(decoded) == 32:  # Just the secret key
-                    keypair = Keypair.from_seed(decoded)
+                    keypair = sol.Keypair.from_seed(decoded)
+                    private_key_b58 = private_key.rstrip()
                 else:
                     raise ValueError("Invalid Solana private key length")
                 
                 # Add Solana-specific wallet info
                 wallet_info.update({
                     "public_key": str(keypair.pubkey()),
-                    "private_key_b58": base58.b58encode(bytes(keypair.secret())).decode("utf-8"),
+                    "private_key_b58": private_key_b58,
                 })
                 
             except Exception as e:
                 raise ValueError(f"Invalid Solana private key: {str(e)}")
             
         elif chain == "ethereum":
-            if not ETHEREUM_AVAILABLE:
+            if _ethereum() is None:
                 raise ValueError("Ethereum support is not available. Install the web3 package.")
             
             try:
                 # Try to create an account from the private key
-                account = Account.from_key(private_key)
+                account = _ethereum().Account.from_key(private_key)
                 
                 # Add Ethereum-specific wallet info
                 wallet_info.update({
@@ -237,13 +596,6 @@ class WalletManager:
         else:
             raise ValueError(f"Unsupported blockchain: {chain}")
         
-        # Save wallet to file
-        with open(wallet_path, "w") as f:
-            json.dump(wallet_info, f, indent=2)
-            
-        # Add to cache
-        self._wallets[name] = wallet_info
-            
         return wallet_info
     
     def list_wallets(self) -> List[Dict[str, Any]]:
@@ -259,33 +611,121 @@ class WalletManager:
         if not os.path.exists(self.wallet_dir):
             return wallets
         
+        filenames = [filename for filename in os.listdir(self.wallet_dir) if filename.endswith(".json")]
+        self._wallet_files = {filename[:-5] for filename in filenames}
+        
         # Load all wallet files
-        for filename in os.listdir(self.wallet_dir):
-            if filename.endswith(".json"):
-                try:
-                    wallet_path = os.path.join(self.wallet_dir, filename)
-                    with open(wallet_path, "r") as f:
-                        wallet_info = json.load(f)
-                        
-                        # Skip non-wallet files
-                        if "name" not in wallet_info or "chain" not in wallet_info:
-                            continue
-                        
-                        # Mask private key
-                        if "private_key" in wallet_info:
-                            wallet_info["private_key"] = "***MASKED***"
-                        if "private_key_b58" in wallet_info:
-                            wallet_info["private_key_b58"] = "***MASKED***"
-                        
-                        wallets.append(wallet_info)
-                        
-                        # Update cache
-                        self._wallets[wallet_info["name"]] = wallet_info
-                except Exception as e:
-                    print(f"Error loading wallet {filename}: {str(e)}")
+        for filename in filenames:
+            try:
+                wallet_info = self._load_listed_wallet(self._read_into_scan_buf(self._wallet_dir_path / filename))
+                
+                if wallet_info is not None:
+                    wallets.append(wallet_info)
+            except Exception as e:
+                logger.warning("Error loading wallet {}: {}", filename, e)
                     
         return wallets
     
+    async def list_wallets_async(self) -> List[Dict[str, Any]]:
+        """
+        List all wallets, reading the wallet files concurrently.
+        
+        Returns:
+            List of wallet information dictionaries, as from `list_wallets`
+        """
+        if not os.path.isdir(self.wallet_dir):
+            return []
+        
+        with os.scandir(self.wallet_dir) as it:
+            entries = [entry for entry in it if entry.name.endswith(".json") and entry.is_file()]
+        self._wallet_files = {entry.name[:-5] for entry in entries}
+        
+        contents = await asyncio.gather(
+            *(_read_bytes_async(entry.path) for entry in entries),
+            return_exceptions=True,
+        )
+        
+        wallets = []
+        for entry, content in zip(entries, contents):
+            try:
+                if isinstance(content, Exception):
+                    raise content
+                wallet_info = self._load_listed_wallet(content)
+            except Exception as e:
+                logger.warning("Error loading wallet {}: {}", entry.name, e)
+                continue
+            
+            if wallet_info is not None:
+                wallets.append(wallet_info)
+        
+        return wallets
+    
+    def _read_into_scan_buf(self, path: Path) -> Union[memoryview, bytes]:
+        """
+        Read a whole file into the reused scan buffer.
+        
+        Args:
+            path: File to read
+            
+        Returns:
+            A view of the file contents in the scan buffer, only valid until the
+            next call, or a bytes copy when orjson (which parses memoryviews) is
+            not available
+        """
+        with open(path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > len(self._scan_buf):
+                self._scan_buf = bytearray(size)
+            
+            view = memoryview(self._scan_buf)
+            n = 0
+            while n < len(view):
+                read = f.readinto(view[n:])
+                if not read:
+                    break
+                n += read
+        
+        return view[:n] if ORJSON_AVAILABLE else bytes(view[:n])
+    
+    def _load_listed_wallet(self, content: Union[bytes, memoryview]) -> Optional[Dict[str, Any]]:
+        """
+        Decode a wallet file for listing, masking its private key.
+        
+        Args:
+            content: Raw contents of the wallet file
+            
+        Returns:
+            Masked wallet information, or None if the file is not a wallet
+        """
+        wallet_info = _json_loads(content)
+        
+        # Skip non-wallet files
+        if "name" not in wallet_info or "chain" not in wallet_info:
+            return None
+        
+        return self._cache_wallet(wallet_info)
+    
+    def _cache_wallet(self, wallet_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cache a wallet together with its masked view.
+        
+        Args:
+            wallet_info: Full wallet information, including private key
+            
+        Returns:
+            The masked view, shared by every later `get_wallet` call
+        """
+        wallet_info_masked = wallet_info.copy()
+        if "private_key" in wallet_info_masked:
+            wallet_info_masked["private_key"] = "***MASKED***"
+        if "private_key_b58" in wallet_info_masked:
+            wallet_info_masked["private_key_b58"] = "***MASKED***"
+        
+        name = wallet_info["name"]
+        self._wallets[name] = wallet_info
+        self._wallets_masked[name] = wallet_info_masked
+        return wallet_info_masked
+    
     def get_wallet(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Get information for a specific wallet.
@@ -294,34 +734,25 @@ class WalletManager:
             name: Name of the wallet
             
         Returns:
-            Wallet information or None if not found
+            Masked wallet information or None if not found. The dict is cached
+            and shared between calls, so callers must not modify it.
         """
         # Check cache first
-        if name in self._wallets:
-            return self._wallets[name]
+        if name in self._wallets_masked:
+            return self._wallets_masked[name]
             
         # Try to load from file
-        wallet_path = os.path.join(self.wallet_dir, f"{name}.json")
-        if not os.path.exists(wallet_path):
+        if name not in self._wallet_files:
             return None
             
         try:
-            with open(wallet_path, "r") as f:
-                wallet_info = json.load(f)
-                
-                # Mask private key for return value
-                wallet_info_masked = wallet_info.copy()
-                if "private_key" in wallet_info_masked:
-                    wallet_info_masked["private_key"] = "***MASKED***"
-                if "private_key_b58" in wallet_info_masked:
-                    wallet_info_masked["private_key_b58"] = "***MASKED***"
+            with open(self._wallet_path(name), "rb") as f:
+                wallet_info = _json_loads(f.read())
                 
-                # Update cache with unmasked version
-                self._wallets[name] = wallet_info
-                
-                return wallet_info_masked
+                # Cache the full wallet and return its masked view
+                return self._cache_wallet(wallet_info)
         except Exception as e:
-            print(f"Error loading wallet {name}: {str(e)}")
+            logger.warning("Error loading wallet {}: {}", name, e)
             return None
             
     def get_wallet_with_private_key(self, name: str) -> Optional[Dict[str, Any]]:
@@ -335,18 +766,17 @@ class WalletManager:
             Wallet information or None if not found
         """
         # Try to load from file (don't use cache to ensure we have the latest)
-        wallet_path = os.path.join(self.wallet_dir, f"{name}.json")
-        if not os.path.exists(wallet_path):
+        if name not in self._wallet_files:
             return None
             
         try:
-            with open(wallet_path, "r") as f:
-                wallet_info = json.load(f)
+            with open(self._wallet_path(name), "rb") as f:
+                wallet_info = _json_loads(f.read())
                 # Update cache
-                self._wallets[name] = wallet_info
+                self._cache_wallet(wallet_info)
                 return wallet_info
         except Exception as e:
-            print(f"Error loading wallet {name}: {str(e)}")
+            logger.warning("Error loading wallet {}: {}", name, e)
             return None
     
     def delete_wallet(self, name: str) -> bool:
@@ -359,28 +789,38 @@ class WalletManager:
         Returns:
             True if deleted, False if not found
         """
-        wallet_path = os.path.join(self.wallet_dir, f"{name}.json")
-        if not os.path.exists(wallet_path):
+        if name not in self._wallet_files:
             return False
             
         try:
-            os.remove(wallet_path)
+            try:
+                os.remove(self._wallet_path(name))
+            except FileNotFoundError:
+                # Removed by another process since the index was built
+                self._wallet_files.discard(name)
+                return False
+            
+            self._wallet_files.discard(name)
             
             # Remove from cache
-            if name in self._wallets:
-                del self._wallets[name]
+            wallet_info = self._wallets.pop(name, None)
+            self._wallets_masked.pop(name, None)
+            if wallet_info is not None:
+                self._forget_balance(wallet_info)
                 
             return True
         except Exception as e:
-            print(f"Error deleting wallet {name}: {str(e)}")
+            logger.error("Error deleting wallet {}: {}", name, e)
             return False
     
-    async def get_balance(self, name: str) -> Dict[str, Any]:
+    async def get_balance(self, name: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get balance for a wallet across supported blockchains.
         
         Args:
             name: Name of the wallet
+            use_cache: Whether to reuse a balance fetched within the last
+                `BALANCE_CACHE_TTL` seconds
             
         Returns:
             Dict with balance information
@@ -395,7 +835,7 @@ class WalletManager:
         chain = wallet["chain"].lower()
         
         if chain == "solana":
-            if not SOLANA_AVAILABLE:
+            if _solana() is None:
                 raise ValueError("Solana support is not available")
                 
             if self.solana_client is None:
@@ -403,26 +843,25 @@ class WalletManager:
                 
             try:
                 public_key = wallet["public_key"]
-                response = await self.solana_client.get_balance(public_key)
+                self._subscriptions.add(("solana", public_key))
+                balance = self._cached_balance("solana", public_key) if use_cache else None
                 
-                # Balance is in lamports (1 SOL = 10^9 lamports)
-                balance_lamports = response.value
-                balance_sol = balance_lamports / 1_000_000_000
+                if balance is None:
+                    response = await self.solana_client.get_balance(public_key)
+                    balance = _solana_balance(response.value)
+                    self._balance_cache[("solana", public_key)] = (time.monotonic(), balance)
                 
                 return {
                     "chain": "solana",
                     "wallet": name,
                     "address": public_key,
-                    "balance": {
-                        "lamports": balance_lamports,
-                        "sol": balance_sol,
-                    }
+                    "balance": dict(balance),
                 }
             except Exception as e:
                 raise ValueError(f"Error getting Solana balance: {str(e)}")
                 
         elif chain == "ethereum":
-            if not ETHEREUM_AVAILABLE:
+            if _ethereum() is None:
                 raise ValueError("Ethereum support is not available")
                 
             if self.ethereum_client is None:
@@ -430,22 +869,226 @@ class WalletManager:
                 
             try:
                 address = wallet["address"]
-                balance_wei = await self.ethereum_client.eth.get_balance(address)
+                self._subscriptions.add(("ethereum", address))
+                balance = self._cached_balance("ethereum", address) if use_cache else None
                 
-                # Balance is in wei (1 ETH = 10^18 wei)
-                balance_eth = balance_wei / 1_000_000_000_000_000_000
+                if balance is None:
+                    balance_wei = await self.ethereum_client.eth.get_balance(address)
+                    balance = _ethereum_balance(balance_wei)
+                    self._balance_cache[("ethereum", address)] = (time.monotonic(), balance)
                 
                 return {
                     "chain": "ethereum",
                     "wallet": name,
                     "address": address,
-                    "balance": {
-                        "wei": balance_wei,
-                        "eth": balance_eth,
-                    }
+                    "balance": dict(balance),
                 }
             except Exception as e:
                 raise ValueError(f"Error getting Ethereum balance: {str(e)}")
                 
         else:
-            raise ValueError(f"Unsupported blockchain: {chain}") 
\ No newline at end of file
+            raise ValueError(f"Unsupported blockchain: {chain}")
+    
+    async def get_balances(self, names: List[str], use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get balances for several wallets concurrently.
+        
+        Balances that are not cached are fetched in batches first: Solana
+        with `getMultipleAccounts`, Ethereum with a Multicall3 `aggregate`
+        of `getEthBalance` calls. Any remaining lookups run in parallel.
+        
+        Args:
+            names: Names of the wallets
+            use_cache: Whether to reuse balances fetched within the last
+                `BALANCE_CACHE_TTL` seconds
+            
+        Returns:
+            One dict per name, in input order: the `get_balance` result, or
+            `{"wallet": name, "error": message}` if that lookup failed
+        """
+        await self.init_clients()
+        
+        # Wallets per chain whose balance has to come from the chain
+        pending: Dict[str, Dict[str, str]] = {"solana": {}, "ethereum": {}}
+        for name in names:
+            wallet = self.get_wallet(name)
+            if wallet is None:
+                continue
+            chain = wallet["chain"].lower()
+            address = wallet.get(_BALANCE_ADDRESS_FIELD.get(chain, ""))
+            if address and (not use_cache or self._cached_balance(chain, address) is None):
+                pending[chain][name] = address
+        
+        prefetchers = {
+            "solana": (self.solana_client, self._prefetch_solana_balances),
+            "ethereum": (self.ethereum_client, self._prefetch_ethereum_balances),
+        }
+        batches = [
+            (chain, pending[chain], prefetch)
+            for chain, (client, prefetch) in prefetchers.items()
+            if pending[chain] and client is not None
+        ]
+        outcomes = await asyncio.gather(
+            *(prefetch(list(dict.fromkeys(wallets.values()))) for _, wallets, prefetch in batches),
+            return_exceptions=True,
+        )
+        
+        # Prefetched balances are then served from the cache by get_balance
+        prefetched = set()
+        for (chain, wallets, _), outcome in zip(batches, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning("Batched {} balance lookup failed, querying wallets individually: {}", chain, outcome)
+            else:
+                prefetched.update(wallets)
+        
+        results = await asyncio.gather(
+            *(self.get_balance(name, use_cache=use_cache or name in prefetched) for name in names),
+            return_exceptions=True,
+        )
+        
+        return [
+            {"wallet": name, "error": str(result)} if isinstance(result, Exception) else result
+            for name, result in zip(names, results)
+        ]
+    
+    async def _prefetch_solana_balances(self, public_keys: List[str]) -> None:
+        """
+        Fetch Solana balances in batches and store them in the balance cache.
+        
+        Args:
+            public_keys: Distinct base58 public keys
+        """
+        # getMultipleAccounts accepts at most 100 accounts per request
+        batch_size = 100
+        batches = [public_keys[i:i + batch_size] for i in range(0, len(public_keys), batch_size)]
+        responses = await asyncio.gather(*(
+            self.solana_client.get_multiple_accounts([_solana().Pubkey.from_string(key) for key in batch])
+            for batch in batches
+        ))
+        
+        fetched_at = time.monotonic()
+        for batch, response in zip(batches, responses):
+            for public_key, account in zip(batch, response.value):
+                # Accounts that were never funded do not exist yet
+                balance_lamports = account.lamports if account is not None else 0
+                self._balance_cache[("solana", public_key)] = (fetched_at, _solana_balance(balance_lamports))
+    
+    async def _prefetch_ethereum_balances(self, addresses: List[str]) -> None:
+        """
+        Fetch Ethereum balances through Multicall3 and store them in the balance cache.
+        
+        Args:
+            addresses: Distinct checksummed addresses
+        """
+        # Keep each eth_call well inside node gas caps (~2,600 gas per cold balance read)
+        batch_size = 500
+        batches = [addresses[i:i + batch_size] for i in range(0, len(addresses), batch_size)]
+        
+        async def aggregate(batch: List[str]) -> List[int]:
+            data = _encode_balance_aggregate(batch)
+            raw = await self.ethereum_client.eth.call({"to": MULTICALL3_ADDRESS, "data": data})
+            return _decode_balance_aggregate(bytes(raw))
+        
+        results = await asyncio.gather(*(aggregate(batch) for batch in batches))
+        
+        fetched_at = time.monotonic()
+        for batch, balances in zip(batches, results):
+            for address, balance_wei in zip(batch, balances):
+                self._balance_cache[("ethereum", address)] = (fetched_at, _ethereum_balance(balance_wei))
+    
+    def _cached_balance(self, chain: str, address: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a recently fetched balance for an address.
+        
+        Args:
+            chain: Lower-case chain name
+            address: Wallet address or public key
+            
+        Returns:
+            The cached balance dict, or None if missing or older than the TTL
+        """
+        entry = self._balance_cache.get((chain, address))
+        if entry is None:
+            return None
+        
+        # Subscribed balances are refreshed in the background, so they live longer while it runs
+        max_age = self.BALANCE_CACHE_TTL
+        if (chain, address) in self._subscriptions and self._balance_refresher_running():
+            max_age *= self.SUBSCRIBED_BALANCE_MAX_TTLS
+        
+        if time.monotonic() - entry[0] >= max_age:
+            return None
+        return entry[1]
+    
+    def _forget_balance(self, wallet_info: Dict[str, Any]) -> None:
+        """
+        Drop a deleted wallet's cached balance and refresher subscription.
+        
+        Args:
+            wallet_info: The deleted wallet's information
+        """
+        chain = wallet_info.get("chain", "").lower()
+        address = wallet_info.get(_BALANCE_ADDRESS_FIELD.get(chain, ""))
+        if not address:
+            return
+        
+        # Another loaded wallet may hold the same key under a different name
+        for other in self._wallets.values():
+            if other.get("chain", "").lower() == chain and other.get(_BALANCE_ADDRESS_FIELD[chain]) == address:
+                return
+        
+        self._subscriptions.discard((chain, address))
+        self._balance_cache.pop((chain, address), None)
+    
+    def _balance_refresher_running(self) -> bool:
+        """Return whether the background balance refresher is active."""
+        return self._refresh_task is not None and not self._refresh_task.done()
+    
+    def start_balance_refresher(self) -> asyncio.Task:
+        """
+        Start refreshing subscribed balances every `BALANCE_CACHE_TTL` seconds.
+        
+        Every address passed through `get_balance` is subscribed. Must be
+        called from a running event loop; while the refresher runs, subscribed
+        balances are served from the cache without an RPC round trip for up to
+        `SUBSCRIBED_BALANCE_MAX_TTLS` TTLs, after which a failing refresher
+        lets them expire.
+        
+        Returns:
+            The background refresh task
+        """
+        if not self._balance_refresher_running():
+            self._refresh_task = asyncio.create_task(self._refresh_balances())
+        return self._refresh_task
+    
+    async def stop_balance_refresher(self) -> None:
+        """Cancel the background balance refresher if it is running."""
+        if self._balance_refresher_running():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+    
+    async def _refresh_balances(self) -> None:
+        """Periodically re-fetch all subscribed balances in per-chain batches."""
+        await self.init_clients()
+        
+        while True:
+            await asyncio.sleep(self.BALANCE_CACHE_TTL)
+            
+            prefetchers = {
+                "solana": (self.solana_client, self._prefetch_solana_balances),
+                "ethereum": (self.ethereum_client, self._prefetch_ethereum_balances),
+            }
+            batches = []
+            for chain, (client, prefetch) in prefetchers.items():
+                addresses = [address for sub_chain, address in self._subscriptions if sub_chain == chain]
+                if addresses and client is not None:
+                    batches.append((chain, prefetch(addresses)))
+            
+            results = await asyncio.gather(*(batch for _, batch in batches), return_exceptions=True)
+            for (chain, _), result in zip(batches, results):
+                if isinstance(result, Exception):
+                    logger.warning("Could not refresh {} balances: {}", chain, result)
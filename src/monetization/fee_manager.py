@@ -8,27 +8,66 @@ implement actual fee calculations and token staking in the future.
 
 import os
 import json
+import time
+import bisect
+import numbers
 import datetime
 from typing import Dict, List, Any, Tuple, Optional
 import random
 import logging
 
+import base58
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Staking tiers: staking at least _TIER_THRESHOLDS[i] HIRAM earns _TIER_DISCOUNTS[i + 1]
+_TIER_THRESHOLDS = (1000, 10000, 100000, 500000)
+_TIER_DISCOUNTS = (0.0, 0.01, 0.05, 0.1, 0.5)  # Fee discount, in percentage points
+
+def _discount_for_amount(staked_amount: float) -> float:
+    """Return the fee discount earned by staking `staked_amount` HIRAM."""
+    return _TIER_DISCOUNTS[bisect.bisect_right(_TIER_THRESHOLDS, staked_amount)]
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """Format a fee event's `timestamp_ns` as a local ISO 8601 string."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+
+def _fee_event(timestamp_ns: int, profit_amount: float, fee_percent: float, fee_amount: float) -> Dict[str, Any]:
+    """Build a fee event; `timestamp_ns` is in epoch nanoseconds (see `_format_timestamp`)."""
+    return {
+        "timestamp_ns": timestamp_ns,
+        "profit_amount": profit_amount,
+        "fee_percent": fee_percent,
+        "fee_amount": fee_amount,
+        "net_profit": profit_amount - fee_amount,
+    }
+
 class FeeManager:
     """
     Class for managing fees and token staking.
     Initially uses mock data for testing and development.
+    
+    Attributes:
+        staked_tokens: wallet_address -> (staked amount, fee discount) tuple.
+            The discount (in percentage points) is computed by `_set_stake`
+            whenever the amount changes; read the amount as
+            `staked_tokens[wallet][0]`.
+        fee_history: wallet_address -> list of fee event dicts
+        fee_totals: wallet_address -> (total profit, total fees, event count),
+            kept up to date by `_add_fee_events` so `get_fee_stats` does not
+            re-sum the history
     """
     
     def __init__(self):
         """Initialize the fee manager."""
         self.default_fee_percent = 1.0  # Default fee is 1% of profits
         self.mock_mode = True  # Initially use mock data
-        self.staked_tokens = {}  # wallet_address -> amount
+        self.staked_tokens: Dict[str, Tuple[float, float]] = {}  # wallet_address -> (amount, discount)
         self.fee_history = {}  # wallet_address -> List[fee_event]
+        self.fee_totals: Dict[str, Tuple[float, float, int]] = {}  # wallet_address -> (total profit, total fees, events)
         self._setup_mock_data()
     
     def calculate_fee(self, profit_amount: float, wallet_address: str = None) -> Dict[str, Any]:
@@ -42,43 +81,44 @@ class FeeManager:
         Returns:
             Dict[str, Any]: Fee calculation result
         """
-        try:
-            # Base fee calculation
-            base_fee_percent = self.default_fee_percent
-            
-            # If no wallet address, return base fee
-            if not wallet_address:
-                fee_amount = profit_amount * (base_fee_percent / 100)
-                return {
-                    "profit_amount": profit_amount,
-                    "fee_percent": base_fee_percent,
-                    "fee_amount": fee_amount,
-                    "net_profit": profit_amount - fee_amount
-                }
-            
-            # Get discount from staking
-            discount = self.get_fee_discount_for_staking(wallet_address)
-            effective_fee_percent = max(0, base_fee_percent - discount)
-            
-            # Calculate fee
-            fee_amount = profit_amount * (effective_fee_percent / 100)
-            
-            # In mock mode, record fee event
-            if self.mock_mode and wallet_address:
-                self._record_fee_event(wallet_address, profit_amount, effective_fee_percent, fee_amount)
-            
+        # Strings, including numeric ones, were never valid here: they failed
+        # the multiplication below and came back as the same error dict
+        if not isinstance(profit_amount, numbers.Real):
+            logger.error(f"Error calculating fee: invalid profit amount {profit_amount!r}")
+            return {"error": f"Error calculating fee: invalid profit amount {profit_amount!r}"}
+        
+        # Base fee calculation
+        base_fee_percent = self.default_fee_percent
+        
+        # If no wallet address, return base fee
+        if not wallet_address:
+            fee_amount = profit_amount * (base_fee_percent / 100)
             return {
                 "profit_amount": profit_amount,
-                "base_fee_percent": base_fee_percent,
-                "discount_percent": discount,
-                "effective_fee_percent": effective_fee_percent,
+                "fee_percent": base_fee_percent,
                 "fee_amount": fee_amount,
                 "net_profit": profit_amount - fee_amount
             }
         
-        except Exception as e:
-            logger.error(f"Error calculating fee: {str(e)}")
-            return {"error": f"Error calculating fee: {str(e)}"}
+        # Get discount from staking
+        discount = self.get_fee_discount_for_staking(wallet_address)
+        effective_fee_percent = max(0, base_fee_percent - discount)
+        
+        # Calculate fee
+        fee_amount = profit_amount * (effective_fee_percent / 100)
+        
+        # In mock mode, record fee event
+        if self.mock_mode and wallet_address:
+            self._record_fee_event(wallet_address, profit_amount, effective_fee_percent, fee_amount)
+        
+        return {
+            "profit_amount": profit_amount,
+            "base_fee_percent": base_fee_percent,
+            "discount_percent": discount,
+            "effective_fee_percent": effective_fee_percent,
+            "fee_amount": fee_amount,
+            "net_profit": profit_amount - fee_amount
+        }
     
     def get_fee_discount_for_staking(self, wallet_address: str) -> float:
         """
@@ -90,29 +130,12 @@ class FeeManager:
         Returns:
             float: Fee discount percentage
         """
-        try:
-            # If no wallet address, no discount
-            if not wallet_address:
-                return 0.0
-            
-            # Get staked tokens
-            staked_amount = self.staked_tokens.get(wallet_address, 0)
-            
-            # Calculate discount based on staking tiers
-            if staked_amount >= 500000:  # Max discount tier
-                return 0.5  # 50% discount (max)
-            elif staked_amount >= 100000:
-                return 0.1  # 10% discount
-            elif staked_amount >= 10000:
-                return 0.05  # 5% discount
-            elif staked_amount >= 1000:
-                return 0.01  # 1% discount
-            else:
-                return 0.0  # No discount
-        
-        except Exception as e:
-            logger.error(f"Error getting fee discount: {str(e)}")
+        # If no wallet address, no discount
+        if not wallet_address:
             return 0.0
+        
+        # Discount is computed when the stake changes
+        return self.staked_tokens.get(wallet_address, (0, 0.0))[1]
     
     def stake_tokens(self, wallet_address: str, amount: float) -> Dict[str, Any]:
         """
@@ -134,12 +157,9 @@ class FeeManager:
                 return {"error": "Wallet address is required"}
             
             # Update staked tokens
-            current_amount = self.staked_tokens.get(wallet_address, 0)
+            current_amount = self.staked_tokens.get(wallet_address, (0, 0.0))[0]
             new_amount = current_amount + amount
-            self.staked_tokens[wallet_address] = new_amount
-            
-            # Get new discount
-            new_discount = self.get_fee_discount_for_staking(wallet_address)
+            new_discount = self._set_stake(wallet_address, new_amount)
             
             logger.info(f"Staked {amount} HIRAM tokens for {wallet_address}. New total: {new_amount}")
             return {
@@ -174,7 +194,7 @@ class FeeManager:
                 return {"error": "Wallet address is required"}
             
             # Get current staked amount
-            current_amount = self.staked_tokens.get(wallet_address, 0)
+            current_amount = self.staked_tokens.get(wallet_address, (0, 0.0))[0]
             
             # Validate unstake amount
             if amount > current_amount:
@@ -182,10 +202,7 @@ class FeeManager:
             
             # Update staked tokens
             new_amount = current_amount - amount
-            self.staked_tokens[wallet_address] = new_amount
-            
-            # Get new discount
-            new_discount = self.get_fee_discount_for_staking(wallet_address)
+            new_discount = self._set_stake(wallet_address, new_amount)
             
             logger.info(f"Unstaked {amount} HIRAM tokens for {wallet_address}. New total: {new_amount}")
             return {
@@ -214,11 +231,8 @@ class FeeManager:
             if not wallet_address:
                 return {"error": "Wallet address is required"}
             
-            # Get staked amount
-            staked_amount = self.staked_tokens.get(wallet_address, 0)
-            
-            # Get discount
-            discount = self.get_fee_discount_for_staking(wallet_address)
+            # Get staked amount and discount
+            staked_amount, discount = self.staked_tokens.get(wallet_address, (0, 0.0))
             
             # Get token info
             token_info = self.get_token_info()
@@ -269,13 +283,19 @@ class FeeManager:
             if not wallet_address:
                 return {"error": "Wallet address is required"}
             
-            # Get fee history
-            fee_history = self.fee_history.get(wallet_address, [])
-            
-            # Calculate stats
-            total_profit = sum(fee_event.get("profit_amount", 0) for fee_event in fee_history)
-            total_fees = sum(fee_event.get("fee_amount", 0) for fee_event in fee_history)
-            num_transactions = len(fee_history)
+            # Use the running totals kept by `_add_fee_events`
+            totals = self.fee_totals.get(wallet_address)
+            if totals is not None:
+                total_profit, total_fees, num_transactions = totals
+            else:
+                # History recorded some other way: total it in a single pass
+                fee_history = self.fee_history.get(wallet_address, [])
+                total_profit = 0
+                total_fees = 0
+                for fee_event in fee_history:
+                    total_profit += fee_event.get("profit_amount", 0)
+                    total_fees += fee_event.get("fee_amount", 0)
+                num_transactions = len(fee_history)
             
             # Get current discount
             current_discount = self.get_fee_discount_for_staking(wallet_address)
@@ -295,6 +315,21 @@ class FeeManager:
             logger.error(f"Error getting fee stats: {str(e)}")
             return {"error": f"Error getting fee stats: {str(e)}"}
     
+    def _set_stake(self, wallet_address: str, amount: float) -> float:
+        """
+        Store a wallet's staked amount along with the discount it earns.
+        
+        Args:
+            wallet_address: Wallet address to update
+            amount: New total staked amount
+            
+        Returns:
+            float: Fee discount for the new amount
+        """
+        discount = _discount_for_amount(amount)
+        self.staked_tokens[wallet_address] = (amount, discount)
+        return discount
+    
     def _record_fee_event(self, wallet_address: str, profit_amount: float, fee_percent: float, fee_amount: float) -> None:
         """
         Record a fee event.
@@ -305,60 +340,59 @@ class FeeManager:
             fee_percent: Fee percentage
             fee_amount: Fee amount
         """
-        try:
-            # Create fee event
-            fee_event = {
-                "timestamp": datetime.datetime.now().isoformat(),
-                "profit_amount": profit_amount,
-                "fee_percent": fee_percent,
-                "fee_amount": fee_amount,
-                "net_profit": profit_amount - fee_amount,
-            }
-            
-            # Add to fee history
-            if wallet_address not in self.fee_history:
-                self.fee_history[wallet_address] = []
-            
-            self.fee_history[wallet_address].append(fee_event)
-            
-            logger.info(f"Recorded fee event for {wallet_address}: ${fee_amount:.2f} ({fee_percent:.2f}%)")
+        self._add_fee_events(wallet_address, [_fee_event(time.time_ns(), profit_amount, fee_percent, fee_amount)])
         
-        except Exception as e:
-            logger.error(f"Error recording fee event: {str(e)}")
+        logger.info(f"Recorded fee event for {wallet_address}: ${fee_amount:.2f} ({fee_percent:.2f}%)")
+    
+    def _add_fee_events(self, wallet_address: str, fee_events: List[Dict[str, Any]]) -> None:
+        """
+        Append fee events to a wallet's history and update its running totals.
+        
+        Args:
+            wallet_address: Wallet address to record fees for
+            fee_events: Events built by `_fee_event`
+        """
+        self.fee_history.setdefault(wallet_address, []).extend(fee_events)
+        
+        total_profit, total_fees, num_events = self.fee_totals.get(wallet_address, (0, 0, 0))
+        self.fee_totals[wallet_address] = (
+            total_profit + sum(event["profit_amount"] for event in fee_events),
+            total_fees + sum(event["fee_amount"] for event in fee_events),
+            num_events + len(fee_events),
+        )
     
     def _setup_mock_data(self) -> None:
         """Set up mock data for testing."""
-        # Generate random wallets
-        wallets = [
-            "".join(random.choices("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz", k=44))
-            for _ in range(5)
-        ]
+        # Generate random wallets (Solana addresses are base58-encoded 32-byte keys)
+        wallets = [base58.b58encode(os.urandom(32)).decode("ascii") for _ in range(5)]
         
         # Set up mock staked tokens
         for wallet in wallets:
             staked_amount = random.choice([0, 500, 2500, 15000, 125000, 600000])
             if staked_amount > 0:
-                self.staked_tokens[wallet] = staked_amount
+                self._set_stake(wallet, staked_amount)
                 logger.info(f"Mock wallet {wallet} has {staked_amount} HIRAM tokens staked")
         
         # Set up mock fee history
         for wallet in wallets:
             # Random number of fee events (0-10)
             num_events = random.randint(0, 10)
-            
-            for _ in range(num_events):
-                # Random profit amount ($10-$1000)
-                profit_amount = random.uniform(10, 1000)
-                
-                # Get discount based on staking
-                discount = self.get_fee_discount_for_staking(wallet)
-                effective_fee_percent = max(0, self.default_fee_percent - discount)
-                
-                # Calculate fee
-                fee_amount = profit_amount * (effective_fee_percent / 100)
-                
-                # Record fee event
-                self._record_fee_event(wallet, profit_amount, effective_fee_percent, fee_amount)
+            if num_events == 0:
+                continue
+            
+            # Get discount based on staking (unchanged while generating events)
+            discount = self.get_fee_discount_for_staking(wallet)
+            effective_fee_percent = max(0, self.default_fee_percent - discount)
+            
+            # Random profit amounts ($10-$1000), recorded in one batch; each event
+            # is 1 ns after the previous one so the history stays ordered by time
+            profits = [random.uniform(10, 1000) for _ in range(num_events)]
+            start = time.time_ns()
+            self._add_fee_events(wallet, [
+                _fee_event(start + i, profit_amount, effective_fee_percent, profit_amount * (effective_fee_percent / 100))
+                for i, profit_amount in enumerate(profits)
+            ])
+            logger.info(f"Recorded {num_events} mock fee events for {wallet}")
 
 # Create a singleton instance
 fee_manager = FeeManager() 
\ No newline at end of file
@@ -8,13 +8,18 @@ opportunities based on configurable criteria like APY, TVL, and risk factors.
 
 import os
 import json
+import time
+import logging
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
 import numpy as np
-from datetime import datetime
 
 from src.data_aggregator import data_aggregator
+from src._opportunity_kernels import score_kernel
+
+logger = logging.getLogger(__name__)
 
 # Risk scoring constants
 MIN_TVL_THRESHOLD = 100000  # $100K minimum TVL
@@ -22,6 +27,13 @@ HIGH_TVL_THRESHOLD = 10000000  # $10M considered high TVL (lower risk)
 MIN_APY_THRESHOLD = 5.0  # 5% minimum APY to consider
 SUSPICIOUS_APY_THRESHOLD = 100.0  # APYs over 100% flagged as potentially risky
 
+# Established protocols considered lower risk
+KNOWN_PROTOCOLS = frozenset({"raydium", "orca", "marinade", "solend"})
+
+# Risk level labels and the risk score each one starts at
+RISK_LEVELS = ("Low", "Medium", "High", "Very High")
+RISK_LEVEL_BOUNDS = [25, 50, 75]
+
 class OpportunityDetector:
     """
     Analyzes and ranks yield farming opportunities based on various criteria.
@@ -48,9 +60,16 @@ class OpportunityDetector:
         self.suspicious_apy = suspicious_apy
         self.chain = chain
         
-        # Cache for analyzed opportunities
+        # Cache for analyzed opportunities, their scores and, once needed, their ranking
         self.opportunities = []
-        self.last_update = None
+        self._opportunity_scores = np.empty(0)
+        self._ranked_opportunities: Optional[List[Dict[str, Any]]] = []
+        self._cache_deadline = 0.0
+        
+        # Ranked opportunities grouped by risk level and by lowercased project,
+        # built on the first facet query after each refresh
+        self._by_risk: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._by_project: Optional[Dict[str, List[Dict[str, Any]]]] = None
     
     def calculate_risk_score(self, opportunity: Dict[str, Any]) -> float:
         """
@@ -84,7 +103,7 @@ class OpportunityDetector:
         
         # Protocol-specific adjustments (could be expanded)
         protocol = opportunity.get("project", "").lower()
-        if protocol in ["raydium", "orca", "marinade", "solend"]:
+        if protocol in KNOWN_PROTOCOLS:
             base_score -= 10  # Established protocols considered lower risk
         
         # Normalize score between 0-100
@@ -119,87 +138,178 @@ class OpportunityDetector:
         
         return score
     
-    def detect_opportunities(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+    def _score_batch(self, yields: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
         """
-        Detect and rank yield farming opportunities.
+        Filter and score yield opportunities column-wise.
+        
+        Applies the same rules as `calculate_risk_score` and
+        `calculate_opportunity_score`, but over whole arrays at once.
         
         Args:
-            force_refresh: Whether to force refresh data
+            yields: Raw yield opportunity data
             
         Returns:
-            List[Dict[str, Any]]: Ranked list of opportunities
+            Dict[str, np.ndarray]: Columns for the opportunities meeting the APY and
+            TVL minimums: "index" into `yields`, "apy", "risk_score",
+            "opportunity_score", "risk_level" (index into `RISK_LEVELS`) and
+            "estimated_return_1k_1y"
+        """
+        n = len(yields)
+        apy = np.fromiter((opp.get("apy", 0) for opp in yields), float, n)
+        tvl = np.fromiter((opp.get("tvlUsd", 0) for opp in yields), float, n)
+        
+        # Score only the rows that pass the basic filters
+        index = np.flatnonzero((apy >= self.min_apy) & (tvl >= self.min_tvl))
+        apy = apy[index]
+        tvl = tvl[index]
+        
+        # Resolve protocols once per row with a set lookup, not a string array search
+        is_known = np.fromiter(
+            (yields[i].get("project", "").lower() in KNOWN_PROTOCOLS for i in index.tolist()),
+            bool, len(index),
+        )
+        
+        if score_kernel is not None:
+            risk, opportunity = score_kernel(
+                apy, tvl, is_known,
+                float(self.suspicious_apy), float(MIN_TVL_THRESHOLD), float(HIGH_TVL_THRESHOLD),
+            )
+        else:
+            # TVL factors (higher TVL = lower risk)
+            risk = np.full(len(index), 50.0)
+            risk -= 20 * (tvl >= HIGH_TVL_THRESHOLD)
+            risk -= 10 * ((tvl >= MIN_TVL_THRESHOLD * 5) & (tvl < HIGH_TVL_THRESHOLD))
+            risk += 20 * (tvl < MIN_TVL_THRESHOLD)
+            
+            # APY factors (extremely high APY may indicate higher risk)
+            risk += np.where(apy > self.suspicious_apy, np.minimum(40, (apy - self.suspicious_apy) / 10), 0)
+            
+            # Protocol-specific adjustments
+            risk -= 10 * is_known
+            
+            risk = np.clip(risk, 0, 100)
+            
+            # Weighted score (60% APY capped at 100%, 40% risk factor)
+            opportunity = 0.6 * np.minimum(100, apy) + 0.4 * (100 - risk)
+        
+        return {
+            "index": index,
+            "apy": apy,
+            "risk_score": risk,
+            "opportunity_score": opportunity,
+            "risk_level": np.digitize(risk, RISK_LEVEL_BOUNDS),
+            # For a hypothetical $1000 investment over 1 year
+            "estimated_return_1k_1y": 1000 * (apy / 100),
+        }
+    
+    def _enrich(self, yields: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+        """
+        Filter yield opportunities and annotate the survivors with their scores.
+        
+        The aggregator decodes a fresh list on every call, so its dicts are
+        annotated in place rather than copied, and every opportunity shares
+        the same `RISK_LEVELS` label strings.
+        
+        Args:
+            yields: Raw yield opportunity data
+            
+        Returns:
+            Tuple of (annotated opportunities in their original order, array of
+            their opportunity scores)
+        """
+        scored = self._score_batch(yields)
+        enhanced_opportunities = []
+        
+        for i, risk_score, opportunity_score, risk_index, estimated_return in zip(
+            scored["index"].tolist(),
+            scored["risk_score"].tolist(),
+            scored["opportunity_score"].tolist(),
+            scored["risk_level"].tolist(),
+            scored["estimated_return_1k_1y"].tolist(),
+        ):
+            enhanced_opp = yields[i]
+            enhanced_opp["risk_score"] = risk_score
+            enhanced_opp["opportunity_score"] = opportunity_score
+            enhanced_opp["risk_level"] = RISK_LEVELS[risk_index]
+            enhanced_opp["estimated_return_1k_1y"] = estimated_return
+            enhanced_opportunities.append(enhanced_opp)
+        
+        return enhanced_opportunities, scored["opportunity_score"]
+    
+    @staticmethod
+    def _rank(opportunities: List[Dict[str, Any]], scores: np.ndarray) -> List[Dict[str, Any]]:
+        """Sort opportunities by score, descending, keeping ties in their original order."""
+        order = np.argsort(-scores, kind="stable")
+        return [opportunities[i] for i in order.tolist()]
+    
+    def _refresh_opportunities(self, force_refresh: bool = False) -> None:
+        """
+        Fetch, filter and score yield opportunities unless the cache is still fresh.
+        
+        Fills `self.opportunities` with the annotated opportunities in their
+        original order and `self._opportunity_scores` with their scores; ranking
+        is left to the callers so each sorts only as much as it needs.
+        
+        Args:
+            force_refresh: Whether to force refresh data
         """
         # Skip re-processing if we have recent results (within last hour)
-        if not force_refresh and self.last_update and self.opportunities:
-            time_since_update = (datetime.now() - self.last_update).total_seconds()
-            if time_since_update < 3600:  # 1 hour cache
-                print(f"Using cached opportunities ({len(self.opportunities)} items)")
-                return self.opportunities
+        if not force_refresh and self.opportunities and time.monotonic() < self._cache_deadline:
+            logger.debug("Using cached opportunities (%d items)", len(self.opportunities))
+            return
         
         # Fetch Solana yields
         yields = data_aggregator.fetch_solana_yields(force_refresh)
         
+        self.opportunities = []
+        self._opportunity_scores = np.empty(0)
+        self._ranked_opportunities = []
+        self._by_risk = None
+        self._by_project = None
+        
         if not yields:
-            print("No yield data available")
-            return []
+            logger.warning("No yield data available")
+            return
         
-        print(f"Analyzing {len(yields)} yield opportunities...")
+        logger.debug("Analyzing %d yield opportunities...", len(yields))
         
-        # Filter and enhance opportunities
-        filtered_opportunities = []
+        filtered_opportunities, scores = self._enrich(yields)
         
-        for opp in yields:
-            # Apply basic filters
-            apy = opp.get("apy", 0)
-            tvl = opp.get("tvlUsd", 0)
-            
-            if apy >= self.min_apy and tvl >= self.min_tvl:
-                # Calculate scores
-                risk_score = self.calculate_risk_score(opp)
-                opportunity_score = self.calculate_opportunity_score(opp)
-                
-                # Add scores to the opportunity data
-                enhanced_opp = opp.copy()
-                enhanced_opp["risk_score"] = risk_score
-                enhanced_opp["opportunity_score"] = opportunity_score
-                
-                # Add a risk level label
-                if risk_score < 25:
-                    risk_level = "Low"
-                elif risk_score < 50:
-                    risk_level = "Medium"
-                elif risk_score < 75:
-                    risk_level = "High"
-                else:
-                    risk_level = "Very High"
-                
-                enhanced_opp["risk_level"] = risk_level
-                
-                # Calculate estimated returns
-                # For a hypothetical $1000 investment over 1 year
-                estimated_return = 1000 * (apy / 100)
-                enhanced_opp["estimated_return_1k_1y"] = estimated_return
-                
-                filtered_opportunities.append(enhanced_opp)
-        
-        # Sort by opportunity score (descending)
-        sorted_opportunities = sorted(
-            filtered_opportunities,
-            key=lambda x: x.get("opportunity_score", 0),
-            reverse=True
-        )
+        # Update cache; the full ranking is built on first use
+        self.opportunities = filtered_opportunities
+        self._opportunity_scores = scores
+        self._ranked_opportunities = None
+        self._cache_deadline = time.monotonic() + 3600  # 1 hour cache
+        
+        logger.debug("Found %d viable opportunities", len(filtered_opportunities))
+    
+    def detect_opportunities(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Detect and rank yield farming opportunities.
         
-        # Update cache
-        self.opportunities = sorted_opportunities
-        self.last_update = datetime.now()
+        Args:
+            force_refresh: Whether to force refresh data
+            
+        Returns:
+            List[Dict[str, Any]]: Ranked list of opportunities
+        """
+        self._refresh_opportunities(force_refresh)
+        return self._ranked()
+    
+    def _ranked(self) -> List[Dict[str, Any]]:
+        """Return the cached opportunities ranked by score, without refreshing them."""
+        if self._ranked_opportunities is None:
+            self._ranked_opportunities = self._rank(self.opportunities, self._opportunity_scores)
         
-        print(f"Found {len(sorted_opportunities)} viable opportunities")
-        return sorted_opportunities
+        return self._ranked_opportunities
     
     def get_top_opportunities(self, top_n: int = 10, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get the top N yield opportunities.
         
+        Selects the top N scores with a partial partition instead of ranking
+        every opportunity.
+        
         Args:
             top_n: Number of top opportunities to return
             force_refresh: Whether to force refresh data
@@ -207,8 +317,40 @@ class OpportunityDetector:
         Returns:
             List[Dict[str, Any]]: Top opportunities
         """
-        opportunities = self.detect_opportunities(force_refresh)
-        return opportunities[:top_n]
+        self._refresh_opportunities(force_refresh)
+        
+        scores = self._opportunity_scores
+        if top_n <= 0:
+            return []
+        if self._ranked_opportunities is not None or top_n >= len(scores):
+            return self._ranked()[:top_n]
+        
+        # Every score tied with the N-th best is a candidate, so the stable sort
+        # below picks the same head as a full ranking would
+        kth_score = -np.partition(-scores, top_n - 1)[top_n - 1]
+        candidates = np.flatnonzero(scores >= kth_score)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")][:top_n]
+        
+        return [self.opportunities[i] for i in order.tolist()]
+    
+    def _facet_indexes(self) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]:
+        """
+        Group the cached ranked opportunities by risk level and by project.
+        
+        Returns:
+            Tuple of (risk level -> opportunities, lowercased project -> opportunities),
+            each list in ranked order
+        """
+        if self._by_risk is None:
+            by_risk = defaultdict(list)
+            by_project = defaultdict(list)
+            for opp in self._ranked():
+                by_risk[opp.get("risk_level")].append(opp)
+                by_project[opp.get("project", "").lower()].append(opp)
+            self._by_risk = dict(by_risk)
+            self._by_project = dict(by_project)
+        
+        return self._by_risk, self._by_project
     
     def get_opportunities_by_risk_level(self, risk_level: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """
@@ -221,8 +363,8 @@ class OpportunityDetector:
         Returns:
             List[Dict[str, Any]]: Opportunities matching the risk level
         """
-        opportunities = self.detect_opportunities(force_refresh)
-        return [opp for opp in opportunities if opp.get("risk_level") == risk_level]
+        self._refresh_opportunities(force_refresh)
+        return list(self._facet_indexes()[0].get(risk_level, []))
     
     def get_protocol_opportunities(self, protocol: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """
@@ -240,56 +382,12 @@ class OpportunityDetector:
         
         if not protocol_yields:
             # Fallback to filtering all opportunities
-            opportunities = self.detect_opportunities(force_refresh)
-            protocol_opportunities = [
-                opp for opp in opportunities 
-                if opp.get("project", "").lower() == protocol.lower()
-            ]
-            return protocol_opportunities
+            self._refresh_opportunities(force_refresh)
+            return list(self._facet_indexes()[1].get(protocol.lower(), []))
         
         # Process protocol-specific yields
-        enhanced_opportunities = []
-        
-        for opp in protocol_yields:
-            apy = opp.get("apy", 0)
-            tvl = opp.get("tvlUsd", 0)
-            
-            if apy >= self.min_apy and tvl >= self.min_tvl:
-                # Calculate scores
-                risk_score = self.calculate_risk_score(opp)
-                opportunity_score = self.calculate_opportunity_score(opp)
-                
-                # Add scores to the opportunity data
-                enhanced_opp = opp.copy()
-                enhanced_opp["risk_score"] = risk_score
-                enhanced_opp["opportunity_score"] = opportunity_score
-                
-                # Add a risk level label
-                if risk_score < 25:
-                    risk_level = "Low"
-                elif risk_score < 50:
-                    risk_level = "Medium"
-                elif risk_score < 75:
-                    risk_level = "High"
-                else:
-                    risk_level = "Very High"
-                
-                enhanced_opp["risk_level"] = risk_level
-                
-                # Calculate estimated returns
-                estimated_return = 1000 * (apy / 100)
-                enhanced_opp["estimated_return_1k_1y"] = estimated_return
-                
-                enhanced_opportunities.append(enhanced_opp)
-        
-        # Sort by opportunity score (descending)
-        sorted_opportunities = sorted(
-            enhanced_opportunities,
-            key=lambda x: x.get("opportunity_score", 0),
-            reverse=True
-        )
-        
-        return sorted_opportunities
+        opportunities, scores = self._enrich(protocol_yields)
+        return self._rank(opportunities, scores)
 
 # Create a global instance
 opportunity_detector = OpportunityDetector()
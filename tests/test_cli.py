@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+"""
+Test module for the HiramAbiff command line interface
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def run_python(code, **env_vars):
+    """Run `code` in a fresh interpreter with the package on the path."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), **env_vars)
+    return subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True,
+    )
+
+
+def test_import_cli_does_not_load_matplotlib():
+    """Importing the CLI must not import any analysis or plotting modules."""
+    result = run_python(
+        "import sys\n"
+        "import hiramabiff.cli\n"
+        "assert 'matplotlib' not in sys.modules\n"
+        "assert 'hiramabiff.analysis' not in sys.modules\n"
+        "assert 'hiramabiff.wallet' not in sys.modules\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_token_handler_does_not_load_matplotlib():
+    """Resolving the token tracker must not run the visualizer import."""
+    for module in ("numpy", "pandas", "aiohttp", "dotenv", "loguru"):
+        pytest.importorskip(module)
+    
+    result = run_python(
+        "import sys\n"
+        "import hiramabiff.cli as cli\n"
+        "cli.TokenTracker\n"
+        "assert 'matplotlib' not in sys.modules\n"
+        "assert 'seaborn' not in sys.modules\n"
+        "assert 'hiramabiff.analysis.visualizer' not in sys.modules\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def load_by_path(relpath, then="", **env_vars):
+    """Load `relpath` through the CLI's direct-run fallback, without the package.
+    
+    `then` is run afterwards with the loaded module bound to `module`.
+    """
+    return run_python(
+        "import importlib.util, sys\n"
+        "sys.modules['hiramabiff'] = None  # make the package unimportable\n"
+        f"spec = importlib.util.spec_from_file_location('cli', {str(SRC_DIR / 'hiramabiff' / 'cli.py')!r})\n"
+        "cli = sys.modules['cli'] = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(cli)\n"
+        f"module = cli._load_from_path({relpath!r})\n"
+        + then,
+        **env_vars,
+    )
+
+
+@pytest.mark.parametrize("relpath, requires", [
+    ("analysis/token_tracker.py", ("numpy", "pandas", "aiohttp", "dotenv", "loguru")),
+    ("analysis/visualizer.py", ("numpy", "pandas", "matplotlib", "seaborn", "PIL", "loguru")),
+])
+def test_analysis_module_loads_by_path(relpath, requires):
+    """Analysis modules must import when loaded outside their package."""
+    for module in requires:
+        pytest.importorskip(module)
+    
+    result = load_by_path(relpath)
+    assert result.returncode == 0, result.stderr
+
+
+def run_cli(*args, home=None):
+    """Run the CLI in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    env.pop("HIRAMABIFF_LOG_FILE", None)
+    if home is not None:
+        env["HOME"] = str(home)
+    return subprocess.run(
+        [sys.executable, "-m", "hiramabiff.cli", *args], env=env, capture_output=True, text=True,
+    )
+
+
+def import_cli():
+    """Import the CLI module in this process."""
+    sys.path.insert(0, str(SRC_DIR))
+    try:
+        from hiramabiff import cli
+    finally:
+        sys.path.remove(str(SRC_DIR))
+    return cli
+
+
+def test_help_lists_every_command():
+    """`--help` builds every command parser so the listing is complete."""
+    result = run_cli("--help")
+    assert result.returncode == 0, result.stderr
+    assert "{yield,wallet,token,llm}" in result.stdout
+
+
+def test_version_flags_skip_parsing():
+    """`--version` and `-v` answer before any command is parsed or run."""
+    version = import_cli().__version__
+    
+    for args in (["--version"], ["-v", "token", "price", "BTC"]):
+        result = run_cli(*args)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == f"HiramAbiff v{version}"
+
+
+def test_log_file_value_is_not_taken_for_the_command(tmp_path):
+    """The `--log-file` value is skipped when finding the command to build."""
+    pytest.importorskip("loguru")
+    pytest.importorskip("base58")
+    
+    log_file = tmp_path / "cli.log"
+    result = run_cli("--log-file", str(log_file), "wallet", "list", home=tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert "No wallets found" in result.stdout
+    assert log_file.exists()
+
+
+def test_unknown_command_lists_choices():
+    """An unknown command is rejected with the full list of valid choices."""
+    result = run_cli("frobnicate")
+    assert result.returncode == 2
+    assert "invalid choice: 'frobnicate'" in result.stderr
+    for command in ("yield", "wallet", "token", "llm"):
+        assert repr(command) in result.stderr
+
+
+def test_unknown_subcommand_lists_choices():
+    """An unknown subcommand builds all of its siblings for the error."""
+    result = run_cli("token", "frobnicate")
+    assert result.returncode == 2
+    for subcommand in ("price", "analyze", "portfolio", "compare", "volatility"):
+        assert repr(subcommand) in result.stderr
+
+
+def test_sniff_command_skips_values_of_any_valued_option():
+    """Valued options are read from the parser, not a hand-kept list."""
+    import argparse
+    
+    cli = import_cli()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--log-file")
+    parser.add_argument("--profile", "-p")
+    value_options = cli._value_options(parser)
+    
+    assert value_options == {"--log-file", "--profile", "-p"}
+    assert cli._sniff_command(["--log-file", "out.log", "wallet", "list"], value_options) == ("wallet", "list")
+    assert cli._sniff_command(["-p", "prod", "--verbose", "token"], value_options) == ("token", None)
+    assert cli._sniff_command(["--log-file=out.log", "llm", "market"], value_options) == ("llm", "market")
+    assert cli._sniff_command(["--verbose"], value_options) == (None, None)
+
+
+def test_numba_cache_is_shared_between_load_modes(tmp_path):
+    """Kernels cached by a path load must load under the package, and back."""
+    for module in ("numba", "numpy", "pandas", "aiohttp", "dotenv", "loguru"):
+        pytest.importorskip(module)
+    
+    call = (
+        "import numpy as np\n"
+        "module.portfolio_stats(np.ones((2, 8)), np.array([8, 3], dtype=np.int64))\n"
+    )
+    cache = {"NUMBA_CACHE_DIR": str(tmp_path)}
+    
+    result = load_by_path("analysis/token_tracker.py", then=call, **cache)
+    assert result.returncode == 0, result.stderr
+    result = run_python("from hiramabiff.analysis import token_tracker as module\n" + call, **cache)
+    assert result.returncode == 0, result.stderr
+    result = load_by_path("analysis/token_tracker.py", then=call, **cache)
+    assert result.returncode == 0, result.stderr
+
+
+def test_numba_chart_cache_is_shared_between_load_modes(tmp_path):
+    """The visualizer's kernels cached by a path load must load under the package."""
+    for module in ("numba", "numpy", "pandas", "matplotlib", "seaborn", "PIL", "loguru"):
+        pytest.importorskip(module)
+    
+    call = (
+        "import numpy as np\n"
+        "module.price_chart_stats(np.linspace(1, 2, 50), np.array([7, 30], dtype=np.int64))\n"
+    )
+    cache = {"NUMBA_CACHE_DIR": str(tmp_path)}
+    
+    result = load_by_path("analysis/visualizer.py", then=call, **cache)
+    assert result.returncode == 0, result.stderr
+    result = run_python("from hiramabiff.analysis import visualizer as module\n" + call, **cache)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""
+Test module for the FeeManager staking tiers and fee totals
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+pytest.importorskip("base58")
+
+# The fee manager lives in the top-level `src` package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.monetization.fee_manager import FeeManager
+
+WALLET = "TestWallet1111111111111111111111111111111111"
+
+
+@pytest.fixture
+def manager():
+    """Create a fee manager without any mock wallets."""
+    manager = FeeManager()
+    manager.staked_tokens.clear()
+    manager.fee_history.clear()
+    manager.fee_totals.clear()
+    return manager
+
+
+@pytest.mark.parametrize("amount, discount", [
+    (1, 0.0),
+    (999.99, 0.0),
+    (1000, 0.01),
+    (9999.99, 0.01),
+    (10000, 0.05),
+    (99999.99, 0.05),
+    (100000, 0.1),
+    (499999.99, 0.1),
+    (500000, 0.5),
+    (10 ** 9, 0.5),
+])
+def test_discount_at_tier_thresholds(manager, amount, discount):
+    """Each tier starts exactly at its threshold."""
+    result = manager.stake_tokens(WALLET, amount)
+    assert result["new_discount"] == discount
+    assert manager.get_fee_discount_for_staking(WALLET) == discount
+    assert manager.staked_tokens[WALLET] == (amount, discount)
+
+
+def test_unstake_drops_back_a_tier(manager):
+    """Unstaking below a threshold recomputes the stored discount."""
+    manager.stake_tokens(WALLET, 10000)
+    assert manager.get_fee_discount_for_staking(WALLET) == 0.05
+    
+    result = manager.unstake_tokens(WALLET, 1)
+    assert result["staked_amount"] == 9999
+    assert manager.staked_tokens[WALLET] == (9999, 0.01)
+    
+    manager.unstake_tokens(WALLET, 9999)
+    assert manager.staked_tokens[WALLET] == (0, 0.0)
+    assert "error" in manager.unstake_tokens(WALLET, 1)
+
+
+def test_fee_totals_follow_stake_changes(manager):
+    """Running totals match the fee history as the discount changes."""
+    manager.calculate_fee(100.0, WALLET)
+    manager.stake_tokens(WALLET, 500000)
+    manager.calculate_fee(200.0, WALLET)
+    manager.unstake_tokens(WALLET, 400000)
+    manager.calculate_fee(300.0, WALLET)
+    
+    history = manager.fee_history[WALLET]
+    assert [event["fee_percent"] for event in history] == pytest.approx([1.0, 0.5, 0.9])
+    
+    stats = manager.get_fee_stats(WALLET)
+    assert stats["num_transactions"] == 3
+    assert stats["total_profit"] == pytest.approx(sum(event["profit_amount"] for event in history))
+    assert stats["total_fees"] == pytest.approx(sum(event["fee_amount"] for event in history))
+    assert stats["total_fees"] == pytest.approx(1.0 + 1.0 + 2.7)
+    assert stats["current_discount"] == 0.1
+
+
+def test_fee_stats_without_totals_sum_history(manager):
+    """History recorded without the running totals is summed on demand."""
+    manager.fee_history[WALLET] = [
+        {"profit_amount": 100.0, "fee_amount": 1.0},
+        {"profit_amount": 50.0, "fee_amount": 0.5},
+    ]
+    stats = manager.get_fee_stats(WALLET)
+    assert stats["total_profit"] == 150.0
+    assert stats["total_fees"] == 1.5
+    assert stats["num_transactions"] == 2
+
+
+@pytest.mark.parametrize("profit_amount", ["100", "abc", None, [100]])
+def test_calculate_fee_rejects_non_numbers(manager, profit_amount):
+    """Non-numeric profits, numeric strings included, return an error dict."""
+    result = manager.calculate_fee(profit_amount, WALLET)
+    assert "error" in result
+    assert WALLET not in manager.fee_history
+
+
+def test_calculate_fee_accepts_numpy_scalars(manager):
+    """NumPy scalars are real numbers and are accepted."""
+    np = pytest.importorskip("numpy")
+    
+    result = manager.calculate_fee(np.float64(100.0))
+    assert result["fee_amount"] == pytest.approx(1.0)
+
+
+def test_mock_fee_history_follows_seeded_random():
+    """Mock fee events come from `random` and match the per-event schema."""
+    def mock_events():
+        random.seed(1234)
+        manager = FeeManager()
+        return sorted(
+            [(event["profit_amount"], event["fee_percent"]) for event in events]
+            for events in manager.fee_history.values()
+        ), manager
+    
+    first, manager = mock_events()
+    second, _ = mock_events()
+    assert first == second
+    
+    recorded = FeeManager()
+    recorded._record_fee_event(WALLET, 100.0, 1.0, 1.0)
+    schema = set(recorded.fee_history[WALLET][0])
+    for wallet, events in manager.fee_history.items():
+        assert all(set(event) == schema for event in events)
+        timestamps = [event["timestamp_ns"] for event in events]
+        assert timestamps == sorted(set(timestamps))
+        total_profit, total_fees, count = manager.fee_totals[wallet]
+        assert count == len(events)
+        assert total_profit == pytest.approx(sum(event["profit_amount"] for event in events))
+        assert total_fees == pytest.approx(sum(event["fee_amount"] for event in events))
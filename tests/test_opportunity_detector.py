@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+"""
+Test module for the OpportunityDetector
+"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("requests")
+
+# The detector lives in the top-level `src` package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import opportunity_detector as od
+
+
+@pytest.fixture
+def fetch_counter(monkeypatch):
+    """Serve yields from a list and count the upstream fetches."""
+    state = {"yields": [], "fetches": 0}
+    
+    def fetch_solana_yields(force_refresh=False):
+        state["fetches"] += 1
+        return [dict(opp) for opp in state["yields"]]
+    
+    monkeypatch.setattr(od.data_aggregator, "fetch_solana_yields", fetch_solana_yields)
+    return state
+
+
+def test_top_opportunities_with_no_yields_fetch_once(fetch_counter):
+    """An empty result is returned without a second upstream fetch."""
+    detector = od.OpportunityDetector()
+    assert detector.get_top_opportunities(top_n=5) == []
+    assert fetch_counter["fetches"] == 1
+
+
+def test_facet_queries_with_no_yields_fetch_once(fetch_counter, monkeypatch):
+    """Facet queries over an empty result do not trigger a second fetch."""
+    monkeypatch.setattr(od.data_aggregator, "fetch_protocol_yields", lambda protocol, force_refresh=False: [])
+    
+    detector = od.OpportunityDetector()
+    assert detector.get_opportunities_by_risk_level("Low") == []
+    assert fetch_counter["fetches"] == 1
+    
+    detector = od.OpportunityDetector()
+    assert detector.get_protocol_opportunities("raydium") == []
+    assert fetch_counter["fetches"] == 2
+
+
+def test_facets_group_ranked_opportunities(fetch_counter, monkeypatch):
+    """Risk and project facets keep the ranked order."""
+    fetch_counter["yields"] = [
+        {"project": "Orca", "symbol": "A", "apy": 10.0, "tvlUsd": 2e7},
+        {"project": "orca", "symbol": "B", "apy": 30.0, "tvlUsd": 2e7},
+        {"project": "unknown", "symbol": "C", "apy": 500.0, "tvlUsd": 2e5},
+    ]
+    monkeypatch.setattr(od.data_aggregator, "fetch_protocol_yields", lambda protocol, force_refresh=False: [])
+    detector = od.OpportunityDetector()
+    
+    assert [opp["symbol"] for opp in detector.get_opportunities_by_risk_level("Low")] == ["B", "A"]
+    assert [opp["symbol"] for opp in detector.get_opportunities_by_risk_level("Very High")] == ["C"]
+    assert [opp["symbol"] for opp in detector.get_protocol_opportunities("ORCA")] == ["B", "A"]
+    assert fetch_counter["fetches"] == 1
+
+
+# Yields around every scoring threshold, plus missing and non-finite values
+SCORING_FIXTURE = [
+    {"project": "Raydium", "apy": 12.0, "tvlUsd": od.HIGH_TVL_THRESHOLD},
+    {"project": "orca", "apy": 8.0, "tvlUsd": od.HIGH_TVL_THRESHOLD - 1},
+    {"project": "unknown", "apy": 6.0, "tvlUsd": od.MIN_TVL_THRESHOLD * 5},
+    {"project": "unknown", "apy": 6.0, "tvlUsd": od.MIN_TVL_THRESHOLD * 5 - 1},
+    {"project": "unknown", "apy": 5.0, "tvlUsd": od.MIN_TVL_THRESHOLD},
+    {"project": "unknown", "apy": 5.0, "tvlUsd": od.MIN_TVL_THRESHOLD - 1},
+    {"project": "marinade", "apy": od.SUSPICIOUS_APY_THRESHOLD, "tvlUsd": 1e6},
+    {"project": "marinade", "apy": od.SUSPICIOUS_APY_THRESHOLD + 55, "tvlUsd": 1e6},
+    {"project": "solend", "apy": 5000.0, "tvlUsd": 1.0},
+    {"apy": 20.0, "tvlUsd": 2e6},
+    {"project": "unknown", "tvlUsd": 2e6},
+    {"project": "unknown", "apy": 20.0},
+    {"project": "unknown", "apy": 20.0, "tvlUsd": 0.0},
+    {"project": "unknown", "apy": 0.0, "tvlUsd": 0.0},
+    {"project": "unknown", "apy": float("nan"), "tvlUsd": 2e6},
+    {"project": "unknown", "apy": 20.0, "tvlUsd": float("nan")},
+    {"project": "orca", "apy": float("inf"), "tvlUsd": 2e6},
+]
+
+
+def reference_scores(detector, yields):
+    """Score yields one at a time with the original per-opportunity rules."""
+    rows = []
+    for i, opp in enumerate(yields):
+        if not (opp.get("apy", 0) >= detector.min_apy and opp.get("tvlUsd", 0) >= detector.min_tvl):
+            continue
+        risk_score = detector.calculate_risk_score(opp)
+        if risk_score < 25:
+            risk_level = "Low"
+        elif risk_score < 50:
+            risk_level = "Medium"
+        elif risk_score < 75:
+            risk_level = "High"
+        else:
+            risk_level = "Very High"
+        rows.append((i, risk_score, detector.calculate_opportunity_score(opp), risk_level))
+    return rows
+
+
+def batch_scores(scored):
+    """Convert `_score_batch` columns into reference-style rows."""
+    return list(zip(
+        scored["index"].tolist(),
+        scored["risk_score"].tolist(),
+        scored["opportunity_score"].tolist(),
+        [od.RISK_LEVELS[i] for i in scored["risk_level"].tolist()],
+    ))
+
+
+def assert_rows_match(actual, expected):
+    assert [row[0] for row in actual] == [row[0] for row in expected]
+    for (_, risk, score, level), (_, ref_risk, ref_score, ref_level) in zip(actual, expected):
+        assert risk == pytest.approx(ref_risk)
+        assert score == pytest.approx(ref_score)
+        assert level == ref_level
+
+
+@pytest.fixture(params=[(od.MIN_APY_THRESHOLD, od.MIN_TVL_THRESHOLD), (0.0, 0.0)], ids=["default", "unfiltered"])
+def scoring_detector(request):
+    min_apy, min_tvl = request.param
+    return od.OpportunityDetector(min_apy=min_apy, min_tvl=min_tvl)
+
+
+def test_numpy_scores_match_reference(scoring_detector, monkeypatch):
+    """The NumPy fallback scores like the per-opportunity formula."""
+    monkeypatch.setattr(od, "score_kernel", None)
+    expected = reference_scores(scoring_detector, SCORING_FIXTURE)
+    assert_rows_match(batch_scores(scoring_detector._score_batch(SCORING_FIXTURE)), expected)
+
+
+def test_kernel_scores_match_reference(scoring_detector):
+    """The compiled kernel, when available, scores like the per-opportunity formula."""
+    if od.score_kernel is None:
+        pytest.skip("Numba is not installed")
+    expected = reference_scores(scoring_detector, SCORING_FIXTURE)
+    assert_rows_match(batch_scores(scoring_detector._score_batch(SCORING_FIXTURE)), expected)
+
+
+def test_python_kernel_matches_reference(scoring_detector, monkeypatch):
+    """The uncompiled kernel loop scores like the per-opportunity formula."""
+    from src import _opportunity_kernels
+    
+    monkeypatch.setattr(od, "score_kernel", _opportunity_kernels._score)
+    expected = reference_scores(scoring_detector, SCORING_FIXTURE)
+    assert_rows_match(batch_scores(scoring_detector._score_batch(SCORING_FIXTURE)), expected)
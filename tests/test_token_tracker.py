@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+"""
+Test module for the TokenTracker price cache
+"""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("aiohttp")
+
+try:
+    from hiramabiff.analysis.token_tracker import MAX_CONCURRENT_FETCHES, TokenTracker
+except ImportError:
+    import sys
+    import os
+    
+    # Add the parent directory to the path
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.hiramabiff.analysis.token_tracker import MAX_CONCURRENT_FETCHES, TokenTracker
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    """Create a tracker whose price fetches are served locally."""
+    tracker = TokenTracker(data_dir=str(tmp_path))
+    tracker.fetches = []
+    
+    async def fake_fetch(symbol):
+        tracker.fetches.append(symbol)
+        await asyncio.sleep(0)
+        price_data = {"symbol": symbol, "price_usd": float(len(tracker.fetches))}
+        tracker._store_price(symbol, price_data)
+        return price_data
+    
+    monkeypatch.setattr(tracker, "_fetch_token_price", fake_fetch)
+    return tracker
+
+
+def test_each_request_counts_one_access(tracker):
+    """A miss counts once, not once per cache check."""
+    asyncio.run(tracker.get_token_price("btc"))
+    assert tracker._access_counts["BTC"] == 1
+    
+    asyncio.run(tracker.get_token_price("btc"))
+    assert tracker._access_counts["BTC"] == 2
+    assert tracker.fetches == ["BTC"]
+
+
+def test_concurrent_misses_fetch_once_and_release_lock(tracker):
+    """Concurrent misses share one fetch and leave no per-symbol lock behind."""
+    async def run():
+        return await asyncio.gather(*(tracker.get_token_price("ETH") for _ in range(5)))
+    
+    results = asyncio.run(run())
+    assert tracker.fetches == ["ETH"]
+    assert all(result is results[0] for result in results)
+    assert tracker._price_locks == {}
+    assert not tracker._price_lock_users
+
+
+def test_hot_promotion_after_threshold(tracker):
+    """A symbol joins the hot set once fetched at the promotion threshold."""
+    tracker.hot_promotion_threshold = 2
+    tracker.cache_duration = 0  # every request misses
+    
+    asyncio.run(tracker.get_token_price("SOL"))
+    assert "SOL" not in tracker._hot_symbols
+    
+    asyncio.run(tracker.get_token_price("SOL"))
+    assert "SOL" in tracker._hot_symbols
+
+
+def test_hot_set_replaces_least_frequently_used(tracker):
+    """A full hot set only admits symbols used more than its coldest member."""
+    tracker.hot_cache_size = 1
+    tracker.hot_promotion_threshold = 1
+    tracker.cache_duration = 0
+    
+    asyncio.run(tracker.get_token_price("BTC"))
+    asyncio.run(tracker.get_token_price("BTC"))
+    asyncio.run(tracker.get_token_price("ETH"))
+    assert tracker._hot_symbols == {"BTC"}
+    
+    for _ in range(3):
+        asyncio.run(tracker.get_token_price("ETH"))
+    assert tracker._hot_symbols == {"ETH"}
+
+
+def test_eviction_keeps_hot_and_frequent_symbols(tracker):
+    """Eviction drops expired, then least frequently used, non-hot entries."""
+    tracker.price_cache_max_size = 2
+    tracker._hot_symbols.add("HOT")
+    tracker._access_counts.update({"HOT": 1, "COLD": 1, "WARM": 5})
+    for symbol in ("HOT", "COLD", "WARM"):
+        tracker._store_price(symbol, {"symbol": symbol})
+    
+    assert set(tracker.price_cache) == {"HOT", "WARM"}
+    assert "COLD" not in tracker.price_cache_expiry
+    assert "COLD" not in tracker._access_counts
+
+
+def test_refresher_keeps_hot_prices_fresh(tracker):
+    """While the refresher runs, hot symbols are re-fetched and never expire."""
+    tracker.cache_duration = 0.05
+    tracker.hot_promotion_threshold = 1
+    
+    async def run():
+        await tracker.get_token_price("BTC")
+        assert "BTC" in tracker._hot_symbols
+        
+        tracker.start_price_refresher()
+        try:
+            await asyncio.sleep(0.2)
+            # Expired by TTL, but served from the cache while the refresher runs
+            tracker.price_cache_expiry["BTC"] = time.monotonic() - tracker.cache_duration
+            fetches = len(tracker.fetches)
+            await tracker.get_token_price("BTC")
+            assert len(tracker.fetches) == fetches
+        finally:
+            await tracker.stop_price_refresher()
+        
+        assert not tracker._refresher_running()
+    
+    asyncio.run(run())
+    assert tracker.fetches.count("BTC") > 1
+
+
+def test_failing_refresher_lets_hot_price_expire(tracker, monkeypatch):
+    """A hot price expires once refreshes have failed for too long."""
+    tracker.cache_duration = 0.05
+    tracker.hot_promotion_threshold = 1
+    
+    async def run():
+        await tracker.get_token_price("BTC")
+        assert "BTC" in tracker._hot_symbols
+        
+        async def failing_fetch(symbol):
+            tracker.fetches.append(symbol)
+            raise ValueError("429 Too Many Requests")
+        
+        monkeypatch.setattr(tracker, "_fetch_token_price", failing_fetch)
+        tracker.start_price_refresher()
+        try:
+            # Past the TTL but within the cap, the hot price is still served
+            await asyncio.sleep(tracker.cache_duration * 1.5)
+            assert tracker._get_cached_price("BTC") is not None
+            
+            await asyncio.sleep(tracker.cache_duration * tracker.hot_max_stale_ttls)
+            assert tracker._get_cached_price("BTC") is None
+            with pytest.raises(ValueError):
+                await tracker.get_token_price("BTC")
+        finally:
+            await tracker.stop_price_refresher()
+        
+        assert tracker.fetches.count("BTC") > 2
+    
+    asyncio.run(run())
+
+
+def test_analyze_tokens_skips_failures_and_caps_concurrency(tracker, monkeypatch):
+    """Failed symbols are dropped and at most MAX_CONCURRENT_FETCHES run at once."""
+    import numpy as np
+    
+    state = {"in_flight": 0, "peak": 0}
+    
+    async def get_token_price(symbol):
+        return {
+            "id": symbol.lower(), "price_usd": 1.0, "market_cap_usd": 1.0,
+            "volume_24h_usd": 1.0, "change_24h_percent": 0.0,
+        }
+    
+    async def get_token_historical_arrays(symbol, days=30):
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        if symbol == "BAD":
+            raise ValueError("Token BAD not found")
+        prices = np.linspace(1.0, 2.0, 30)
+        return np.arange(30, dtype=np.int64), prices, prices, prices
+    
+    monkeypatch.setattr(tracker, "get_token_price", get_token_price)
+    monkeypatch.setattr(tracker, "get_token_historical_arrays", get_token_historical_arrays)
+    
+    symbols = [f"T{i}" for i in range(12)] + ["BAD"]
+    analyses = asyncio.run(tracker.analyze_tokens(symbols))
+    
+    assert set(analyses) == set(symbols) - {"BAD"}
+    assert analyses["T0"]["stats"]["max_price_30d"] == pytest.approx(2.0)
+    assert state["peak"] <= MAX_CONCURRENT_FETCHES
+    
+    with pytest.raises(ValueError):
+        asyncio.run(tracker.analyze_token("BAD"))
+    assert asyncio.run(tracker.analyze_tokens(["BAD"])) == {}
@@ -131,8 +131,21 @@ def test_create_portfolio_pie_chart(temp_output_dir, sample_portfolio_data):
     
     # Check that file was created
     assert os.path.exists(output_path)
-    assert output_path.endswith(".png")
+    assert output_path.endswith(".svg")
     assert os.path.getsize(output_path) > 0  # File should not be empty
+    
+    # Raster output is still available
+    png_path = visualizer.create_portfolio_pie_chart(
+        sample_portfolio_data,
+        title="Test Portfolio",
+        save=True,
+        show=False,
+        fmt="png"
+    )
+    
+    assert os.path.exists(png_path)
+    assert png_path.endswith(".png")
+    assert os.path.getsize(png_path) > 0
 
 
 # Test multi-token chart creation
@@ -218,7 +231,7 @@ def test_create_correlation_heatmap(temp_output_dir, sample_price_data):
     
     # Check that file was created
     assert os.path.exists(output_path)
-    assert output_path.endswith(".png")
+    assert output_path.endswith(".svg")
     assert os.path.getsize(output_path) > 0
 
 
@@ -268,5 +281,30 @@ def test_create_volatility_comparison(temp_output_dir):
     assert os.path.getsize(output_path) > 0
 
 
+def test_create_volatility_comparison_many_tokens(temp_output_dir):
+    """Test a volatility comparison with more tokens than palette colors."""
+    visualizer = TokenVisualizer(output_dir=temp_output_dir)
+    
+    # More tokens than the 10-color palettes hold
+    token_analyses = {
+        f"TOK{i}": {
+            "symbol": f"TOK{i}",
+            "current_price_usd": 1.0 + i,
+            "market_cap_usd": 1000000 * (i + 1),
+            "stats": {"volatility_30d": 0.01 * (i + 1)}
+        }
+        for i in range(15)
+    }
+    
+    output_path = visualizer.create_volatility_comparison(
+        token_analyses,
+        save=True,
+        show=False
+    )
+    
+    assert os.path.exists(output_path)
+    assert os.path.getsize(output_path) > 0
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__]) 
\ No newline at end of file
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+"""
+Test module for the WalletManager balance cache
+"""
+
+import asyncio
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("base58")
+pytest.importorskip("loguru")
+
+try:
+    from hiramabiff.wallet import wallet_manager
+except ImportError:
+    import sys
+    import os
+    
+    # Add the parent directory to the path
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.hiramabiff.wallet import wallet_manager
+
+PUBLIC_KEY = "FakeSolanaKey1111111111111111111111111111111"
+
+
+class FakeSolanaRPC:
+    """Solana RPC stand-in that can be taken offline."""
+    
+    def __init__(self):
+        self.lamports = 1_000_000_000
+        self.online = True
+        self.calls = 0
+    
+    def _check(self):
+        self.calls += 1
+        if not self.online:
+            raise ConnectionError("RPC unavailable")
+    
+    async def get_balance(self, public_key):
+        self._check()
+        return SimpleNamespace(value=self.lamports)
+    
+    async def get_multiple_accounts(self, public_keys):
+        self._check()
+        return SimpleNamespace(value=[SimpleNamespace(lamports=self.lamports) for _ in public_keys])
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Create a manager with one Solana wallet served by a fake RPC."""
+    monkeypatch.setattr(wallet_manager, "_solana", lambda: SimpleNamespace(Pubkey=SimpleNamespace(from_string=str)))
+    monkeypatch.setattr(wallet_manager, "_ethereum", lambda: None)
+    
+    wallet = {"name": "main", "chain": "solana", "public_key": PUBLIC_KEY, "private_key_b58": "secret"}
+    (tmp_path / "main.json").write_text(json.dumps(wallet))
+    
+    manager = wallet_manager.WalletManager(wallet_dir=str(tmp_path))
+    manager.solana_client = FakeSolanaRPC()
+    manager.BALANCE_CACHE_TTL = 0.05
+    return manager
+
+
+def test_failing_refresher_lets_subscribed_balance_expire(manager):
+    """A subscribed balance expires once refreshes have failed for too long."""
+    rpc = manager.solana_client
+    
+    async def run():
+        balance = await manager.get_balance("main")
+        assert balance["balance"]["lamports"] == rpc.lamports
+        
+        manager.start_balance_refresher()
+        try:
+            await asyncio.sleep(0.12)
+            assert rpc.calls > 1
+            assert manager._cached_balance("solana", PUBLIC_KEY) is not None
+            
+            # Take the RPC offline: the cached balance outlives one TTL, not the cap
+            rpc.online = False
+            await asyncio.sleep(manager.BALANCE_CACHE_TTL * 1.2)
+            assert manager._cached_balance("solana", PUBLIC_KEY) is not None
+            
+            await asyncio.sleep(manager.BALANCE_CACHE_TTL * manager.SUBSCRIBED_BALANCE_MAX_TTLS)
+            assert manager._cached_balance("solana", PUBLIC_KEY) is None
+            with pytest.raises(ValueError):
+                await manager.get_balance("main")
+        finally:
+            await manager.stop_balance_refresher()
+    
+    asyncio.run(run())
+
+
+def test_delete_wallet_discards_balance_state(manager):
+    """Deleting a wallet drops its cached balance and subscription."""
+    asyncio.run(manager.get_balance("main"))
+    assert ("solana", PUBLIC_KEY) in manager._subscriptions
+    assert ("solana", PUBLIC_KEY) in manager._balance_cache
+    
+    assert manager.delete_wallet("main")
+    assert ("solana", PUBLIC_KEY) not in manager._subscriptions
+    assert ("solana", PUBLIC_KEY) not in manager._balance_cache
+
+
+def test_close_releases_shared_clients(manager):
+    """close() closes the loop's shared clients and forgets them."""
+    class Closable:
+        closed = False
+        
+        async def close(self):
+            self.closed = True
+    
+    solana_client, session = Closable(), Closable()
+    
+    async def run():
+        loop = asyncio.get_running_loop()
+        wallet_manager.WalletManager._shared_clients[loop] = {
+            ("solana", "https://solana.invalid"): solana_client,
+            ("ethereum-session", "https://ethereum.invalid"): session,
+            ("ethereum", "https://ethereum.invalid"): object(),
+        }
+        await manager.close()
+        assert loop not in wallet_manager.WalletManager._shared_clients
+    
+    asyncio.run(run())
+    assert solana_client.closed and session.closed
+    assert manager.solana_client is None and manager.ethereum_client is None
+
+
+def random_address(rng):
+    """Return a random 0x-prefixed 20-byte address in mixed (checksum-like) case."""
+    digits = bytes(rng.getrandbits(8) for _ in range(20)).hex()
+    return "0x" + "".join(c.upper() if rng.getrandbits(1) else c for c in digits)
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 17, 500])
+def test_balance_aggregate_matches_eth_abi(count):
+    """The hand-rolled Multicall3 encoder and decoder agree with eth_abi."""
+    eth_abi = pytest.importorskip("eth_abi")
+    rng = random.Random(count)
+    addresses = [random_address(rng) for _ in range(count)]
+    
+    # Calldata: selector + ABI-encoded (address,bytes)[] of getEthBalance calls
+    calls = [
+        (wallet_manager.MULTICALL3_ADDRESS, wallet_manager.MULTICALL3_GET_ETH_BALANCE + eth_abi.encode(["address"], [address]))
+        for address in addresses
+    ]
+    expected = wallet_manager.MULTICALL3_AGGREGATE + eth_abi.encode(["(address,bytes)[]"], [calls])
+    assert wallet_manager._encode_balance_aggregate(addresses) == expected
+    
+    # Result: (uint256 blockNumber, bytes[] returnData) with one uint256 per call
+    balances = [rng.getrandbits(rng.choice((0, 64, 256))) for _ in range(count)]
+    raw = eth_abi.encode(
+        ["uint256", "bytes[]"],
+        [19_000_000, [eth_abi.encode(["uint256"], [balance]) for balance in balances]],
+    )
+    assert wallet_manager._decode_balance_aggregate(raw) == balances
+
+
+class FakeEthereumRPC:
+    """Ethereum client stand-in answering Multicall3 balance aggregates."""
+    
+    def __init__(self, eth_abi, balances):
+        self.eth = self
+        self.eth_abi = eth_abi
+        self.balances = balances
+        self.calls = []
+    
+    async def call(self, transaction):
+        assert transaction["to"] == wallet_manager.MULTICALL3_ADDRESS
+        data = transaction["data"]
+        assert data[:4] == wallet_manager.MULTICALL3_AGGREGATE
+        
+        (calls,) = self.eth_abi.decode(["(address,bytes)[]"], data[4:])
+        addresses = [self.eth_abi.decode(["address"], call_data[4:])[0] for _, call_data in calls]
+        self.calls.append(addresses)
+        return self.eth_abi.encode(
+            ["uint256", "bytes[]"],
+            [1, [self.eth_abi.encode(["uint256"], [self.balances[address.lower()]]) for address in addresses]],
+        )
+    
+    async def get_balance(self, address):
+        raise AssertionError("balances should come from the multicall batch")
+
+
+def test_get_balances_batches_ethereum_through_multicall(tmp_path, monkeypatch):
+    """Uncached Ethereum balances are fetched in one Multicall3 aggregate."""
+    eth_abi = pytest.importorskip("eth_abi")
+    monkeypatch.setattr(wallet_manager, "_solana", lambda: None)
+    monkeypatch.setattr(wallet_manager, "_ethereum", lambda: SimpleNamespace())
+    
+    rng = random.Random(7)
+    balances = {}
+    for i in range(3):
+        address = random_address(rng)
+        balances[address.lower()] = 10 ** 18 * i + 5
+        wallet = {"name": f"eth{i}", "chain": "ethereum", "address": address, "private_key": "secret"}
+        (tmp_path / f"eth{i}.json").write_text(json.dumps(wallet))
+    
+    manager = wallet_manager.WalletManager(wallet_dir=str(tmp_path))
+    rpc = manager.ethereum_client = FakeEthereumRPC(eth_abi, balances)
+    
+    results = asyncio.run(manager.get_balances(["eth0", "eth1", "eth2", "missing"]))
+    
+    assert len(rpc.calls) == 1 and len(rpc.calls[0]) == 3
+    assert [result["balance"]["wei"] for result in results[:3]] == [5, 10 ** 18 + 5, 2 * 10 ** 18 + 5]
+    assert results[1]["balance"]["eth_str"] == "1.000000000000000005"
+    assert results[3] == {"wallet": "missing", "error": "Wallet 'missing' not found"}
+
+
+def test_concurrent_init_creates_one_ethereum_session(tmp_path, monkeypatch):
+    """Managers initializing together on one loop share a single session."""
+    sessions = []
+    
+    class Provider:
+        def __init__(self, url):
+            self.url = url
+        
+        async def cache_async_session(self, session):
+            # Yield while the session is being attached, as web3 does
+            await asyncio.sleep(0.01)
+    
+    class Session:
+        def __init__(self, connector=None):
+            self.closed = False
+            sessions.append(self)
+        
+        async def close(self):
+            self.closed = True
+    
+    eth = SimpleNamespace(
+        AsyncHTTPProvider=Provider,
+        AsyncWeb3=lambda provider: SimpleNamespace(provider=provider),
+        aiohttp=SimpleNamespace(ClientSession=Session, TCPConnector=lambda **kwargs: None),
+    )
+    monkeypatch.setattr(wallet_manager, "_solana", lambda: None)
+    monkeypatch.setattr(wallet_manager, "_ethereum", lambda: eth)
+    managers = [wallet_manager.WalletManager(wallet_dir=str(tmp_path)) for _ in range(3)]
+    
+    async def run():
+        await asyncio.gather(*(manager.init_clients() for manager in managers))
+        assert len({id(manager.ethereum_client) for manager in managers}) == 1
+        await managers[0].close()
+    
+    asyncio.run(run())
+    assert len(sessions) == 1
+    assert sessions[0].closed